@@ -0,0 +1,63 @@
+import copy
+import random
+import timeit
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.board_encoding import BoardEncoding
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+def list_of_lists_tiles_around(board: [[Tile]], coordinate: Coordinate) -> int:
+    """
+    The 3x3 tile count the way chapel points were counted on the list of lists board
+    """
+    points = 0
+    for row in range(coordinate.row - 1, coordinate.row + 2):
+        for column in range(coordinate.column - 1, coordinate.column + 2):
+            if board[row][column] is not None:
+                points += 1
+    return points
+
+
+def play_tiles(game_state: CarcassonneGameState, tiles: int):
+    while game_state.placed_tiles < tiles and not game_state.is_terminated():
+        actions: [Action] = ActionUtil.get_possible_actions(game_state)
+        StateUpdater.apply_action_inplace(game_state=game_state, action=random.choice(actions))
+
+
+def main():
+    random.seed(0)
+    game_state = CarcassonneGameState(players=4)
+
+    for tiles in (20, 50, 80):
+        play_tiles(game_state, tiles)
+
+        encoding: BoardEncoding = game_state.board.encoding
+        top_left, bottom_right = game_state.board.bounding_box()
+        origin = Coordinate(min(0, top_left.row - 1), min(0, top_left.column - 1))
+        size = (max(35, bottom_right.row - origin.row + 2), max(35, bottom_right.column - origin.column + 2))
+        board: [[Tile]] = game_state.board.dense_view(origin=origin, size=size)
+        coordinates: [Coordinate] = [coordinate for coordinate, _ in game_state.board.items()]
+        shifted: [Coordinate] = [Coordinate(coordinate.row - origin.row, coordinate.column - origin.column)
+                                 for coordinate in coordinates]
+
+        for coordinate, shifted_coordinate in zip(coordinates, shifted):
+            assert list_of_lists_tiles_around(board, shifted_coordinate) == encoding.count_tiles_around(coordinate)
+
+        list_copy = min(timeit.repeat(lambda: copy.deepcopy(board), number=20, repeat=3)) / 20
+        encoding_copy = min(timeit.repeat(lambda: copy.deepcopy(encoding), number=20, repeat=3)) / 20
+        list_query = min(timeit.repeat(lambda: [list_of_lists_tiles_around(board, c) for c in shifted],
+                                       number=20, repeat=3)) / (20 * len(shifted))
+        encoding_query = min(timeit.repeat(lambda: [encoding.count_tiles_around(c) for c in coordinates],
+                                           number=20, repeat=3)) / (20 * len(coordinates))
+        print(f"{game_state.placed_tiles} tiles placed, {encoding.occupancy.shape} arrays: "
+              f"copy {list_copy * 1e6:.0f} us list of lists, {encoding_copy * 1e6:.1f} us arrays; "
+              f"3x3 count {list_query * 1e6:.2f} us list of lists, {encoding_query * 1e6:.2f} us arrays")
+
+
+if __name__ == "__main__":
+    main()
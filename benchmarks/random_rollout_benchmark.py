@@ -0,0 +1,57 @@
+import random
+import time
+from collections import Counter
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+def rollout_with_list(game_state: CarcassonneGameState, rng: random.Random):
+    while not game_state.is_terminated():
+        action: Action = rng.choice(ActionUtil.get_possible_actions(game_state))
+        StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+
+
+def rollout_with_sampler(game_state: CarcassonneGameState, rng: random.Random):
+    while not game_state.is_terminated():
+        action: Action = ActionUtil.sample_random_action(game_state, rng=rng)
+        StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+
+
+def sample_distribution(rng: random.Random):
+    """
+    Plays 30 tiles and then compares how often every tile action is sampled with a uniform draw
+    """
+    game_state = CarcassonneGameState(players=3)
+    while game_state.placed_tiles < 30 or not isinstance(ActionUtil.sample_random_action(game_state, rng),
+                                                         TileAction):
+        action: Action = ActionUtil.sample_random_action(game_state, rng)
+        StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+    legal = {(a.coordinate, a.tile_rotations) for a in ActionUtil.get_possible_actions(game_state)}
+    draws = 200 * len(legal)
+    counts = Counter()
+    for _ in range(draws):
+        action: TileAction = ActionUtil.sample_random_action(game_state, rng)
+        counts[(action.coordinate, action.tile_rotations)] += 1
+    assert set(counts) == legal
+    print(f"{len(legal)} legal tile actions, {draws} draws: "
+          f"least drawn {min(counts.values())}, most drawn {max(counts.values())}, expected 200")
+
+
+def main():
+    games = 10
+    for name, rollout in (("list of actions", rollout_with_list), ("sampler", rollout_with_sampler)):
+        rng = random.Random(0)
+        start = time.perf_counter()
+        for _ in range(games):
+            rollout(CarcassonneGameState(players=3), rng)
+        elapsed = time.perf_counter() - start
+        print(f"{name}: {elapsed / games * 1000:.0f} ms per random game")
+    sample_distribution(random.Random(1))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import random
+import timeit
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.playing_position import PlayingPosition
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets.tile_catalogue import tile_types
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+from wingedsheep.carcassonne.utils.tile_fitter import TileFitter
+from wingedsheep.carcassonne.utils.tile_position_finder import TilePositionFinder
+
+
+def board_scan_playing_positions(game_state: CarcassonneGameState, tile_to_play: Tile) -> [PlayingPosition]:
+    """
+    Legal placements the way they were found before the frontier and edge signatures: every empty cell of a dense
+    board of at least 35x35, every rotation, separate grass, city, road and river checks on side sets.
+    """
+    top_left, bottom_right = game_state.board.bounding_box()
+    origin = Coordinate(min(0, top_left.row - 1), min(0, top_left.column - 1))
+    size = (max(35, bottom_right.row - origin.row + 2), max(35, bottom_right.column - origin.column + 2))
+    board: [[Tile]] = game_state.board.dense_view(origin=origin, size=size)
+
+    def get_tile(row: int, column: int):
+        if row < 0 or column < 0 or row >= len(board) or column >= len(board[0]):
+            return None
+        return board[row][column]
+
+    playing_positions = []
+    for row_index, board_row in enumerate(board):
+        for column_index, column_tile in enumerate(board_row):
+            if column_tile is not None:
+                continue
+
+            for tile_turns in range(0, 4):
+                top = get_tile(row_index - 1, column_index)
+                bottom = get_tile(row_index + 1, column_index)
+                left = get_tile(row_index, column_index - 1)
+                right = get_tile(row_index, column_index + 1)
+                if top is None and right is None and bottom is None and left is None:
+                    continue
+
+                tile: Tile = tile_to_play.turn(tile_turns)
+                if TileFitter.grass_fits(tile, top, right, bottom, left) \
+                        and TileFitter.cities_fit(tile, top, right, bottom, left) \
+                        and TileFitter.roads_fit(tile, top, right, bottom, left) \
+                        and TileFitter.rivers_fit(tile, top, right, bottom, left, game_state):
+                    playing_positions.append(PlayingPosition(coordinate=Coordinate(origin.row + row_index, origin.column + column_index),
+                                                             turns=tile_turns))
+    return playing_positions
+
+
+def play_tiles(game_state: CarcassonneGameState, tiles: int):
+    while game_state.placed_tiles < tiles and not game_state.is_terminated():
+        actions: [Action] = ActionUtil.get_possible_actions(game_state)
+        StateUpdater.apply_action_inplace(game_state=game_state, action=random.choice(actions))
+
+
+def main():
+    random.seed(0)
+    game_state = CarcassonneGameState(players=4)
+    tiles_to_play = [tile for tile in tile_types if not tile.has_river()]
+
+    for tiles in (20, 50, 80):
+        play_tiles(game_state, tiles)
+
+        for tile in tiles_to_play:
+            assert len(board_scan_playing_positions(game_state, tile)) == \
+                   len(TilePositionFinder.possible_playing_positions(game_state, tile, unique_rotations=False))
+
+        board_scan = min(timeit.repeat(lambda: [board_scan_playing_positions(game_state, tile) for tile in tiles_to_play],
+                                       number=3, repeat=3)) / (3 * len(tiles_to_play))
+        frontier = min(timeit.repeat(lambda: [TilePositionFinder.possible_playing_positions(game_state, tile,
+                                                                                             unique_rotations=False)
+                                              for tile in tiles_to_play],
+                                     number=3, repeat=3)) / (3 * len(tiles_to_play))
+        print(f"{game_state.placed_tiles} tiles placed, {len(game_state.frontier)} frontier cells: "
+              f"board scan {board_scan * 1e6:.0f} us, frontier with edge signatures {frontier * 1e6:.0f} us, "
+              f"{board_scan / frontier:.0f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-import random
 from typing import Optional
 
 from wingedsheep.carcassonne.carcassonne_game import CarcassonneGame
@@ -40,10 +39,9 @@ game = CarcassonneGame(
 
 while not game.is_finished():
     player: int = game.get_current_player()
-    valid_actions: [Action] = game.get_possible_actions()
     print(player)
     print(game.state.phase) 
-    action: Optional[Action] = random.choice(valid_actions)
+    action: Optional[Action] = game.sample_random_action()
     if action is not None:
         game.step(player, action)
     game.render()
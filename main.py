@@ -16,6 +16,9 @@ WINDOW_HEIGHT = 1000
 
 PREVIEW_TILE_X = 100
 PREVIEW_TILE_Y = 100
+# The board is drawn to the right of the preview tile, with one free cell around the placed tiles for the ghosts
+BOARD_X = 250
+BOARD_Y = 0
 SNAP_THRESHOLD = 45  # --- ADDED: How close to snap (px) ---
 # --- ADDED: A semi-transparent surface for "ghost" placements ---
 
@@ -183,11 +186,18 @@ def draw_phase_indicator(game_state):
     hint_surf = font.render(hint, True, (60, 60, 60))
     window.blit(hint_surf, (10, WINDOW_HEIGHT - 60))
 
+def board_origin(game_state):
+    return game_state.board.view_origin(margin=1)
+
+def to_pixels(coordinate, origin):
+    return BOARD_X + (coordinate.column - origin.column) * TILE_SIZE, BOARD_Y + (coordinate.row - origin.row) * TILE_SIZE
+
 def draw_ghosts(game_state):
     # Decide which ghosts to draw depending on phase
     name = phase_name_for_state(game_state)
     next_tile = game_state.next_tile
-    possible_actions = game.get_possible_actions()
+    possible_actions = game.get_possible_actions(unique_rotations=False)
+    origin = board_origin(game_state)
 
     if "MEEP" in name:
         # Draw meeple placement hints (small circle) on valid tiles
@@ -195,12 +205,13 @@ def draw_ghosts(game_state):
             # Meeple actions typically have a coordinate but not tile_rotations
             if  hasattr(action , 'coordinate_with_side') and hasattr(action , 'meeple_type'):
 
+                tile_x_px, tile_y_px = to_pixels(action.coordinate_with_side.coordinate, origin)
                 if action.meeple_type == MeepleType.BIG:
-                    ghost_x_px = action.coordinate_with_side.coordinate.column * TILE_SIZE + big_meeple_position_offsets[action.coordinate_with_side.side][0]
-                    ghost_y_px = action.coordinate_with_side.coordinate.row * TILE_SIZE + big_meeple_position_offsets[action.coordinate_with_side.side][1]
+                    ghost_x_px = tile_x_px + big_meeple_position_offsets[action.coordinate_with_side.side][0]
+                    ghost_y_px = tile_y_px + big_meeple_position_offsets[action.coordinate_with_side.side][1]
                 else:
-                    ghost_x_px = action.coordinate_with_side.coordinate.column * TILE_SIZE + meeple_position_offsets[action.coordinate_with_side.side][0]
-                    ghost_y_px = action.coordinate_with_side.coordinate.row * TILE_SIZE + meeple_position_offsets[action.coordinate_with_side.side][1]
+                    ghost_x_px = tile_x_px + meeple_position_offsets[action.coordinate_with_side.side][0]
+                    ghost_y_px = tile_y_px + meeple_position_offsets[action.coordinate_with_side.side][1]
                 meep_img = get_meeple_image(game_state.current_player, action.meeple_type , is_ghost=True)
                 window.blit(meep_img, (ghost_x_px, ghost_y_px))
     else:
@@ -208,20 +219,17 @@ def draw_ghosts(game_state):
         if next_tile is None:
             return
 
-        current_rotation = next_tile.turns
-
-        for action in possible_actions:
-            if (hasattr(action,'coordinate') and hasattr(action,'tile_rotations')) and action.tile_rotations == current_rotation:
-                ghost_x_px = action.coordinate.column * TILE_SIZE
-                ghost_y_px = action.coordinate.row * TILE_SIZE
-                window.blit(ghost_surface, (ghost_x_px, ghost_y_px))
+        for action in game.get_tile_actions(preview_turns):
+            ghost_x_px, ghost_y_px = to_pixels(action.coordinate, origin)
+            window.blit(ghost_surface, (ghost_x_px, ghost_y_px))
 
 def draw_placed_meeples(game_state):
+    origin = board_origin(game_state)
     for player, placed_meeples in enumerate(game_state.placed_meeples):
         for meeple_position in placed_meeples:
             img = get_meeple_image(player, meeple_position.meeple_type)
-            x = meeple_position.coordinate_with_side.coordinate.column * TILE_SIZE + meeple_position_offsets[meeple_position.coordinate_with_side.side][0]
-            y = meeple_position.coordinate_with_side.coordinate.row * TILE_SIZE
+            x, y = to_pixels(meeple_position.coordinate_with_side.coordinate, origin)
+            x += meeple_position_offsets[meeple_position.coordinate_with_side.side][0]
             meep_img = get_meeple_image(player, meeple_position.meeple_type,is_ghost=False)
             window.blit(meep_img, (x, y))
 
@@ -234,15 +242,15 @@ def draw_board(game_state , drag_pos):
     
 
 
-    for r, row in enumerate(game_state.board):
+    for r, row in enumerate(game_state.board.dense_view(origin=board_origin(game_state))):
         for c, tile in enumerate(row):
             if tile is not None:
                 img = load_tile_image(tile)
-                window.blit(img, (c * TILE_SIZE, r * TILE_SIZE))
+                window.blit(img, (BOARD_X + c * TILE_SIZE, BOARD_Y + r * TILE_SIZE))
 
     next_tile = game_state.next_tile
     if next_tile is not None:
-        img = load_tile_image(next_tile)
+        img = load_tile_image(next_tile.turn(preview_turns))
         window.blit(img,drag_pos)
     draw_ghosts(game_state)
     draw_placed_meeples(game_state)
@@ -265,6 +273,7 @@ auto_play = False  # set to False if you want "press space to play move"
 is_dragging = False
 drag_pos = (PREVIEW_TILE_X, PREVIEW_TILE_Y)
 snap_action = None  # --- ADDED: To store the action we are snapping to ---
+preview_turns = 0  # Rotation of the preview tile, tiles themselves are immutable
 
 #play starting tiles
 
@@ -282,7 +291,7 @@ while running:
             if event.key == pygame.K_p:
                 name = phase_name_for_state(game.state)
                 if "MEEP" in name:
-                    possible = game.get_possible_actions()
+                    possible = game.get_possible_actions(unique_rotations=False)
                     for a in possible:
                         if not hasattr(a,'coordinate') and not hasattr(a,'tile_rotations'):
                             game.step(game.get_current_player(),a)
@@ -297,7 +306,8 @@ while running:
             if event.button == 1:  # Left-click
 
                 if "MEEP" in current_phase:
-                    possible = game.get_possible_actions()
+                    possible = game.get_possible_actions(unique_rotations=False)
+                    origin = board_origin(game.state)
                     clicked = False
 
                     # Try to match a click to any meeple action (supports coordinate_with_side or plain coordinate)
@@ -309,8 +319,7 @@ while running:
                         # Actions that target a specific side/position on the tile
                         if hasattr(a, 'coordinate_with_side'):
                             cws = a.coordinate_with_side
-                            col = cws.coordinate.column
-                            row = cws.coordinate.row
+                            tile_x, tile_y = to_pixels(cws.coordinate, origin)
                             side = cws.side
 
                             if getattr(a, 'meeple_type', None) == MeepleType.BIG:
@@ -320,8 +329,8 @@ while running:
                                 offs = meeple_position_offsets[side]
                                 size = meeple_size
 
-                            center_x = col * TILE_SIZE + offs[0]
-                            center_y = row * TILE_SIZE + offs[1]
+                            center_x = tile_x + offs[0]
+                            center_y = tile_y + offs[1]
                             dist = math.hypot(mouse_x - center_x, mouse_y - center_y)
 
                             if dist <= (size / 2) + 6:  # small tolerance
@@ -339,7 +348,7 @@ while running:
                 if "MEEP" not in current_phase and game.state.next_tile is not None:
                     # Allow rotation if EITHER we are currently dragging OR we right-click the preview spot
                     if is_dragging or preview_rect.collidepoint(mouse_x, mouse_y):
-                        game.state.next_tile.turns = (game.state.next_tile.turns + 1) % 4
+                        preview_turns = (preview_turns + 1) % 4
                         snap_action = None
 # ...existing code...
 
@@ -350,7 +359,8 @@ while running:
 
                 if snap_action is not None:
                     game.step(game.get_current_player() , snap_action)
-                    snap_action = None      
+                    snap_action = None
+                    preview_turns = 0      
                 else :
                     print("Invalid move")
 
@@ -362,30 +372,27 @@ while running:
     min_dist = float('inf')
 
     if game.state.next_tile is not None:
-        current_rotation = game.state.next_tile.turns
-        possible_actions = game.get_possible_actions()
         current_phase = phase_name_for_state(game.state)
         # Find the closest valid snap point
         if "MEEP" not in current_phase:
-            for action in possible_actions:
-                if (hasattr(action, 'coordinate') and hasattr(action, 'tile_rotations') and
-                    action.tile_rotations == current_rotation):
-                    
-                    # Calculate center of the target grid cell
-                    target_x_px = action.coordinate.column * TILE_SIZE + TILE_SIZE // 2
-                    target_y_px = action.coordinate.row * TILE_SIZE + TILE_SIZE // 2
-                    
-                    # Calculate distance from mouse to target center
-                    dist = math.dist((mouse_x, mouse_y), (target_x_px, target_y_px))
-
-                    if dist < min_dist and dist < SNAP_THRESHOLD:
-                        min_dist = dist
-                        closest_action = action
+            origin = board_origin(game.state)
+            for action in game.get_tile_actions(preview_turns):
+                # Calculate center of the target grid cell
+                target_x_px, target_y_px = to_pixels(action.coordinate, origin)
+                target_x_px += TILE_SIZE // 2
+                target_y_px += TILE_SIZE // 2
+                
+                # Calculate distance from mouse to target center
+                dist = math.dist((mouse_x, mouse_y), (target_x_px, target_y_px))
+
+                if dist < min_dist and dist < SNAP_THRESHOLD:
+                    min_dist = dist
+                    closest_action = action
 
     if is_dragging:
         if closest_action is not None:
             # Snap to the closest valid spot
-            drag_pos = (closest_action.coordinate.column * TILE_SIZE, closest_action.coordinate.row * TILE_SIZE)
+            drag_pos = to_pixels(closest_action.coordinate, board_origin(game.state))
             snap_action = closest_action
         else:
             # No snap target, follow the mouse (centered)
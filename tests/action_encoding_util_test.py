@@ -0,0 +1,37 @@
+import random
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.encoded_action import EncodedAction
+from wingedsheep.carcassonne.utils.action_encoding_util import ActionEncodingUtil
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+class TestActionEncodingUtil(unittest.TestCase):
+
+    def test_encode_decode(self):
+        """
+        Decoding an encoded action, also after packing it into an int, gives an equal action, and different actions
+        have different encodings
+        """
+
+        # Given
+        rng = random.Random(4)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=2)
+
+        # When / Then
+        for _ in range(60):
+            actions: [Action] = ActionUtil.get_possible_actions(game_state, unique_rotations=False)
+            encoded_actions: [EncodedAction] = [ActionEncodingUtil.encode(action) for action in actions]
+            self.assertEqual(len(actions), len(set(encoded_actions)))
+            self.assertEqual(len(actions), len({encoded_action.to_int() for encoded_action in encoded_actions}))
+
+            for action, encoded_action in zip(actions, encoded_actions):
+                self.assertEqual(encoded_action, EncodedAction.from_int(encoded_action.to_int()))
+                decoded_action: Action = ActionEncodingUtil.decode(encoded_action, game_state)
+                self.assertEqual(action, decoded_action)
+                self.assertEqual(hash(action), hash(decoded_action))
+
+            StateUpdater.apply_action_inplace(game_state=game_state, action=rng.choice(actions))
@@ -0,0 +1,32 @@
+import random
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+class TestActionUtil(unittest.TestCase):
+
+    def test_sample_random_action(self):
+        """
+        Sampled actions are legal and the action count matches the list of possible actions
+        """
+
+        # Given
+        rng = random.Random(3)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=3)
+
+        # When / Then
+        for _ in range(80):
+            actions: [Action] = ActionUtil.get_possible_actions(game_state)
+            self.assertEqual(len(actions), ActionUtil.count_possible_actions(game_state))
+
+            action: Action = ActionUtil.sample_random_action(game_state, rng=rng)
+            if isinstance(action, TileAction):
+                self.assertIn((action.coordinate, action.tile_rotations),
+                              [(a.coordinate, a.tile_rotations) for a in actions if isinstance(a, TileAction)])
+                self.assertIs(game_state.next_tile.turn(action.tile_rotations), action.tile)
+            StateUpdater.apply_action_inplace(game_state=game_state, action=action)
@@ -0,0 +1,100 @@
+import unittest
+
+from wingedsheep.carcassonne.objects.board import Board
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.tile_sets.base_deck import base_tiles
+
+
+class TestBoard(unittest.TestCase):
+
+    def test_bounding_box(self):
+        """
+        The bounding box grows with placed tiles, also for negative coordinates, and shrinks when they are removed
+        """
+
+        # Given
+        board: Board = Board()
+        board.place_tile(Coordinate(0, 0), base_tiles["crossroads"])
+        board.place_tile(Coordinate(-2, 1), base_tiles["crossroads"])
+
+        # When
+        board.place_tile(Coordinate(1, -3), base_tiles["crossroads"])
+        board.remove_tile(Coordinate(-2, 1))
+
+        # Then
+        self.assertEqual((Coordinate(0, -3), Coordinate(1, 0)), board.bounding_box())
+        self.assertIsNone(board.get_tile(-2, 1))
+
+    def test_dense_view(self):
+        """
+        The dense view has a row for every board row from the origin to the bottom of the bounding box
+        """
+
+        # Given
+        board: Board = Board()
+        crossroads = base_tiles["crossroads"]
+        board.place_tile(Coordinate(1, 2), crossroads)
+
+        # When
+        view = board.dense_view()
+
+        # Then
+        self.assertEqual(2, len(view))
+        self.assertEqual(3, len(view[0]))
+        self.assertIs(crossroads, view[1][2])
+        self.assertEqual([[None, crossroads]], board.dense_view(origin=Coordinate(1, 1), size=(1, 2)))
+
+    def test_dense_view_from_view_origin(self):
+        """
+        A dense view from the view origin holds the tiles at negative coordinates, at their offset from the origin
+        """
+
+        # Given
+        board: Board = Board()
+        crossroads = base_tiles["crossroads"]
+        chapel = base_tiles["chapel"]
+        board.place_tile(Coordinate(6, 15), crossroads)
+        board.place_tile(Coordinate(-1, 14), chapel)
+
+        # When
+        origin: Coordinate = board.view_origin(margin=1)
+        view = board.dense_view(origin=origin)
+
+        # Then
+        self.assertEqual(Coordinate(-2, 13), origin)
+        self.assertEqual(9, len(view))
+        self.assertIs(chapel, view[-1 - origin.row][14 - origin.column])
+        self.assertIs(crossroads, view[6 - origin.row][15 - origin.column])
+        self.assertEqual(2, sum(tile is not None for row in view for tile in row))
+        self.assertEqual(Coordinate(0, 0), Board().view_origin(margin=1))
+
+    def test_encoding(self):
+        """
+        The numpy encoding holds the type id, rotation and occupancy of every placed tile, also after it grows
+        """
+
+        # Given
+        board: Board = Board()
+        chapel = base_tiles["chapel"]
+        city_top = base_tiles["city_top"].turn(3)
+        board.place_tile(Coordinate(0, 0), chapel)
+        board.place_tile(Coordinate(0, 1), city_top)
+
+        # When
+        board.place_tile(Coordinate(-20, 30), city_top)
+
+        # Then
+        encoding = board.encoding
+        row, column = -encoding.origin.row, 1 - encoding.origin.column
+        self.assertEqual(city_top.type_id, encoding.type_ids[row, column])
+        self.assertEqual(3, encoding.rotations[row, column])
+        self.assertEqual(chapel.type_id, encoding.type_ids[row, column - 1])
+        self.assertEqual(3, int(encoding.occupancy.sum()))
+        self.assertEqual(2, encoding.count_tiles_around(Coordinate(0, 0)))
+        self.assertEqual(1, encoding.count_tiles_around(Coordinate(-20, 30)))
+        self.assertEqual(0, encoding.count_tiles_around(Coordinate(100, 100)))
+        self.assertEqual([2, 2, 1], list(encoding.count_tiles_around_all(
+            [Coordinate(0, 0), Coordinate(0, 1), Coordinate(-20, 30)])))
+
+        board.remove_tile(Coordinate(0, 1))
+        self.assertEqual(1, encoding.count_tiles_around(Coordinate(0, 0)))
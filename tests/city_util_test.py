@@ -25,10 +25,8 @@ class TestCityUtil(unittest.TestCase):
         city_top = base_tiles["city_top"]
         city_bottom = city_top.turn(2)
 
-        game_state.board = [[None for column in range(1)] for row in range(2)]
-
-        game_state.board[0][0] = city_bottom
-        game_state.board[1][0] = city_top
+        game_state.place_tile(Coordinate(0, 0), city_bottom)
+        game_state.place_tile(Coordinate(1, 0), city_top)
 
         # When
         city: City = CityUtil.find_city(
@@ -83,12 +81,10 @@ class TestCityUtil(unittest.TestCase):
         """
 
         # Given
-        game_state: CarcassonneGameState = self.create_donut_city_board()
-        game_state.placed_meeples = [[], [], []]
-        game_state.placed_meeples[0].append(MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(2, 1), Side.RIGHT)))
-        game_state.placed_meeples[0].append(MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.LEFT)))
-        game_state.placed_meeples[1].append(MeeplePosition(meeple_type=MeepleType.BIG, coordinate_with_side=CoordinateWithSide(Coordinate(1, 2), Side.TOP)))
-        game_state.players = 3
+        game_state: CarcassonneGameState = self.create_donut_city_board(players=3)
+        game_state.add_meeple(0, MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(2, 1), Side.RIGHT)))
+        game_state.add_meeple(0, MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.LEFT)))
+        game_state.add_meeple(1, MeeplePosition(meeple_type=MeepleType.BIG, coordinate_with_side=CoordinateWithSide(Coordinate(1, 2), Side.TOP)))
 
         # When
         city: City = CityUtil.find_city(
@@ -107,8 +103,8 @@ class TestCityUtil(unittest.TestCase):
         self.assertIn(MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(0, 1), Side.LEFT)), meeples[0])
         self.assertIn(MeeplePosition(MeepleType.BIG, CoordinateWithSide(Coordinate(1, 2), Side.TOP)), meeples[1])
 
-    def create_donut_city_board(self) -> CarcassonneGameState:
-        game_state = CarcassonneGameState()
+    def create_donut_city_board(self, players: int = 2) -> CarcassonneGameState:
+        game_state = CarcassonneGameState(players=players)
         city_narrow_left_right = base_tiles["city_narrow"]
         city_narrow_top_bottom = base_tiles["city_narrow"].turn(1)
         city_diagonal_top_right = base_tiles["city_diagonal_top_right"]
@@ -116,16 +112,14 @@ class TestCityUtil(unittest.TestCase):
         city_diagonal_bottom_left = base_tiles["city_diagonal_top_right"].turn(2)
         city_diagonal_top_left = base_tiles["city_diagonal_top_right"].turn(3)
 
-        game_state.board = [[None for column in range(3)] for row in range(3)]
-
-        game_state.board[0][0] = city_diagonal_bottom_right
-        game_state.board[0][1] = city_narrow_left_right
-        game_state.board[0][2] = city_diagonal_bottom_left
-        game_state.board[1][0] = city_narrow_top_bottom
-        game_state.board[1][2] = city_narrow_top_bottom
-        game_state.board[2][0] = city_diagonal_top_right
-        game_state.board[2][1] = city_narrow_left_right
-        game_state.board[2][2] = city_diagonal_top_left
+        game_state.place_tile(Coordinate(0, 0), city_diagonal_bottom_right)
+        game_state.place_tile(Coordinate(0, 1), city_narrow_left_right)
+        game_state.place_tile(Coordinate(0, 2), city_diagonal_bottom_left)
+        game_state.place_tile(Coordinate(1, 0), city_narrow_top_bottom)
+        game_state.place_tile(Coordinate(1, 2), city_narrow_top_bottom)
+        game_state.place_tile(Coordinate(2, 0), city_diagonal_top_right)
+        game_state.place_tile(Coordinate(2, 1), city_narrow_left_right)
+        game_state.place_tile(Coordinate(2, 2), city_diagonal_top_left)
         return game_state
 
     def test_find_cities(self):
@@ -139,10 +133,8 @@ class TestCityUtil(unittest.TestCase):
         city_one_side_straight_road = base_tiles["city_top_straight_road"].turn(3)
         city_with_road = inns_and_cathedrals_tiles["ic_15"].turn(3)
 
-        game_state.board = [[None for column in range(2)] for row in range(1)]
-
-        game_state.board[0][0] = city_with_road
-        game_state.board[0][1] = city_one_side_straight_road
+        game_state.place_tile(Coordinate(0, 0), city_with_road)
+        game_state.place_tile(Coordinate(0, 1), city_one_side_straight_road)
 
         # When
         cities: [City] = CityUtil.find_cities(
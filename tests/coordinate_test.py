@@ -0,0 +1,40 @@
+import copy
+import pickle
+import unittest
+
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.objects.side import Side
+
+
+class TestCoordinate(unittest.TestCase):
+
+    def test_interned(self):
+        """
+        Equal coordinates and coordinates with side are the same object, also after copying and pickling
+        """
+
+        # Given
+        coordinate_with_side = CoordinateWithSide(Coordinate(3, -2), Side.LEFT)
+
+        # When / Then
+        self.assertIs(coordinate_with_side, CoordinateWithSide(Coordinate(row=3, column=-2), Side.LEFT))
+        self.assertIs(coordinate_with_side, copy.deepcopy(coordinate_with_side))
+        self.assertIs(coordinate_with_side, pickle.loads(pickle.dumps(coordinate_with_side)))
+
+    def test_immutable(self):
+        """
+        Coordinates and meeple positions can not be changed
+        """
+
+        # Given
+        meeple_position = MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(0, 0), Side.TOP))
+
+        # When / Then
+        with self.assertRaises(AttributeError):
+            meeple_position.coordinate_with_side.coordinate.row = 1
+        with self.assertRaises(AttributeError):
+            meeple_position.meeple_type = MeepleType.BIG
+        self.assertEqual(meeple_position, pickle.loads(pickle.dumps(meeple_position)))
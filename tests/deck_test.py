@@ -0,0 +1,45 @@
+import copy
+import unittest
+
+from wingedsheep.carcassonne.objects.deck import Deck
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets.base_deck import base_tiles
+
+
+class TestDeck(unittest.TestCase):
+
+    def test_draw(self):
+        """
+        Drawing a tile moves the cursor and lowers the remaining count of its type, also in a copy of the deck
+        """
+
+        # Given
+        chapel: Tile = base_tiles["chapel"]
+        crossroads: Tile = base_tiles["crossroads"]
+        deck: Deck = Deck([chapel, crossroads, chapel])
+        copied_deck: Deck = copy.deepcopy(deck)
+
+        # When
+        drawn: Tile = copied_deck.draw()
+
+        # Then
+        self.assertIs(chapel, drawn)
+        self.assertEqual([crossroads, chapel], list(copied_deck))
+        self.assertEqual(1, copied_deck.remaining[chapel.type_id])
+        self.assertEqual(2, deck.remaining[chapel.type_id])
+        self.assertEqual(3, len(deck))
+
+    def test_draw_from_empty_deck(self):
+        """
+        Drawing from an empty deck gives None, undoing a draw puts the tile back
+        """
+
+        # Given
+        deck: Deck = Deck([base_tiles["chapel"]])
+        deck.draw()
+
+        # When / Then
+        self.assertIsNone(deck.draw())
+        deck.undo_draw()
+        self.assertEqual(1, len(deck))
+        self.assertEqual(1, deck.remaining.sum())
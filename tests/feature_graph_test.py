@@ -0,0 +1,81 @@
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.feature import Feature
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+from wingedsheep.carcassonne.tile_sets.base_deck import base_tiles
+
+
+class TestFeatureGraph(unittest.TestCase):
+
+    def test_placing_tiles_merges_features(self):
+        """
+        Placing a tile merges its city with the city of the neighbouring tile and closes the touching edges, the
+        finished city is recorded as completed
+        """
+
+        # Given
+        game_state: CarcassonneGameState = CarcassonneGameState()
+        game_state.place_tile(Coordinate(0, 0), base_tiles["city_top"].turn(2))
+        meeple_position = MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(0, 0), Side.BOTTOM))
+        game_state.add_meeple(0, meeple_position)
+
+        # When
+        game_state.place_tile(Coordinate(1, 0), base_tiles["city_top"])
+
+        # Then
+        city: Feature = game_state.feature_graph.get_feature(TerrainType.CITY,
+                                                             CoordinateWithSide(Coordinate(1, 0), Side.TOP))
+        self.assertTrue(city.finished)
+        self.assertEqual({Coordinate(0, 0), Coordinate(1, 0)}, city.tiles)
+        self.assertEqual((meeple_position,), city.meeples[0])
+        self.assertEqual([city], [completed.feature for completed in game_state.completed_features])
+
+    def test_rollback(self):
+        """
+        Rolling back to a checkpoint splits merged features again
+        """
+
+        # Given
+        game_state: CarcassonneGameState = CarcassonneGameState()
+        game_state.place_tile(Coordinate(0, 0), base_tiles["straight_road"].turn(1))
+        checkpoint: int = game_state.feature_graph.checkpoint()
+        game_state.place_tile(Coordinate(0, 1), base_tiles["crossroads"])
+        game_state.add_meeple(1, MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(0, 1), Side.LEFT)))
+
+        # When
+        game_state.feature_graph.rollback(checkpoint)
+
+        # Then
+        road: Feature = game_state.feature_graph.get_feature(TerrainType.ROAD,
+                                                             CoordinateWithSide(Coordinate(0, 0), Side.RIGHT))
+        self.assertEqual(2, road.open_edges)
+        self.assertEqual({Coordinate(0, 0)}, road.tiles)
+        self.assertFalse(road.has_meeples())
+        self.assertIsNone(game_state.feature_graph.get_feature(TerrainType.ROAD,
+                                                               CoordinateWithSide(Coordinate(0, 1), Side.LEFT)))
+        self.assertEqual([], game_state.feature_graph.get_tile_segments(Coordinate(0, 1)))
+
+    def test_tile_features(self):
+        """
+        The city segment of a tile resolves to the whole city it is part of
+        """
+
+        # Given
+        game_state: CarcassonneGameState = CarcassonneGameState()
+        game_state.place_tile(Coordinate(0, 0), base_tiles["city_top"].turn(1))
+        game_state.place_tile(Coordinate(0, 1), base_tiles["city_narrow"])
+        game_state.place_tile(Coordinate(0, 2), base_tiles["city_top"].turn(3))
+
+        # When
+        cities: [Feature] = game_state.feature_graph.get_tile_features(Coordinate(0, 1), TerrainType.CITY)
+
+        # Then
+        self.assertEqual(1, len(cities))
+        self.assertTrue(cities[0].finished)
+        self.assertEqual(3, len(cities[0].tiles))
@@ -20,16 +20,14 @@ class TestMeepleUtil(unittest.TestCase):
 
         # Given
         game_state: CarcassonneGameState = self.create_donut_city_board()
-        game_state.placed_meeples = [[], []]
 
         meeple_0_1 = MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(2, 1), Side.RIGHT))
         meeple_0_2 = MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.LEFT))
         meeple_1_1 = MeeplePosition(meeple_type=MeepleType.BIG, coordinate_with_side=CoordinateWithSide(Coordinate(1, 2), Side.TOP))
 
-        game_state.placed_meeples[0].append(meeple_0_1)
-        game_state.placed_meeples[0].append(meeple_0_2)
-        game_state.placed_meeples[1].append(meeple_1_1)
-        game_state.players = 2
+        game_state.add_meeple(0, meeple_0_1)
+        game_state.add_meeple(0, meeple_0_2)
+        game_state.add_meeple(1, meeple_1_1)
 
         meeples_to_remove = [[], []]
         meeples_to_remove[0].append(copy.deepcopy(meeple_0_1))
@@ -42,6 +40,9 @@ class TestMeepleUtil(unittest.TestCase):
         self.assertEqual(1, len(game_state.placed_meeples[0]))
         self.assertEqual(0, len(game_state.placed_meeples[1]))
         self.assertIn(copy.deepcopy(meeple_0_2), game_state.placed_meeples[0])
+        self.assertIsNone(MeepleUtil.position_contains_meeple(game_state, meeple_0_1.coordinate_with_side))
+        self.assertIsNone(MeepleUtil.position_contains_meeple(game_state, meeple_1_1.coordinate_with_side))
+        self.assertEqual(0, MeepleUtil.position_contains_meeple(game_state, meeple_0_2.coordinate_with_side))
 
     def create_donut_city_board(self) -> CarcassonneGameState:
         game_state = CarcassonneGameState()
@@ -52,14 +53,12 @@ class TestMeepleUtil(unittest.TestCase):
         city_diagonal_bottom_left = base_tiles["city_diagonal_top_right"].turn(2)
         city_diagonal_top_left = base_tiles["city_diagonal_top_right"].turn(3)
 
-        game_state.board = [[None for column in range(3)] for row in range(3)]
-
-        game_state.board[0][0] = city_diagonal_bottom_right
-        game_state.board[0][1] = city_narrow_left_right
-        game_state.board[0][2] = city_diagonal_bottom_left
-        game_state.board[1][0] = city_narrow_top_bottom
-        game_state.board[1][2] = city_narrow_top_bottom
-        game_state.board[2][0] = city_diagonal_top_right
-        game_state.board[2][1] = city_narrow_left_right
-        game_state.board[2][2] = city_diagonal_top_left
+        game_state.place_tile(Coordinate(0, 0), city_diagonal_bottom_right)
+        game_state.place_tile(Coordinate(0, 1), city_narrow_left_right)
+        game_state.place_tile(Coordinate(0, 2), city_diagonal_bottom_left)
+        game_state.place_tile(Coordinate(1, 0), city_narrow_top_bottom)
+        game_state.place_tile(Coordinate(1, 2), city_narrow_top_bottom)
+        game_state.place_tile(Coordinate(2, 0), city_diagonal_top_right)
+        game_state.place_tile(Coordinate(2, 1), city_narrow_left_right)
+        game_state.place_tile(Coordinate(2, 2), city_diagonal_top_left)
         return game_state
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
@@ -24,16 +26,11 @@ class TestPointsCollector(unittest.TestCase):
         city_one_side_straight_road = base_tiles["city_top_straight_road"].turn(3)
         city_with_road = inns_and_cathedrals_tiles["ic_15"].turn(3)
 
-        game_state.board = [[None for column in range(2)] for row in range(1)]
-
-        game_state.board[0][0] = city_with_road
-        game_state.board[0][1] = city_one_side_straight_road
+        game_state.place_tile(Coordinate(0, 0), city_with_road)
+        game_state.place_tile(Coordinate(0, 1), city_one_side_straight_road)
 
-        game_state.players = 2
-
-        game_state.placed_meeples = [[], []]
-        game_state.placed_meeples[0].append(MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 0), Side.RIGHT)))
-        game_state.placed_meeples[1].append(MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.BOTTOM)))
+        game_state.add_meeple(0, MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 0), Side.RIGHT)))
+        game_state.add_meeple(1, MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.BOTTOM)))
 
         # When
         PointsCollector.remove_meeples_and_collect_points(game_state=game_state, coordinate=Coordinate(0, 0))
@@ -55,16 +52,11 @@ class TestPointsCollector(unittest.TestCase):
         city_one_side_straight_road = base_tiles["city_top_straight_road"].turn(3)
         city_with_road = inns_and_cathedrals_tiles["ic_15"].turn(3)
 
-        game_state.board = [[None for column in range(2)] for row in range(1)]
-
-        game_state.board[0][0] = city_with_road
-        game_state.board[0][1] = city_one_side_straight_road
+        game_state.place_tile(Coordinate(0, 0), city_with_road)
+        game_state.place_tile(Coordinate(0, 1), city_one_side_straight_road)
 
-        game_state.players = 2
-
-        game_state.placed_meeples = [[], []]
-        game_state.placed_meeples[0].append(MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 0), Side.RIGHT)))
-        game_state.placed_meeples[1].append(MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.BOTTOM)))
+        game_state.add_meeple(0, MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 0), Side.RIGHT)))
+        game_state.add_meeple(1, MeeplePosition(meeple_type=MeepleType.NORMAL, coordinate_with_side=CoordinateWithSide(Coordinate(0, 1), Side.BOTTOM)))
 
         # When
         PointsCollector.remove_meeples_and_collect_points(game_state=game_state, coordinate=Coordinate(0, 1))
@@ -74,3 +66,58 @@ class TestPointsCollector(unittest.TestCase):
         self.assertEqual(1, len(game_state.placed_meeples[1]))
         self.assertEqual(4, game_state.scores[0])
         self.assertEqual(0, game_state.scores[1])
+
+    def test_final_scores_feature_with_several_meeples(self):
+        """
+        A road with two meeples of the same player is scored once at the end of the game
+        """
+
+        # Given
+        game_state: CarcassonneGameState = CarcassonneGameState(players=1)
+        straight_road = base_tiles["straight_road"]
+
+        for row in range(3):
+            game_state.place_tile(Coordinate(row, 0), straight_road)
+
+        meeples: int = game_state.meeples[0]
+        for meeple_position in [MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(0, 0), Side.TOP)),
+                                MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(2, 0), Side.BOTTOM)),
+                                MeeplePosition(MeepleType.FARMER, CoordinateWithSide(Coordinate(0, 0), Side.TOP_LEFT)),
+                                MeeplePosition(MeepleType.FARMER, CoordinateWithSide(Coordinate(2, 0), Side.BOTTOM_LEFT))]:
+            game_state.add_meeple(0, meeple_position)
+            game_state.meeples[0] -= 1
+
+        # When
+        PointsCollector.count_final_scores(game_state=game_state)
+
+        # Then
+        self.assertEqual([3], game_state.scores)
+        self.assertEqual([[]], game_state.placed_meeples)
+        self.assertEqual(meeples, game_state.meeples[0])
+
+    def test_final_scores_tied_players(self):
+        """
+        Players with the same number of meeples on a road all get its points
+        """
+
+        # Given
+        game_state: CarcassonneGameState = CarcassonneGameState(players=3)
+        straight_road = base_tiles["straight_road"]
+
+        for row in range(3):
+            game_state.place_tile(Coordinate(row, 0), straight_road)
+
+        game_state.add_meeple(0, MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(0, 0), Side.TOP)))
+        game_state.add_meeple(2, MeeplePosition(MeepleType.NORMAL, CoordinateWithSide(Coordinate(2, 0), Side.BOTTOM)))
+
+        # When
+        PointsCollector.count_final_scores(game_state=game_state)
+
+        # Then
+        self.assertEqual([3, 0, 3], game_state.scores)
+        self.assertEqual((0, 2), PointsCollector.get_winning_players((1, 0, 1)))
+        self.assertEqual((), PointsCollector.get_winning_players((0, 0, 0)))
+        self.assertEqual(
+            [[True, False, True], [False, True, False], [False, False, False]],
+            PointsCollector.get_winning_players_batch(np.array([[1, 0, 1], [1, 2, 0], [0, 0, 0]])).tolist()
+        )
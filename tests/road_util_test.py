@@ -21,10 +21,8 @@ class TestRoadUtil(unittest.TestCase):
 
         crossroads = base_tiles["crossroads"]
 
-        game_state.board = [[None for column in range(1)] for row in range(2)]
-
-        game_state.board[0][0] = crossroads
-        game_state.board[1][0] = crossroads
+        game_state.place_tile(Coordinate(0, 0), crossroads)
+        game_state.place_tile(Coordinate(1, 0), crossroads)
 
         # When
         road: Road = RoadUtil.find_road(
@@ -0,0 +1,43 @@
+import copy
+import random
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.undo_record import UndoRecord
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.points_collector import PointsCollector
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+class TestScoreProjectionUtil(unittest.TestCase):
+
+    def test_projected_scores(self):
+        """
+        After every action the projected scores are the scores the final scoring would give, undoing the actions
+        restores them
+        """
+
+        # Given
+        rng = random.Random(7)
+        random.seed(7)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=3)
+        history: [(UndoRecord, [int])] = []
+
+        # When / Then
+        while not game_state.is_terminated():
+            action: Action = ActionUtil.sample_random_action(game_state, rng=rng)
+            undo_record: UndoRecord = StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+
+            final_state: CarcassonneGameState = copy.deepcopy(game_state)
+            PointsCollector.count_final_scores(game_state=final_state)
+            self.assertEqual(final_state.scores, game_state.projected_scores())
+            history.append((undo_record, game_state.projected_scores()))
+
+        self.assertEqual(game_state.scores, game_state.projected_scores())
+
+        for undo_record, projected_scores in reversed(history):
+            self.assertEqual(projected_scores, game_state.projected_scores())
+            StateUpdater.undo_action(game_state=game_state, undo_record=undo_record)
+        self.assertEqual([0, 0, 0], game_state.projected_scores())
+        self.assertEqual({}, game_state.provisional_points)
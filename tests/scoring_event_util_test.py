@@ -0,0 +1,84 @@
+import io
+import json
+import random
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.pass_action import PassAction
+from wingedsheep.carcassonne.objects.events.feature_completed_event import FeatureCompletedEvent
+from wingedsheep.carcassonne.objects.events.jsonl_scoring_event_sink import JsonlScoringEventSink
+from wingedsheep.carcassonne.objects.events.list_scoring_event_sink import ListScoringEventSink
+from wingedsheep.carcassonne.objects.events.meeple_returned_event import MeepleReturnedEvent
+from wingedsheep.carcassonne.objects.events.points_awarded_event import PointsAwardedEvent
+from wingedsheep.carcassonne.objects.game_phase import GamePhase
+from wingedsheep.carcassonne.tile_sets.supplementary_rules import SupplementaryRule
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.scoring_event_util import ScoringEventUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+class TestScoringEventUtil(unittest.TestCase):
+
+    def test_events_of_a_game(self):
+        """
+        The points in the events of a game add up to the scores and every meeple on the board at the end is returned
+        """
+
+        # Given
+        rng = random.Random(5)
+        game_state: CarcassonneGameState = CarcassonneGameState(
+            players=3, supplementary_rules=[SupplementaryRule.FARMERS, SupplementaryRule.ABBOTS]
+        )
+        list_sink = ListScoringEventSink()
+        file = io.StringIO()
+        jsonl_sink = JsonlScoringEventSink(file)
+        ScoringEventUtil.subscribe(list_sink)
+        ScoringEventUtil.subscribe(jsonl_sink)
+
+        # When
+        try:
+            while not game_state.is_terminated():
+                action: Action = ActionUtil.sample_random_action(game_state, rng=rng)
+                StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+        finally:
+            ScoringEventUtil.unsubscribe(list_sink)
+            ScoringEventUtil.unsubscribe(jsonl_sink)
+
+        # Then
+        scores = [0] * game_state.players
+        for event in list_sink.events:
+            if isinstance(event, PointsAwardedEvent):
+                scores[event.player] += event.points
+        self.assertEqual(game_state.scores, scores)
+        self.assertTrue(any(isinstance(event, MeepleReturnedEvent) for event in list_sink.events))
+        self.assertEqual([], [meeples for player_meeples in game_state.placed_meeples for meeples in player_meeples])
+
+        lines = file.getvalue().splitlines()
+        self.assertEqual(len(list_sink.events), len(lines))
+        self.assertEqual([event.to_json() for event in list_sink.events], [json.loads(line) for line in lines])
+
+    def test_no_events_on_pass_turn(self):
+        """
+        Passing a turn without placing a tile does not score the features completed in the turn before again
+        """
+
+        # Given
+        rng = random.Random(2)
+        random.seed(2)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=2)
+        while game_state.phase != GamePhase.TILES or len(game_state.completed_features) == 0:
+            action: Action = ActionUtil.sample_random_action(game_state, rng=rng)
+            StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+        list_sink = ListScoringEventSink()
+        ScoringEventUtil.subscribe(list_sink)
+
+        # When
+        try:
+            StateUpdater.apply_action_inplace(game_state=game_state, action=PassAction())
+            StateUpdater.apply_action_inplace(game_state=game_state, action=PassAction())
+        finally:
+            ScoringEventUtil.unsubscribe(list_sink)
+
+        # Then
+        self.assertEqual([], [event for event in list_sink.events if isinstance(event, FeatureCompletedEvent)])
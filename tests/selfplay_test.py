@@ -0,0 +1,34 @@
+import io
+import json
+import unittest
+
+from wingedsheep.carcassonne import selfplay
+from wingedsheep.carcassonne.tile_sets.supplementary_rules import SupplementaryRule
+from wingedsheep.carcassonne.tile_sets.tile_sets import TileSet
+
+
+class TestSelfplay(unittest.TestCase):
+
+    def test_play_games(self):
+        """
+        Every seed gives one line of JSON with the result of its game, playing the same seed again gives the same game
+        """
+
+        # Given
+        output = io.StringIO()
+
+        # When
+        games: int = selfplay.play_games(seeds=[4, 9, 4], players=3, tile_sets=[TileSet.BASE],
+                                         supplementary_rules=[SupplementaryRule.FARMERS], output=output)
+
+        # Then
+        results: [dict] = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(3, games)
+        self.assertEqual([0, 1, 2], [result["game"] for result in results])
+        self.assertEqual([4, 9, 4], [result["seed"] for result in results])
+        self.assertEqual(["base"], results[0]["tile_sets"])
+        self.assertEqual(["farmers"], results[0]["supplementary_rules"])
+        self.assertEqual(3, len(results[0]["scores"]))
+        self.assertEqual(72, results[0]["tiles"])
+        self.assertEqual(results[0]["scores"], results[2]["scores"])
+        self.assertEqual(results[0]["actions"], results[2]["actions"])
@@ -0,0 +1,106 @@
+import copy
+import random
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.undo_record import UndoRecord
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+from wingedsheep.carcassonne.utils.zobrist_hash_util import ZobristHashUtil
+
+
+class TestStateUpdater(unittest.TestCase):
+
+    def test_apply_action_inplace_matches_apply_action(self):
+        """
+        Applying actions in place gives the same result as the copying API
+        """
+
+        # Given
+        random.seed(1)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=3)
+        copied_game_state: CarcassonneGameState = copy.deepcopy(game_state)
+
+        # When
+        for _ in range(40):
+            action: Action = random.choice(ActionUtil.get_possible_actions(game_state))
+            StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+            copied_game_state = StateUpdater.apply_action(game_state=copied_game_state, action=action)
+
+        # Then
+        self.assertEqual(self.snapshot(copied_game_state), self.snapshot(game_state))
+
+    def test_undo_action(self):
+        """
+        Undoing every applied action in reverse order restores each intermediate state, every apply and undo changes
+        the state version
+        """
+
+        # Given
+        random.seed(2)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=3)
+        snapshots = []
+        undo_records: [UndoRecord] = []
+
+        for _ in range(40):
+            snapshots.append(self.snapshot(game_state))
+            action: Action = random.choice(ActionUtil.get_possible_actions(game_state))
+            undo_records.append(StateUpdater.apply_action_inplace(game_state=game_state, action=action))
+
+        # When / Then
+        while len(undo_records) > 0:
+            StateUpdater.undo_action(game_state=game_state, undo_record=undo_records.pop())
+            self.assertEqual(snapshots.pop(), self.snapshot(game_state))
+        self.assertEqual(80, game_state.version)
+
+    def test_zobrist_hash(self):
+        """
+        The incrementally updated Zobrist hash equals the hash computed from scratch after every action
+        """
+
+        # Given
+        random.seed(3)
+        game_state: CarcassonneGameState = CarcassonneGameState(players=3)
+
+        for _ in range(60):
+            # When
+            action: Action = random.choice(ActionUtil.get_possible_actions(game_state))
+            StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+
+            # Then
+            zobrist_hash = StateUpdater.turn_key(game_state)
+            for coordinate, tile in game_state.board.items():
+                zobrist_hash ^= ZobristHashUtil.tile_key(coordinate, tile)
+            for player, placed_meeples in enumerate(game_state.placed_meeples):
+                for meeple_position in placed_meeples:
+                    zobrist_hash ^= ZobristHashUtil.meeple_key(player, meeple_position)
+            self.assertEqual(zobrist_hash, game_state.zobrist_hash)
+
+    @staticmethod
+    def snapshot(game_state: CarcassonneGameState):
+        return (
+            tuple(sorted((coordinate.row, coordinate.column, tile.description, tile.turns)
+                         for coordinate, tile in game_state.board.items())),
+            game_state.board.bounding_box(),
+            tuple(sorted((coordinate.row, coordinate.column, requirements)
+                         for coordinate, requirements in game_state.frontier.items())),
+            game_state.placed_tiles,
+            tuple(tile.description for tile in game_state.deck),
+            tuple(game_state.deck.remaining),
+            None if game_state.next_tile is None else game_state.next_tile.description,
+            tuple(tuple(placed_meeples) for placed_meeples in game_state.placed_meeples),
+            frozenset(game_state.occupied_positions.items()),
+            frozenset(game_state.chapel_meeples.items()),
+            tuple(game_state.scores),
+            tuple(game_state.meeples),
+            tuple(game_state.abbots),
+            tuple(game_state.big_meeples),
+            game_state.current_player,
+            game_state.phase,
+            None if game_state.last_tile_action is None else (game_state.last_tile_action.coordinate,
+                                                              game_state.last_tile_action.tile_rotations),
+            game_state.last_river_rotation,
+            game_state.zobrist_hash,
+            tuple((completed.root, completed.coordinate) for completed in game_state.completed_features)
+        )
@@ -0,0 +1,35 @@
+import unittest
+
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.tile_sets.tile_catalogue import catalogue_tiles
+from wingedsheep.carcassonne.utils.side_modification_util import SideModificationUtil
+from wingedsheep.carcassonne.utils.tile_compatibility_util import TileCompatibilityUtil
+from wingedsheep.carcassonne.utils.tile_fitter import TileFitter
+
+
+class TestTileCompatibilityUtil(unittest.TestCase):
+
+    def test_tables_match_side_checks(self):
+        """
+        The compatibility tables give the same result as checking grass, cities, roads and rivers separately
+        """
+
+        for tile in catalogue_tiles:
+            for neighbour in catalogue_tiles:
+                for side, name in ((Side.TOP, "top"), (Side.RIGHT, "right"), (Side.BOTTOM, "bottom"),
+                                   (Side.LEFT, "left")):
+                    # When
+                    compatible = TileCompatibilityUtil.fits_next_to(tile, neighbour, side)
+                    river_connected = TileCompatibilityUtil.river_connects(tile, neighbour, side)
+
+                    # Then
+                    opposite_side: Side = SideModificationUtil.opposite_side(side)
+                    self.assertEqual(side in tile.get_river_ends() and opposite_side in neighbour.get_river_ends(),
+                                     river_connected)
+                    if not tile.has_river() and not neighbour.has_river():
+                        self.assertEqual(
+                            TileFitter.grass_fits(tile, **{name: neighbour})
+                            and TileFitter.cities_fit(tile, **{name: neighbour})
+                            and TileFitter.roads_fit(tile, **{name: neighbour}),
+                            compatible
+                        )
@@ -0,0 +1,60 @@
+import unittest
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets.base_deck import base_tiles
+from wingedsheep.carcassonne.tile_sets.tile_catalogue import catalogue_tiles
+from wingedsheep.carcassonne.utils.edge_signature_util import EdgeSignatureUtil
+from wingedsheep.carcassonne.utils.tile_fitter import TileFitter
+
+
+class TestTileFitter(unittest.TestCase):
+
+    def test_edge_signatures_match_side_checks(self):
+        """
+        Matching edge signatures gives the same result as checking grass, cities, roads and rivers separately
+        """
+
+        # Given
+        game_state: CarcassonneGameState = CarcassonneGameState()
+        centers: [Tile] = [tile for tile in catalogue_tiles if not tile.has_river()]
+
+        for center in centers:
+            for neighbour in catalogue_tiles:
+                for top, right, bottom, left in ((neighbour, None, None, None), (None, neighbour, None, None),
+                                                 (None, None, neighbour, None), (None, None, None, neighbour)):
+                    # When
+                    fits = TileFitter.fits(center, top, right, bottom, left, game_state)
+
+                    # Then
+                    self.assertEqual(
+                        TileFitter.grass_fits(center, top, right, bottom, left)
+                        and TileFitter.cities_fit(center, top, right, bottom, left)
+                        and TileFitter.roads_fit(center, top, right, bottom, left),
+                        fits
+                    )
+
+    def test_no_neighbours(self):
+        """
+        A tile never fits on a cell without neighbours
+        """
+
+        # When / Then
+        self.assertFalse(TileFitter.fits(base_tiles["chapel"]))
+
+    def test_fitting_turns(self):
+        """
+        The shared table of fitting turns gives the same turns as matching the edge signature of every rotation
+        """
+
+        # Given
+        neighbour: Tile = base_tiles["city_top_straight_road"]
+        required, mask = EdgeSignatureUtil.requirements(top=neighbour, left=neighbour.turn(1))
+
+        for tile in catalogue_tiles:
+            # When
+            fitting_turns = TileFitter.fitting_turns(tile, required, mask)
+
+            # Then
+            self.assertEqual(tuple(turns for turns in range(4)
+                                   if TileFitter.fits_requirements(tile.turn(turns), required, mask)), fitting_turns)
@@ -0,0 +1,66 @@
+import copy
+import unittest
+
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets import tile_catalogue
+from wingedsheep.carcassonne.tile_sets.base_deck import base_tiles
+
+
+class TestTile(unittest.TestCase):
+
+    def test_turn_returns_shared_tile(self):
+        """
+        Turning a tile returns the same object every time
+        """
+
+        # Given
+        city_top: Tile = base_tiles["city_top"]
+
+        # When
+        city_right: Tile = city_top.turn(1)
+
+        # Then
+        self.assertIs(city_right, city_top.turn(1))
+        self.assertIs(city_top, city_right.turn(3))
+        self.assertIs(city_top.turn(2), city_right.turn(1))
+        self.assertEqual(1, city_right.turns)
+        self.assertEqual({Side.RIGHT}, city_right.get_city_sides())
+
+    def test_tile_is_immutable(self):
+        """
+        Tiles can not be changed and are never copied
+        """
+
+        # Given
+        tile: Tile = base_tiles["straight_road"]
+
+        # When / Then
+        with self.assertRaises(AttributeError):
+            tile.turns = 1
+        self.assertIs(tile, copy.copy(tile))
+        self.assertIs(tile, copy.deepcopy(tile))
+
+    def test_catalogue_ids(self):
+        """
+        Every rotation of every tile type has its own id in the catalogue
+        """
+
+        # Given
+        tile: Tile = base_tiles["city_top_straight_road"].turn(3)
+
+        # When / Then
+        self.assertIs(tile, tile_catalogue.catalogue_tiles[tile.tile_id])
+        self.assertEqual(tile.type_id * 4 + 3, tile.tile_id)
+        self.assertEqual("city_top_straight_road", tile_catalogue.tile_type_names[tile.type_id])
+        self.assertEqual(len(tile_catalogue.tile_types) * 4, len(tile_catalogue.catalogue_tiles))
+
+    def test_rotation_period(self):
+        """
+        Tiles that look the same after half a turn or a quarter turn have a shorter rotation period
+        """
+
+        # When / Then
+        self.assertEqual(1, base_tiles["chapel"].get_rotation_period())
+        self.assertEqual(2, base_tiles["straight_road"].turn(1).get_rotation_period())
+        self.assertEqual(4, base_tiles["city_top"].get_rotation_period())
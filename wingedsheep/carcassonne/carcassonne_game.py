@@ -1,8 +1,14 @@
+import random
+from typing import Optional, Dict, Set
+
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.carcassonne_visualiser import CarcassonneVisualiser
 from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.encoded_action import EncodedAction
+from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
 from wingedsheep.carcassonne.tile_sets.supplementary_rules import SupplementaryRule
 from wingedsheep.carcassonne.tile_sets.tile_sets import TileSet
+from wingedsheep.carcassonne.utils.action_encoding_util import ActionEncodingUtil
 from wingedsheep.carcassonne.utils.action_util import ActionUtil
 from wingedsheep.carcassonne.utils.state_updater import StateUpdater
 
@@ -23,6 +29,13 @@ class CarcassonneGame:
         )
         self.visualiser = CarcassonneVisualiser()
 
+        # Legal actions of the current state, valid while the state and its version do not change
+        self.__actions_state: Optional[CarcassonneGameState] = None
+        self.__actions_version: int = -1
+        self.__possible_actions: Dict[bool, [Action]] = {}
+        self.__legal_actions: Optional[Set[EncodedAction]] = None
+        self.__tile_actions_by_rotation: Optional[Dict[int, [TileAction]]] = None
+
     def reset(self):
         self.state = CarcassonneGameState(tile_sets=self.tile_sets, supplementary_rules=self.supplementary_rules)
 
@@ -38,8 +51,56 @@ class CarcassonneGame:
     def get_current_player(self) -> int:
         return self.state.current_player
 
-    def get_possible_actions(self) -> [Action]:
-        return ActionUtil.get_possible_actions(self.state)
-    
-    def is_valid_actions(self, action : Action) -> bool:
-        pass
+    def get_projected_scores(self) -> [int]:
+        return self.state.projected_scores()
+
+    def get_possible_actions(self, unique_rotations: bool = True) -> [Action]:
+        """
+        The possible actions for the current player. The list is cached until the state changes and should not be
+        modified.
+        """
+        self.__check_actions_cache()
+        if unique_rotations not in self.__possible_actions:
+            self.__possible_actions[unique_rotations] = ActionUtil.get_possible_actions(
+                self.state, unique_rotations=unique_rotations)
+        return self.__possible_actions[unique_rotations]
+
+    def get_tile_actions(self, turns: int) -> [TileAction]:
+        """
+        The possible tile actions that place the next tile with the given number of turns
+        """
+        self.__check_actions_cache()
+        if self.__tile_actions_by_rotation is None:
+            self.__tile_actions_by_rotation = {tile_turns: [] for tile_turns in range(4)}
+            for action in self.get_possible_actions(unique_rotations=False):
+                if isinstance(action, TileAction):
+                    self.__tile_actions_by_rotation[action.tile_rotations].append(action)
+        return self.__tile_actions_by_rotation[turns % 4]
+
+    def count_possible_actions(self, unique_rotations: bool = True) -> int:
+        return ActionUtil.count_possible_actions(self.state, unique_rotations=unique_rotations)
+
+    def sample_random_action(self, rng: Optional[random.Random] = None, unique_rotations: bool = True) -> Action:
+        return ActionUtil.sample_random_action(self.state, rng=rng, unique_rotations=unique_rotations)
+
+    def is_valid_actions(self, action: Action) -> bool:
+        """
+        Whether the action is one of the possible actions for the current player. Every rotation of a symmetric tile is
+        accepted.
+        """
+        if isinstance(action, TileAction) \
+                and (self.state.next_tile is None or action.tile is not self.state.next_tile.turn(action.tile_rotations)):
+            return False
+        self.__check_actions_cache()
+        if self.__legal_actions is None:
+            self.__legal_actions = set(map(ActionEncodingUtil.encode, self.get_possible_actions(unique_rotations=False)))
+        return ActionEncodingUtil.encode(action) in self.__legal_actions
+
+    def __check_actions_cache(self):
+        if self.__actions_state is self.state and self.__actions_version == self.state.version:
+            return
+        self.__actions_state = self.state
+        self.__actions_version = self.state.version
+        self.__possible_actions = {}
+        self.__legal_actions = None
+        self.__tile_actions_by_rotation = None
@@ -1,17 +1,30 @@
 import random
-from typing import Optional
+from typing import Optional, Dict
 
 from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.objects.board import Board
+from wingedsheep.carcassonne.objects.completed_feature import CompletedFeature
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.deck import Deck
+from wingedsheep.carcassonne.objects.feature_graph import FeatureGraph
 from wingedsheep.carcassonne.objects.game_phase import GamePhase
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.meeple_type import MeepleType
 from wingedsheep.carcassonne.objects.rotation import Rotation
+from wingedsheep.carcassonne.objects.side import Side
 from wingedsheep.carcassonne.objects.tile import Tile
 from wingedsheep.carcassonne.tile_sets.base_deck import base_tile_counts, base_tiles
 from wingedsheep.carcassonne.tile_sets.inns_and_cathedrals_deck import inns_and_cathedrals_tiles, \
     inns_and_cathedrals_tile_counts
 from wingedsheep.carcassonne.tile_sets.supplementary_rules import SupplementaryRule
 from wingedsheep.carcassonne.tile_sets.the_river_deck import the_river_tiles, the_river_tile_counts
+# Importing the catalogue assigns the tile ids of every tile set
+from wingedsheep.carcassonne.tile_sets import tile_catalogue
 from wingedsheep.carcassonne.tile_sets.tile_sets import TileSet
+from wingedsheep.carcassonne.utils.edge_signature_util import EdgeSignatureUtil
+from wingedsheep.carcassonne.utils.side_modification_util import SideModificationUtil
+from wingedsheep.carcassonne.utils.zobrist_hash_util import ZobristHashUtil
 
 
 class CarcassonneGameState:
@@ -21,44 +34,144 @@ class CarcassonneGameState:
             tile_sets: [TileSet] = (TileSet.BASE, TileSet.THE_RIVER, TileSet.INNS_AND_CATHEDRALS),
             supplementary_rules: [SupplementaryRule] = (SupplementaryRule.FARMERS, SupplementaryRule.ABBOTS),
             players: int = 2,
-            board_size: (int, int) = (35, 35),
             starting_position: Coordinate = Coordinate(6, 15)
     ):
         self.deck = self.initialize_deck(tile_sets=tile_sets)
         self.supplementary_rules: [SupplementaryRule] = supplementary_rules
-        self.board: [[Tile]] = [[None for column in range(board_size[1])] for row in range(board_size[0])]
+        self.board: Board = Board()
         self.starting_position: Coordinate = starting_position
-        self.next_tile = self.deck.pop(0)
+        self.placed_tiles: int = 0
+        # Empty cells next to at least one placed tile, with the edge signature and mask a tile there has to match
+        self.frontier: Dict[Coordinate, (int, int)] = {}
+        self.next_tile = self.deck.draw()
         self.players = players
         self.meeples = [7 for _ in range(players)]
         self.abbots = [1 if SupplementaryRule.ABBOTS in supplementary_rules else 0 for _ in range(players)]
         self.big_meeples = [1 if TileSet.INNS_AND_CATHEDRALS in tile_sets else 0 for _ in range(players)]
         self.placed_meeples = [[] for _ in range(players)]
+        self.occupied_positions: Dict[CoordinateWithSide, (int, MeepleType)] = {}
+        # The chapels and flowers with a meeple or abbot on them, with the player and meeple type
+        self.chapel_meeples: Dict[Coordinate, (int, MeepleType)] = {}
+        self.feature_graph: FeatureGraph = FeatureGraph(players=players)
+        # The cities and roads completed by the last placed tile, they are scored at the end of the turn
+        self.completed_features: [CompletedFeature] = []
         self.scores: [int] = [0 for _ in range(players)]
+        # The points every player would get for its meeples if the game ended now, and the (players, points) of every
+        # feature root or chapel coordinate they come from. Kept up to date by StateUpdater, see ScoreProjectionUtil.
+        self.projected_points: [int] = [0 for _ in range(players)]
+        self.provisional_points: Dict[object, ((int,), int)] = {}
         self.current_player = 0
         self.phase = GamePhase.TILES
         self.last_tile_action: Optional[TileAction] = None
         self.last_river_rotation: Rotation = Rotation.NONE
-
-    def get_tile(self, row: int, column: int):
-        if row < 0 or column < 0:
-            return None
-        elif row >= len(self.board) or column >= len(self.board[0]):
-            return None
-        else:
-            return self.board[row][column]
+        # Increased by StateUpdater on every applied or undone action, so results computed for a state can be cached
+        self.version: int = 0
+        # Zobrist hash of the tiles, meeples and turn. Tiles and meeples are XOR-ed in and out by the methods below, the
+        # turn key is replaced by StateUpdater after every action.
+        self.zobrist_hash: int = ZobristHashUtil.turn_key(current_player=self.current_player, phase=self.phase,
+                                                          next_tile=self.next_tile,
+                                                          last_river_rotation=self.last_river_rotation)
+
+    def get_tile(self, row: int, column: int) -> Optional[Tile]:
+        return self.board.get_tile(row, column)
+
+    def projected_scores(self) -> [int]:
+        """
+        The scores of the players if the game ended now
+        """
+        return [score + points for score, points in zip(self.scores, self.projected_points)]
 
     def empty_board(self):
-        for row in self.board:
-            for column in row:
-                if column is not None:
-                    return False
-        return True
+        return self.placed_tiles == 0
+
+    def place_tile(self, coordinate: Coordinate, tile: Tile):
+        self.board.place_tile(coordinate, tile)
+        self.placed_tiles += 1
+        self.zobrist_hash ^= ZobristHashUtil.tile_key(coordinate, tile)
+        self.completed_features = self.feature_graph.add_tile(coordinate=coordinate, tile=tile)
+        self.frontier.pop(coordinate, None)
+        for side, neighbour in self.neighbours(coordinate):
+            if neighbour not in self.board:
+                required, mask = self.frontier.get(neighbour, (0, 0))
+                side_required, side_mask = EdgeSignatureUtil.requirement(tile.edge_signature,
+                                                                         SideModificationUtil.opposite_side(side))
+                self.frontier[neighbour] = (required | side_required, mask | side_mask)
+
+    def remove_tile(self, coordinate: Coordinate):
+        """
+        Remove the last placed tile. The feature graph is not changed, roll it back to a checkpoint from before the tile
+        was placed.
+        """
+        self.zobrist_hash ^= ZobristHashUtil.tile_key(coordinate, self.board.get(coordinate))
+        self.board.remove_tile(coordinate)
+        self.placed_tiles -= 1
+        required = 0
+        mask = 0
+        for side, neighbour in self.neighbours(coordinate):
+            neighbour_tile: Optional[Tile] = self.board.get(neighbour)
+            if neighbour_tile is None:
+                neighbour_required, neighbour_mask = self.frontier[neighbour]
+                keep_mask = ~EdgeSignatureUtil.mask(SideModificationUtil.opposite_side(side))
+                if neighbour_mask & keep_mask == 0:
+                    del self.frontier[neighbour]
+                else:
+                    self.frontier[neighbour] = (neighbour_required & keep_mask, neighbour_mask & keep_mask)
+            else:
+                side_required, side_mask = EdgeSignatureUtil.requirement(neighbour_tile.edge_signature, side)
+                required |= side_required
+                mask |= side_mask
+        if mask != 0:
+            self.frontier[coordinate] = (required, mask)
+
+    def add_meeple(self, player: int, meeple_position: MeeplePosition):
+        self.placed_meeples[player].append(meeple_position)
+        self.zobrist_hash ^= ZobristHashUtil.meeple_key(player, meeple_position)
+        self.occupied_positions[meeple_position.coordinate_with_side] = (player, meeple_position.meeple_type)
+        if meeple_position.coordinate_with_side.side == Side.CENTER:
+            self.chapel_meeples[meeple_position.coordinate_with_side.coordinate] = (player, meeple_position.meeple_type)
+        self.feature_graph.add_meeple(player=player, meeple_position=meeple_position)
+
+    def remove_meeple(self, player: int, meeple_position: MeeplePosition):
+        self.placed_meeples[player].remove(meeple_position)
+        self.zobrist_hash ^= ZobristHashUtil.meeple_key(player, meeple_position)
+        del self.occupied_positions[meeple_position.coordinate_with_side]
+        if meeple_position.coordinate_with_side.side == Side.CENTER:
+            del self.chapel_meeples[meeple_position.coordinate_with_side.coordinate]
+        self.feature_graph.remove_meeple(player=player, meeple_position=meeple_position)
+
+    def set_placed_meeples(self, placed_meeples: [[MeeplePosition]]):
+        for player, meeple_positions in enumerate(self.placed_meeples):
+            for meeple_position in meeple_positions:
+                self.zobrist_hash ^= ZobristHashUtil.meeple_key(player, meeple_position)
+        for player, meeple_positions in enumerate(placed_meeples):
+            for meeple_position in meeple_positions:
+                self.zobrist_hash ^= ZobristHashUtil.meeple_key(player, meeple_position)
+        self.placed_meeples = placed_meeples
+        self.occupied_positions = {
+            meeple_position.coordinate_with_side: (player, meeple_position.meeple_type)
+            for player, meeple_positions in enumerate(placed_meeples)
+            for meeple_position in meeple_positions
+        }
+        self.chapel_meeples = {
+            meeple_position.coordinate_with_side.coordinate: (player, meeple_position.meeple_type)
+            for player, meeple_positions in enumerate(placed_meeples)
+            for meeple_position in meeple_positions
+            if meeple_position.coordinate_with_side.side == Side.CENTER
+        }
+
+    @staticmethod
+    def neighbours(coordinate: Coordinate) -> [(Side, Coordinate)]:
+        return [
+            (Side.TOP, Coordinate(coordinate.row - 1, coordinate.column)),
+            (Side.RIGHT, Coordinate(coordinate.row, coordinate.column + 1)),
+            (Side.BOTTOM, Coordinate(coordinate.row + 1, coordinate.column)),
+            (Side.LEFT, Coordinate(coordinate.row, coordinate.column - 1))
+        ]
 
     def is_terminated(self) -> bool:
         return self.next_tile is None
 
-    def initialize_deck(self, tile_sets: [TileSet]):
+    def initialize_deck(self, tile_sets: [TileSet]) -> Deck:
         deck: [Tile] = []
 
         # The river
@@ -97,4 +210,4 @@ class CarcassonneGameState:
         for tile in new_tiles:
             deck.append(tile)
 
-        return deck
+        return Deck(deck)
@@ -4,6 +4,7 @@ from PIL import ImageTk, Image
 
 import wingedsheep
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
 from wingedsheep.carcassonne.objects.meeple_type import MeepleType
 from wingedsheep.carcassonne.objects.side import Side
@@ -54,7 +55,8 @@ class CarcassonneVisualiser:
 
     def draw_game_state(self, game_state: CarcassonneGameState):
         self.canvas.delete('all')
-        for row_index, row in enumerate(game_state.board):
+        origin: Coordinate = game_state.board.view_origin()
+        for row_index, row in enumerate(game_state.board.dense_view(origin=origin)):
             for column_index, tile in enumerate(row):
                 tile: Tile
                 if tile is not None:
@@ -63,19 +65,21 @@ class CarcassonneVisualiser:
         for player, placed_meeples in enumerate(game_state.placed_meeples):
             meeple_position: MeeplePosition
             for meeple_position in placed_meeples:
-                self.__draw_meeple(player, meeple_position)
+                self.__draw_meeple(player, meeple_position, origin)
 
         self.canvas.update()
 
-    def __draw_meeple(self, player_index: int, meeple_position: MeeplePosition):
+    def __draw_meeple(self, player_index: int, meeple_position: MeeplePosition, origin: Coordinate):
         image = self.__get_meeple_image(player=player_index, meeple_type=meeple_position.meeple_type)
+        column = meeple_position.coordinate_with_side.coordinate.column - origin.column
+        row = meeple_position.coordinate_with_side.coordinate.row - origin.row
 
         if meeple_position.meeple_type == MeepleType.BIG:
-            x = meeple_position.coordinate_with_side.coordinate.column * self.tile_size + self.big_meeple_position_offsets[meeple_position.coordinate_with_side.side][0]
-            y = meeple_position.coordinate_with_side.coordinate.row * self.tile_size + self.big_meeple_position_offsets[meeple_position.coordinate_with_side.side][1]
+            x = column * self.tile_size + self.big_meeple_position_offsets[meeple_position.coordinate_with_side.side][0]
+            y = row * self.tile_size + self.big_meeple_position_offsets[meeple_position.coordinate_with_side.side][1]
         else:
-            x = meeple_position.coordinate_with_side.coordinate.column * self.tile_size + self.meeple_position_offsets[meeple_position.coordinate_with_side.side][0]
-            y = meeple_position.coordinate_with_side.coordinate.row * self.tile_size + self.meeple_position_offsets[meeple_position.coordinate_with_side.side][1]
+            x = column * self.tile_size + self.meeple_position_offsets[meeple_position.coordinate_with_side.side][0]
+            y = row * self.tile_size + self.meeple_position_offsets[meeple_position.coordinate_with_side.side][1]
 
         self.canvas.create_image(
             x,
@@ -0,0 +1,47 @@
+from typing import NamedTuple
+
+
+class EncodedAction(NamedTuple):
+    """
+    A small, hashable form of an action. Equal actions give equal encoded actions, so they can be looked up in sets and
+    used as dictionary keys. to_int packs an encoded action into a single int.
+
+    kind is PASS, TILE or MEEPLE. side and meeple_type are indexes into Side and MeepleType. Fields that do not apply to
+    the kind of action are 0.
+    """
+
+    kind: int
+    row: int = 0
+    column: int = 0
+    rotation: int = 0
+    side: int = 0
+    meeple_type: int = 0
+    remove: bool = False
+
+    PASS = 0
+    TILE = 1
+    MEEPLE = 2
+
+    # Rows and columns are stored as 16 bit numbers with this offset, so they can be negative
+    COORDINATE_OFFSET = 1 << 15
+
+    def to_int(self) -> int:
+        return self.kind \
+               | self.rotation << 2 \
+               | self.side << 4 \
+               | self.meeple_type << 8 \
+               | int(self.remove) << 11 \
+               | (self.column + EncodedAction.COORDINATE_OFFSET) << 12 \
+               | (self.row + EncodedAction.COORDINATE_OFFSET) << 28
+
+    @classmethod
+    def from_int(cls, value: int) -> 'EncodedAction':
+        return cls(
+            kind=value & 0b11,
+            row=(value >> 28 & 0xFFFF) - cls.COORDINATE_OFFSET,
+            column=(value >> 12 & 0xFFFF) - cls.COORDINATE_OFFSET,
+            rotation=value >> 2 & 0b11,
+            side=value >> 4 & 0b1111,
+            meeple_type=value >> 8 & 0b111,
+            remove=bool(value >> 11 & 1)
+        )
@@ -8,3 +8,12 @@ class MeepleAction(Action):
         self.meeple_type = meeple_type
         self.coordinate_with_side = coordinate_with_side
         self.remove = remove
+
+    def __eq__(self, other):
+        return isinstance(other, MeepleAction) \
+               and self.meeple_type == other.meeple_type \
+               and self.coordinate_with_side == other.coordinate_with_side \
+               and self.remove == other.remove
+
+    def __hash__(self):
+        return hash((self.meeple_type, self.coordinate_with_side, self.remove))
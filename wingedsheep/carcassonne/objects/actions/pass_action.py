@@ -2,4 +2,9 @@ from wingedsheep.carcassonne.objects.actions.action import Action
 
 
 class PassAction(Action):
-    pass
+
+    def __eq__(self, other):
+        return isinstance(other, PassAction)
+
+    def __hash__(self):
+        return hash(PassAction)
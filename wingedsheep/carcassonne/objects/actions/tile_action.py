@@ -8,3 +8,12 @@ class TileAction(Action):
         self.tile = tile
         self.coordinate = coordinate
         self.tile_rotations = tile_rotations
+
+    def __eq__(self, other):
+        return isinstance(other, TileAction) \
+               and self.coordinate == other.coordinate \
+               and self.tile_rotations == other.tile_rotations \
+               and self.tile is other.tile
+
+    def __hash__(self):
+        return hash((self.coordinate, self.tile_rotations))
@@ -0,0 +1,106 @@
+import copy
+from typing import Dict, Optional, ItemsView
+
+from wingedsheep.carcassonne.objects.board_encoding import BoardEncoding
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.tile import Tile
+
+
+class Board:
+    """
+    The placed tiles by coordinate. The board has no edges, coordinates can also be negative. The bounding box of the
+    placed tiles and a numpy encoding of the board are kept up to date.
+    """
+
+    def __init__(self):
+        self.tiles: Dict[Coordinate, Tile] = {}
+        self.encoding: BoardEncoding = BoardEncoding()
+        self.min_row: Optional[int] = None
+        self.max_row: Optional[int] = None
+        self.min_column: Optional[int] = None
+        self.max_column: Optional[int] = None
+
+    def __deepcopy__(self, memo):
+        # Tiles are immutable and coordinates are never changed, so only the dictionary has to be copied
+        board = Board()
+        board.tiles = dict(self.tiles)
+        board.encoding = copy.deepcopy(self.encoding, memo)
+        board.min_row, board.max_row = self.min_row, self.max_row
+        board.min_column, board.max_column = self.min_column, self.max_column
+        return board
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def __contains__(self, coordinate: Coordinate) -> bool:
+        return coordinate in self.tiles
+
+    def items(self) -> ItemsView[Coordinate, Tile]:
+        return self.tiles.items()
+
+    def get(self, coordinate: Coordinate) -> Optional[Tile]:
+        return self.tiles.get(coordinate)
+
+    def get_tile(self, row: int, column: int) -> Optional[Tile]:
+        return self.tiles.get(Coordinate(row, column))
+
+    def place_tile(self, coordinate: Coordinate, tile: Tile):
+        self.tiles[coordinate] = tile
+        self.encoding.place_tile(coordinate, tile)
+        if self.min_row is None:
+            self.min_row = self.max_row = coordinate.row
+            self.min_column = self.max_column = coordinate.column
+        else:
+            self.min_row = min(self.min_row, coordinate.row)
+            self.max_row = max(self.max_row, coordinate.row)
+            self.min_column = min(self.min_column, coordinate.column)
+            self.max_column = max(self.max_column, coordinate.column)
+
+    def remove_tile(self, coordinate: Coordinate):
+        del self.tiles[coordinate]
+        self.encoding.remove_tile(coordinate)
+        if coordinate.row in (self.min_row, self.max_row) or coordinate.column in (self.min_column, self.max_column):
+            self.__update_bounding_box()
+
+    def bounding_box(self) -> (Coordinate, Coordinate):
+        """
+        The top left and bottom right coordinates of the placed tiles, or None when the board is empty
+        """
+        if self.min_row is None:
+            return None
+        return Coordinate(self.min_row, self.min_column), Coordinate(self.max_row, self.max_column)
+
+    def view_origin(self, margin: int = 0) -> Coordinate:
+        """
+        The origin for a dense view that shows every placed tile, the top left of the bounding box moved up and left by
+        margin. Renderers subtract it from a coordinate to get the row and column index of the tile in the view.
+        """
+        if self.min_row is None:
+            return Coordinate(0, 0)
+        return Coordinate(self.min_row - margin, self.min_column - margin)
+
+    def dense_view(self, origin: Coordinate = Coordinate(0, 0), size: (int, int) = None) -> [[Optional[Tile]]]:
+        """
+        The board as rows of tiles, starting at origin. Without a size the view reaches to the bottom right of the
+        bounding box. Renderers that draw a tile at (row index, column index) pass view_origin() as the origin, so tiles
+        at negative coordinates are in the view as well.
+        """
+        if size is None:
+            if self.min_row is None:
+                return []
+            size = (max(0, self.max_row - origin.row + 1), max(0, self.max_column - origin.column + 1))
+
+        return [
+            [self.tiles.get(Coordinate(origin.row + row, origin.column + column)) for column in range(size[1])]
+            for row in range(size[0])
+        ]
+
+    def __update_bounding_box(self):
+        if len(self.tiles) == 0:
+            self.min_row = self.max_row = self.min_column = self.max_column = None
+            return
+
+        rows = [coordinate.row for coordinate in self.tiles]
+        columns = [coordinate.column for coordinate in self.tiles]
+        self.min_row, self.max_row = min(rows), max(rows)
+        self.min_column, self.max_column = min(columns), max(columns)
@@ -0,0 +1,101 @@
+import numpy as np
+
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.tile import Tile
+# Importing the catalogue assigns the tile ids of every tile set
+from wingedsheep.carcassonne.tile_sets import tile_catalogue
+
+
+class BoardEncoding:
+    """
+    The board as numpy arrays: tile type ids (-1 for an empty cell), rotations, an occupancy mask and the number of
+    tiles in the 3x3 square around every cell. Array index (0, 0) is at board coordinate origin, so a coordinate is at
+    index coordinate - origin. The arrays grow in any direction, also towards negative coordinates, when a tile is
+    placed outside of them, and always keep an empty border around the placed tiles, so the 3x3 neighbourhood of a tile
+    is a slice.
+    """
+
+    EMPTY = -1
+    GROWTH = 8
+
+    def __init__(self):
+        self.origin: Coordinate = Coordinate(0, 0)
+        self.type_ids: np.ndarray = np.full((0, 0), self.EMPTY, dtype=np.int16)
+        self.rotations: np.ndarray = np.zeros((0, 0), dtype=np.int8)
+        self.occupancy: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
+        self.tiles_around: np.ndarray = np.zeros((0, 0), dtype=np.uint8)
+
+    def __deepcopy__(self, memo):
+        encoding = BoardEncoding()
+        encoding.origin = self.origin
+        encoding.type_ids = self.type_ids.copy()
+        encoding.rotations = self.rotations.copy()
+        encoding.occupancy = self.occupancy.copy()
+        encoding.tiles_around = self.tiles_around.copy()
+        return encoding
+
+    def place_tile(self, coordinate: Coordinate, tile: Tile):
+        self.__ensure_border(coordinate)
+        row, column = coordinate.row - self.origin.row, coordinate.column - self.origin.column
+        self.type_ids[row, column] = tile.type_id
+        self.rotations[row, column] = tile.turns
+        self.occupancy[row, column] = 1
+        self.tiles_around[row - 1:row + 2, column - 1:column + 2] += 1
+
+    def remove_tile(self, coordinate: Coordinate):
+        row, column = coordinate.row - self.origin.row, coordinate.column - self.origin.column
+        self.type_ids[row, column] = self.EMPTY
+        self.rotations[row, column] = 0
+        self.occupancy[row, column] = 0
+        self.tiles_around[row - 1:row + 2, column - 1:column + 2] -= 1
+
+    def count_tiles_around(self, coordinate: Coordinate) -> int:
+        """
+        The number of tiles in the 3x3 square around the coordinate, including the coordinate itself
+        """
+        row, column = coordinate.row - self.origin.row, coordinate.column - self.origin.column
+        rows, columns = self.tiles_around.shape
+        if 0 <= row < rows and 0 <= column < columns:
+            return int(self.tiles_around[row, column])
+        return 0
+
+    def count_tiles_around_all(self, coordinates: [Coordinate]) -> np.ndarray:
+        """
+        count_tiles_around for every coordinate at once. The coordinates have to lie on the arrays, which is the case
+        for every placed tile.
+        """
+        rows = np.fromiter((coordinate.row for coordinate in coordinates), dtype=np.int64, count=len(coordinates))
+        columns = np.fromiter((coordinate.column for coordinate in coordinates), dtype=np.int64, count=len(coordinates))
+        return self.tiles_around[rows - self.origin.row, columns - self.origin.column]
+
+    def __ensure_border(self, coordinate: Coordinate):
+        rows, columns = self.occupancy.shape
+        row, column = coordinate.row - self.origin.row, coordinate.column - self.origin.column
+        if 0 < row < rows - 1 and 0 < column < columns - 1:
+            return
+
+        if rows == 0:
+            top, left = coordinate.row - self.GROWTH, coordinate.column - self.GROWTH
+            bottom, right = coordinate.row + self.GROWTH, coordinate.column + self.GROWTH
+        else:
+            top = min(self.origin.row, coordinate.row - self.GROWTH)
+            left = min(self.origin.column, coordinate.column - self.GROWTH)
+            bottom = max(self.origin.row + rows - 1, coordinate.row + self.GROWTH)
+            right = max(self.origin.column + columns - 1, coordinate.column + self.GROWTH)
+
+        type_ids = np.full((bottom - top + 1, right - left + 1), self.EMPTY, dtype=np.int16)
+        rotations = np.zeros(type_ids.shape, dtype=np.int8)
+        occupancy = np.zeros(type_ids.shape, dtype=np.uint8)
+        tiles_around = np.zeros(type_ids.shape, dtype=np.uint8)
+
+        row_offset, column_offset = self.origin.row - top, self.origin.column - left
+        type_ids[row_offset:row_offset + rows, column_offset:column_offset + columns] = self.type_ids
+        rotations[row_offset:row_offset + rows, column_offset:column_offset + columns] = self.rotations
+        occupancy[row_offset:row_offset + rows, column_offset:column_offset + columns] = self.occupancy
+        tiles_around[row_offset:row_offset + rows, column_offset:column_offset + columns] = self.tiles_around
+
+        self.origin = Coordinate(top, left)
+        self.type_ids = type_ids
+        self.rotations = rotations
+        self.occupancy = occupancy
+        self.tiles_around = tiles_around
@@ -0,0 +1,15 @@
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.feature import Feature
+
+
+class CompletedFeature:
+    """
+    A city or road whose last open edge was closed by the tile placed at coordinate. root is the node of the feature in
+    the feature graph, feature is the feature as it was when it was completed (its tiles, shields, inn and cathedral
+    and the meeples on it at that moment).
+    """
+
+    def __init__(self, root: int, coordinate: Coordinate, feature: Feature):
+        self.root = root
+        self.coordinate = coordinate
+        self.feature = feature
@@ -4,9 +4,24 @@ from wingedsheep.carcassonne.objects.side import Side
 
 
 class Connection:
+    __slots__ = ("a", "b", "_hash")
+
     def __init__(self, a: Side, b: Side):
-        self.a = a
-        self.b = b
+        object.__setattr__(self, "a", a)
+        object.__setattr__(self, "b", b)
+        object.__setattr__(self, "_hash", hash((a, b)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Connection is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return Connection, (self.a, self.b)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def to_json(self):
         return {
@@ -18,7 +33,7 @@ class Connection:
         return json.dumps(self.to_json(), indent=2)
 
     def __eq__(self, other):
-        return self.a == other.a and self.b == other.b
+        return self is other or (self.a == other.a and self.b == other.b)
 
     def __hash__(self):
-        return hash((self.a, self.b))
+        return self._hash
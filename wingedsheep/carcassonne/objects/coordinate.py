@@ -1,11 +1,43 @@
+from typing import Dict
+
+
 class Coordinate:
+    """
+    Immutable board coordinate. Coordinates are interned in a bounded cache, so equal coordinates are usually the same
+    object.
+    """
+
+    __slots__ = ("row", "column", "_hash")
+
+    CACHE_SIZE = 1 << 16
+    _cache: Dict[tuple, 'Coordinate'] = {}
+
+    def __new__(cls, row: int, column: int):
+        key = (row, column)
+        coordinate = cls._cache.get(key)
+        if coordinate is None:
+            coordinate = super().__new__(cls)
+            object.__setattr__(coordinate, "row", row)
+            object.__setattr__(coordinate, "column", column)
+            object.__setattr__(coordinate, "_hash", hash(key))
+            if len(cls._cache) < cls.CACHE_SIZE:
+                cls._cache[key] = coordinate
+        return coordinate
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"Coordinate is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return Coordinate, (self.row, self.column)
+
+    def __copy__(self):
+        return self
 
-    def __init__(self, row: int, column: int):
-        self.row = row
-        self.column = column
+    def __deepcopy__(self, memo):
+        return self
 
     def __eq__(self, other):
-        return self.row == other.row and self.column == other.column
+        return self is other or (self.row == other.row and self.column == other.column)
 
     def __hash__(self):
-        return hash((self.row, self.column))
+        return self._hash
@@ -1,15 +1,45 @@
+from typing import Dict
+
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.farmer_side import FarmerSide
 
 
 class CoordinateWithFarmerSide:
+    """
+    Immutable (coordinate, farmer side) pair, interned in a bounded cache like Coordinate.
+    """
+
+    __slots__ = ("coordinate", "farmer_side", "_hash")
+
+    CACHE_SIZE = 1 << 16
+    _cache: Dict[tuple, 'CoordinateWithFarmerSide'] = {}
+
+    def __new__(cls, coordinate: Coordinate, farmer_side: FarmerSide):
+        key = (coordinate, farmer_side)
+        coordinate_with_farmer_side = cls._cache.get(key)
+        if coordinate_with_farmer_side is None:
+            coordinate_with_farmer_side = super().__new__(cls)
+            object.__setattr__(coordinate_with_farmer_side, "coordinate", coordinate)
+            object.__setattr__(coordinate_with_farmer_side, "farmer_side", farmer_side)
+            object.__setattr__(coordinate_with_farmer_side, "_hash", hash(key))
+            if len(cls._cache) < cls.CACHE_SIZE:
+                cls._cache[key] = coordinate_with_farmer_side
+        return coordinate_with_farmer_side
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"CoordinateWithFarmerSide is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return CoordinateWithFarmerSide, (self.coordinate, self.farmer_side)
+
+    def __copy__(self):
+        return self
 
-    def __init__(self, coordinate: Coordinate, farmer_side: FarmerSide):
-        self.coordinate = coordinate
-        self.farmer_side = farmer_side
+    def __deepcopy__(self, memo):
+        return self
 
     def __eq__(self, other):
-        return self.coordinate == other.coordinate and self.farmer_side == other.farmer_side
+        return self is other or (self.coordinate == other.coordinate and self.farmer_side == other.farmer_side)
 
     def __hash__(self):
-        return hash((self.coordinate, self.farmer_side))
+        return self._hash
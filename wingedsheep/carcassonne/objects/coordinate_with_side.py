@@ -1,15 +1,45 @@
+from typing import Dict
+
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.side import Side
 
 
 class CoordinateWithSide:
+    """
+    Immutable (coordinate, side) pair, interned in a bounded cache like Coordinate.
+    """
+
+    __slots__ = ("coordinate", "side", "_hash")
+
+    CACHE_SIZE = 1 << 16
+    _cache: Dict[tuple, 'CoordinateWithSide'] = {}
+
+    def __new__(cls, coordinate: Coordinate, side: Side):
+        key = (coordinate, side)
+        coordinate_with_side = cls._cache.get(key)
+        if coordinate_with_side is None:
+            coordinate_with_side = super().__new__(cls)
+            object.__setattr__(coordinate_with_side, "coordinate", coordinate)
+            object.__setattr__(coordinate_with_side, "side", side)
+            object.__setattr__(coordinate_with_side, "_hash", hash(key))
+            if len(cls._cache) < cls.CACHE_SIZE:
+                cls._cache[key] = coordinate_with_side
+        return coordinate_with_side
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"CoordinateWithSide is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return CoordinateWithSide, (self.coordinate, self.side)
+
+    def __copy__(self):
+        return self
 
-    def __init__(self, coordinate: Coordinate, side: Side):
-        self.coordinate = coordinate
-        self.side = side
+    def __deepcopy__(self, memo):
+        return self
 
     def __eq__(self, other):
-        return self.coordinate == other.coordinate and self.side == other.side
+        return self is other or (self.coordinate == other.coordinate and self.side == other.side)
 
     def __hash__(self):
-        return hash((self.coordinate, self.side))
+        return self._hash
@@ -0,0 +1,47 @@
+from typing import Optional, Iterator
+
+import numpy as np
+
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets import tile_catalogue
+
+
+class Deck:
+    """
+    The tiles that are still to be drawn, as a cursor into the tile type ids in drawing order. The type ids are never
+    changed and are shared between copies, copying a deck only copies the cursor and the remaining counts.
+
+    remaining holds the number of tiles of every tile type (indexed by type id) that are left in the deck.
+    """
+
+    def __init__(self, tiles: [Tile]):
+        self.type_ids: np.ndarray = np.array([tile.type_id for tile in tiles], dtype=np.int16)
+        self.type_ids.flags.writeable = False
+        self.cursor: int = 0
+        self.remaining: np.ndarray = np.bincount(self.type_ids, minlength=len(tile_catalogue.tile_types)).astype(np.int16)
+
+    def __deepcopy__(self, memo):
+        deck = Deck.__new__(Deck)
+        deck.type_ids = self.type_ids
+        deck.cursor = self.cursor
+        deck.remaining = self.remaining.copy()
+        return deck
+
+    def __len__(self) -> int:
+        return len(self.type_ids) - self.cursor
+
+    def __iter__(self) -> Iterator[Tile]:
+        for type_id in self.type_ids[self.cursor:]:
+            yield tile_catalogue.tile_types[type_id]
+
+    def draw(self) -> Optional[Tile]:
+        if self.cursor == len(self.type_ids):
+            return None
+        type_id = self.type_ids[self.cursor]
+        self.cursor += 1
+        self.remaining[type_id] -= 1
+        return tile_catalogue.tile_types[type_id]
+
+    def undo_draw(self):
+        self.cursor -= 1
+        self.remaining[self.type_ids[self.cursor]] += 1
@@ -0,0 +1,34 @@
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+
+
+class FeatureCompletedEvent(ScoringEvent):
+    """
+    A city, road, chapel or flowers tile is scored. finished is False for the features that are scored unfinished at the
+    end of the game, farms are only scored then. meeples holds the meeple strength of every player on the feature.
+    """
+
+    def __init__(self, terrain_type: TerrainType, coordinate: Coordinate, tiles: int, meeples: [int],
+                 shields: int = 0, inn: bool = False, cathedral: bool = False, finished: bool = True):
+        self.terrain_type = terrain_type
+        self.coordinate = coordinate
+        self.tiles = tiles
+        self.meeples = meeples
+        self.shields = shields
+        self.inn = inn
+        self.cathedral = cathedral
+        self.finished = finished
+
+    def to_json(self) -> dict:
+        return {
+            "event": "feature_completed",
+            "terrain_type": self.terrain_type.to_json(),
+            "coordinate": {"row": self.coordinate.row, "column": self.coordinate.column},
+            "tiles": self.tiles,
+            "meeples": list(self.meeples),
+            "shields": self.shields,
+            "inn": self.inn,
+            "cathedral": self.cathedral,
+            "finished": self.finished
+        }
@@ -0,0 +1,18 @@
+import json
+from typing import TextIO
+
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.events.scoring_event_sink import ScoringEventSink
+
+
+class JsonlScoringEventSink(ScoringEventSink):
+    """
+    Writes every event as a line of JSON to a text file. The file is not closed by the sink.
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+
+    def emit(self, event: ScoringEvent):
+        self.file.write(json.dumps(event.to_json()))
+        self.file.write("\n")
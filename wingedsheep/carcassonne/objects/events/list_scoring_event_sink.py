@@ -0,0 +1,14 @@
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.events.scoring_event_sink import ScoringEventSink
+
+
+class ListScoringEventSink(ScoringEventSink):
+    """
+    Keeps the events in memory
+    """
+
+    def __init__(self):
+        self.events: [ScoringEvent] = []
+
+    def emit(self, event: ScoringEvent):
+        self.events.append(event)
@@ -0,0 +1,20 @@
+import json
+import logging
+
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.events.scoring_event_sink import ScoringEventSink
+
+
+class LoggingScoringEventSink(ScoringEventSink):
+    """
+    Logs every event as JSON
+    """
+
+    def __init__(self, logger: logging.Logger = logging.getLogger("wingedsheep.carcassonne.scoring"),
+                 level: int = logging.INFO):
+        self.logger = logger
+        self.level = level
+
+    def emit(self, event: ScoringEvent):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, json.dumps(event.to_json()))
@@ -0,0 +1,22 @@
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+
+
+class MeepleReturnedEvent(ScoringEvent):
+    """
+    A meeple is taken from the board and given back to its player
+    """
+
+    def __init__(self, player: int, meeple_position: MeeplePosition):
+        self.player = player
+        self.meeple_position = meeple_position
+
+    def to_json(self) -> dict:
+        coordinate = self.meeple_position.coordinate_with_side.coordinate
+        return {
+            "event": "meeple_returned",
+            "player": self.player,
+            "meeple_type": self.meeple_position.meeple_type.to_json(),
+            "coordinate": {"row": coordinate.row, "column": coordinate.column},
+            "side": self.meeple_position.coordinate_with_side.side.to_json()
+        }
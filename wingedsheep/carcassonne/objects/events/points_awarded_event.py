@@ -0,0 +1,23 @@
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+
+
+class PointsAwardedEvent(ScoringEvent):
+    """
+    A player gets points for a feature of the given terrain type. final is True for the scoring at the end of the game.
+    """
+
+    def __init__(self, player: int, points: int, terrain_type: TerrainType, final: bool = False):
+        self.player = player
+        self.points = points
+        self.terrain_type = terrain_type
+        self.final = final
+
+    def to_json(self) -> dict:
+        return {
+            "event": "points_awarded",
+            "player": self.player,
+            "points": self.points,
+            "terrain_type": self.terrain_type.to_json(),
+            "final": self.final
+        }
@@ -0,0 +1,7 @@
+class ScoringEvent:
+    """
+    Something that happened while scoring, see ScoringEventUtil for how to receive them
+    """
+
+    def to_json(self) -> dict:
+        raise NotImplementedError
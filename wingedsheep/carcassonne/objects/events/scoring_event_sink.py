@@ -0,0 +1,10 @@
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+
+
+class ScoringEventSink:
+    """
+    Receives scoring events after it is subscribed with ScoringEventUtil.subscribe
+    """
+
+    def emit(self, event: ScoringEvent):
+        raise NotImplementedError
@@ -5,25 +5,40 @@ from wingedsheep.carcassonne.objects.side import Side
 
 
 class FarmerConnection:
+    __slots__ = ("farmer_positions", "tile_connections", "city_sides", "_hash")
+
     def __init__(self, farmer_positions: [Side], tile_connections: [FarmerSide] = (), city_sides: [Side] = ()):
-        self.farmer_positions: [Side] = farmer_positions
-        self.tile_connections: [FarmerSide] = tile_connections
-        self.city_sides: [Side] = city_sides
+        object.__setattr__(self, "farmer_positions", tuple(farmer_positions))
+        object.__setattr__(self, "tile_connections", tuple(tile_connections))
+        object.__setattr__(self, "city_sides", tuple(city_sides))
+        object.__setattr__(self, "_hash", hash((self.farmer_positions, self.tile_connections, self.city_sides)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"FarmerConnection is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return FarmerConnection, (self.farmer_positions, self.tile_connections, self.city_sides)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def to_json(self):
         return {
-            "farmer_position": self.farmer_positions.to_json(),
-            "tile_connections": self.tile_connections.to_json(),
-            "city_sides": self.city_sides.to_json()
+            "farmer_position": [side.to_json() for side in self.farmer_positions],
+            "tile_connections": [farmer_side.to_json() for farmer_side in self.tile_connections],
+            "city_sides": [side.to_json() for side in self.city_sides]
         }
 
     def __str__(self):
         return json.dumps(self.to_json(), indent=2)
 
     def __eq__(self, other):
-        return self.farmer_positions == other.farmer_positions \
-               and self.tile_connections == other.tile_connections \
-               and self.city_sides == other.city_sides
+        return self is other or (self.farmer_positions == other.farmer_positions
+                                 and self.tile_connections == other.tile_connections
+                                 and self.city_sides == other.city_sides)
 
     def __hash__(self):
-        return hash((tuple(self.farmer_positions), tuple(self.tile_connections), tuple(self.city_sides)))
+        return self._hash
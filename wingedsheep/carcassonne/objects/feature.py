@@ -0,0 +1,86 @@
+from typing import FrozenSet
+
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+
+
+class Feature:
+    """
+    A connected city, road or farm (terrain type GRASS) on the board. Features are never changed, the feature graph
+    replaces them with new ones when tiles and meeples are added.
+    """
+
+    def __init__(self,
+                 terrain_type: TerrainType,
+                 positions: FrozenSet = frozenset(),
+                 tiles: FrozenSet[Coordinate] = frozenset(),
+                 shield_tiles: FrozenSet[Coordinate] = frozenset(),
+                 inn: bool = False,
+                 cathedral: bool = False,
+                 open_edges: int = 0,
+                 meeples: ((MeeplePosition,),) = (),
+                 city_positions: FrozenSet[CoordinateWithSide] = frozenset()):
+        self.terrain_type = terrain_type
+        self.positions = positions  # CoordinateWithSide for cities and roads, FarmerConnectionWithCoordinate for farms
+        self.tiles = tiles
+        self.shield_tiles = shield_tiles
+        self.inn = inn
+        self.cathedral = cathedral
+        self.open_edges = open_edges
+        self.meeples = meeples  # Meeple positions per player
+        self.city_positions = city_positions  # City sides bordering a farm
+
+    @property
+    def finished(self) -> bool:
+        return self.open_edges == 0
+
+    def has_meeples(self) -> bool:
+        for meeple_positions in self.meeples:
+            if len(meeple_positions) > 0:
+                return True
+        return False
+
+    def merge(self, other: 'Feature', closed_edges: int = 0) -> 'Feature':
+        return Feature(
+            terrain_type=self.terrain_type,
+            positions=self.positions | other.positions,
+            tiles=self.tiles | other.tiles,
+            shield_tiles=self.shield_tiles | other.shield_tiles,
+            inn=self.inn or other.inn,
+            cathedral=self.cathedral or other.cathedral,
+            open_edges=self.open_edges + other.open_edges - closed_edges,
+            meeples=tuple(a + b for a, b in zip(self.meeples, other.meeples)),
+            city_positions=self.city_positions | other.city_positions
+        )
+
+    def close_edges(self, closed_edges: int) -> 'Feature':
+        return self.__replace(open_edges=self.open_edges - closed_edges)
+
+    def add_meeple(self, player: int, meeple_position: MeeplePosition) -> 'Feature':
+        meeples = tuple(
+            meeple_positions + (meeple_position,) if index == player else meeple_positions
+            for index, meeple_positions in enumerate(self.meeples)
+        )
+        return self.__replace(meeples=meeples)
+
+    def remove_meeple(self, player: int, meeple_position: MeeplePosition) -> 'Feature':
+        meeples = tuple(
+            tuple(x for x in meeple_positions if x != meeple_position) if index == player else meeple_positions
+            for index, meeple_positions in enumerate(self.meeples)
+        )
+        return self.__replace(meeples=meeples)
+
+    def __replace(self, open_edges: int = None, meeples: ((MeeplePosition,),) = None) -> 'Feature':
+        return Feature(
+            terrain_type=self.terrain_type,
+            positions=self.positions,
+            tiles=self.tiles,
+            shield_tiles=self.shield_tiles,
+            inn=self.inn,
+            cathedral=self.cathedral,
+            open_edges=self.open_edges if open_edges is None else open_edges,
+            meeples=self.meeples if meeples is None else meeples,
+            city_positions=self.city_positions
+        )
@@ -0,0 +1,267 @@
+from typing import Dict, Optional, Set
+
+from wingedsheep.carcassonne.objects.completed_feature import CompletedFeature
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.coordinate_with_farmer_side import CoordinateWithFarmerSide
+from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.farmer_connection import FarmerConnection
+from wingedsheep.carcassonne.objects.farmer_connection_with_coordinate import FarmerConnectionWithCoordinate
+from wingedsheep.carcassonne.objects.feature import Feature
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.utils.side_modification_util import SideModificationUtil
+
+
+class FeatureGraph:
+    """
+    Disjoint sets of tile segments (city parts, roads and farms) that are merged when a tile is placed.
+    The Feature of a set is kept at its root, so finding the city, road or farm of a position is a lookup.
+
+    Every change is journaled, so the graph can be rolled back to an earlier checkpoint.
+    """
+
+    def __init__(self, players: int):
+        self.players = players
+        self.parents: [int] = []
+        self.sizes: [int] = []
+        self.features: [Feature] = []
+        self.nodes: Dict[(TerrainType, CoordinateWithSide), int] = {}
+        self.farmer_sides: Dict[CoordinateWithFarmerSide, int] = {}
+        # The segments of every placed tile as (terrain type, node, sides), in the order of the tile's cities, roads and
+        # farms. The sides of a farm are its farmer positions.
+        self.tile_segments: Dict[Coordinate, ((TerrainType, int, (Side,)),)] = {}
+        self.journal: [tuple] = []
+
+    def __deepcopy__(self, memo):
+        # Features and the node keys are never changed, so they can be shared. The journal only applies to this graph.
+        feature_graph = FeatureGraph(self.players)
+        feature_graph.parents = list(self.parents)
+        feature_graph.sizes = list(self.sizes)
+        feature_graph.features = list(self.features)
+        feature_graph.nodes = dict(self.nodes)
+        feature_graph.farmer_sides = dict(self.farmer_sides)
+        feature_graph.tile_segments = dict(self.tile_segments)
+        return feature_graph
+
+    def find(self, node: int) -> int:
+        while self.parents[node] != node:
+            node = self.parents[node]
+        return node
+
+    def get_root(self, terrain_type: TerrainType, position: CoordinateWithSide) -> Optional[int]:
+        node: Optional[int] = self.nodes.get((terrain_type, position))
+        return None if node is None else self.find(node)
+
+    def get_feature(self, terrain_type: TerrainType, position: CoordinateWithSide) -> Optional[Feature]:
+        root: Optional[int] = self.get_root(terrain_type, position)
+        return None if root is None else self.features[root]
+
+    def get_meeple_feature(self, meeple_position: MeeplePosition) -> Optional[Feature]:
+        root: Optional[int] = self.get_meeple_root(meeple_position)
+        return None if root is None else self.features[root]
+
+    def get_meeple_root(self, meeple_position: MeeplePosition) -> Optional[int]:
+        if meeple_position.meeple_type == MeepleType.FARMER or meeple_position.meeple_type == MeepleType.BIG_FARMER:
+            return self.get_root(TerrainType.GRASS, meeple_position.coordinate_with_side)
+        root: Optional[int] = self.get_root(TerrainType.CITY, meeple_position.coordinate_with_side)
+        if root is None:
+            root = self.get_root(TerrainType.ROAD, meeple_position.coordinate_with_side)
+        return root
+
+    def get_tile_segments(self, coordinate: Coordinate) -> [(TerrainType, int, (Side,))]:
+        """
+        The segments of the tile at the coordinate as (terrain type, root, sides). Segments of the same feature have the
+        same root.
+        """
+        return [(terrain_type, self.find(node), sides)
+                for terrain_type, node, sides in self.tile_segments.get(coordinate, ())]
+
+    def get_tile_features(self, coordinate: Coordinate, terrain_type: TerrainType) -> [Feature]:
+        """
+        The distinct features of the given terrain type that the tile at the coordinate is part of
+        """
+        features: [Feature] = []
+        roots: Set[int] = set()
+        for segment_terrain_type, root, _ in self.get_tile_segments(coordinate):
+            if segment_terrain_type == terrain_type and root not in roots:
+                roots.add(root)
+                features.append(self.features[root])
+        return features
+
+    def checkpoint(self) -> int:
+        return len(self.journal)
+
+    def changed_nodes(self, checkpoint: int) -> Set[int]:
+        """
+        The nodes whose feature or parent changed since the checkpoint. Nodes added since then only show up when they
+        were changed after being added.
+        """
+        nodes: Set[int] = set()
+        for entry in self.journal[checkpoint:]:
+            if entry[0] == "feature":
+                nodes.add(entry[1])
+            elif entry[0] == "union":
+                nodes.add(entry[1])
+                nodes.add(entry[2])
+        return nodes
+
+    def rollback(self, checkpoint: int):
+        while len(self.journal) > checkpoint:
+            entry = self.journal.pop()
+            if entry[0] == "feature":
+                _, node, feature = entry
+                self.features[node] = feature
+            elif entry[0] == "union":
+                _, child, root, feature = entry
+                self.parents[child] = child
+                self.sizes[root] -= self.sizes[child]
+                self.features[root] = feature
+            elif entry[0] == "tile":
+                _, coordinate = entry
+                del self.tile_segments[coordinate]
+            else:  # entry[0] == "node"
+                _, keys, farmer_sides = entry
+                self.parents.pop()
+                self.sizes.pop()
+                self.features.pop()
+                for key in keys:
+                    del self.nodes[key]
+                for farmer_side in farmer_sides:
+                    del self.farmer_sides[farmer_side]
+
+    def add_tile(self, coordinate: Coordinate, tile: Tile) -> [CompletedFeature]:
+        """
+        Add the segments of the tile and merge them with the features of the neighbouring tiles.
+
+        :return: The cities and roads that were completed by the tile, the features whose open edge count dropped to zero
+        """
+        no_meeples: ((MeeplePosition,),) = tuple(() for _ in range(self.players))
+        shield_tiles = frozenset([coordinate]) if tile.shield else frozenset()
+        segments: [(TerrainType, int, (Side,))] = []
+
+        for city in tile.city:
+            positions = frozenset(CoordinateWithSide(coordinate, side) for side in city)
+            node: int = self.__add_node(
+                Feature(terrain_type=TerrainType.CITY, positions=positions, tiles=frozenset([coordinate]),
+                        shield_tiles=shield_tiles, cathedral=tile.cathedral, open_edges=len(positions),
+                        meeples=no_meeples),
+                keys=[(TerrainType.CITY, position) for position in positions]
+            )
+            segments.append((TerrainType.CITY, node, tuple(city)))
+            for position in positions:
+                self.__connect(node, TerrainType.CITY, position)
+
+        for road in tile.road:
+            positions = frozenset(CoordinateWithSide(coordinate, side) for side in (road.a, road.b) if side != Side.CENTER)
+            node: int = self.__add_node(
+                Feature(terrain_type=TerrainType.ROAD, positions=positions, tiles=frozenset([coordinate]),
+                        inn=any(position.side in tile.inn for position in positions), open_edges=len(positions),
+                        meeples=no_meeples),
+                keys=[(TerrainType.ROAD, position) for position in positions]
+            )
+            segments.append((TerrainType.ROAD, node, tuple(side for side in (road.a, road.b) if side != Side.CENTER)))
+            for position in positions:
+                self.__connect(node, TerrainType.ROAD, position)
+
+        farm: FarmerConnection
+        for farm in tile.farms:
+            farmer_sides = [CoordinateWithFarmerSide(coordinate, farmer_side) for farmer_side in farm.tile_connections
+                            if CoordinateWithFarmerSide(coordinate, farmer_side) not in self.farmer_sides]
+            node: int = self.__add_node(
+                Feature(terrain_type=TerrainType.GRASS,
+                        positions=frozenset([FarmerConnectionWithCoordinate(farm, coordinate)]),
+                        tiles=frozenset([coordinate]), meeples=no_meeples,
+                        city_positions=frozenset(CoordinateWithSide(coordinate, side) for side in farm.city_sides)),
+                keys=[(TerrainType.GRASS, CoordinateWithSide(coordinate, side)) for side in farm.farmer_positions],
+                farmer_sides=farmer_sides
+            )
+            segments.append((TerrainType.GRASS, node, tuple(farm.farmer_positions)))
+            for farmer_side in farmer_sides:
+                neighbour: Optional[int] = self.farmer_sides.get(self.__opposite_farmer_side(farmer_side))
+                if neighbour is not None:
+                    self.__union(node, neighbour, closed_edges=0)
+
+        self.tile_segments[coordinate] = tuple(segments)
+        self.journal.append(("tile", coordinate))
+
+        completed_features: [CompletedFeature] = []
+        roots: Set[int] = set()
+        for terrain_type, node, sides in segments:
+            if terrain_type == TerrainType.GRASS or len(sides) == 0:
+                continue
+            root: int = self.find(node)
+            if root not in roots and self.features[root].finished:
+                roots.add(root)
+                completed_features.append(CompletedFeature(root=root, coordinate=coordinate, feature=self.features[root]))
+        return completed_features
+
+    def add_meeple(self, player: int, meeple_position: MeeplePosition):
+        root: Optional[int] = self.get_meeple_root(meeple_position)
+        if root is not None:
+            self.__set_feature(root, self.features[root].add_meeple(player, meeple_position))
+
+    def remove_meeple(self, player: int, meeple_position: MeeplePosition):
+        root: Optional[int] = self.get_meeple_root(meeple_position)
+        if root is not None:
+            self.__set_feature(root, self.features[root].remove_meeple(player, meeple_position))
+
+    def __add_node(self, feature: Feature, keys: [(TerrainType, CoordinateWithSide)],
+                   farmer_sides: [CoordinateWithFarmerSide] = ()) -> int:
+        node = len(self.parents)
+        self.parents.append(node)
+        self.sizes.append(1)
+        self.features.append(feature)
+        for key in keys:
+            self.nodes[key] = node
+        for farmer_side in farmer_sides:
+            self.farmer_sides[farmer_side] = node
+        self.journal.append(("node", keys, farmer_sides))
+        return node
+
+    def __connect(self, node: int, terrain_type: TerrainType, position: CoordinateWithSide):
+        neighbour: Optional[int] = self.nodes.get((terrain_type, self.__opposite_edge(position)))
+        if neighbour is not None:
+            self.__union(node, neighbour, closed_edges=2)
+
+    def __union(self, a: int, b: int, closed_edges: int):
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            if closed_edges > 0:
+                self.__set_feature(root_a, self.features[root_a].close_edges(closed_edges))
+            return
+
+        if self.sizes[root_a] < self.sizes[root_b]:
+            root_a, root_b = root_b, root_a
+
+        self.journal.append(("union", root_b, root_a, self.features[root_a]))
+        self.parents[root_b] = root_a
+        self.sizes[root_a] += self.sizes[root_b]
+        self.features[root_a] = self.features[root_a].merge(self.features[root_b], closed_edges=closed_edges)
+
+    def __set_feature(self, node: int, feature: Feature):
+        self.journal.append(("feature", node, self.features[node]))
+        self.features[node] = feature
+
+    @staticmethod
+    def __opposite_edge(position: CoordinateWithSide) -> CoordinateWithSide:
+        row, column = position.coordinate.row, position.coordinate.column
+        if position.side == Side.TOP:
+            return CoordinateWithSide(Coordinate(row - 1, column), Side.BOTTOM)
+        elif position.side == Side.RIGHT:
+            return CoordinateWithSide(Coordinate(row, column + 1), Side.LEFT)
+        elif position.side == Side.BOTTOM:
+            return CoordinateWithSide(Coordinate(row + 1, column), Side.TOP)
+        else:  # position.side == Side.LEFT
+            return CoordinateWithSide(Coordinate(row, column - 1), Side.RIGHT)
+
+    @staticmethod
+    def __opposite_farmer_side(position: CoordinateWithFarmerSide) -> CoordinateWithFarmerSide:
+        opposite: CoordinateWithSide = FeatureGraph.__opposite_edge(
+            CoordinateWithSide(position.coordinate, position.farmer_side.get_side())
+        )
+        return CoordinateWithFarmerSide(opposite.coordinate,
+                                        SideModificationUtil.opposite_farmer_side(position.farmer_side))
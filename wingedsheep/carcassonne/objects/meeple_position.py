@@ -3,12 +3,28 @@ from wingedsheep.carcassonne.objects.meeple_type import MeepleType
 
 
 class MeeplePosition:
+    __slots__ = ("meeple_type", "coordinate_with_side", "_hash")
+
     def __init__(self, meeple_type: MeepleType, coordinate_with_side: CoordinateWithSide):
-        self.meeple_type = meeple_type
-        self.coordinate_with_side = coordinate_with_side
+        object.__setattr__(self, "meeple_type", meeple_type)
+        object.__setattr__(self, "coordinate_with_side", coordinate_with_side)
+        object.__setattr__(self, "_hash", hash((meeple_type, coordinate_with_side)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"MeeplePosition is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return MeeplePosition, (self.meeple_type, self.coordinate_with_side)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __eq__(self, other):
-        return self.meeple_type == other.meeple_type and self.coordinate_with_side == other.coordinate_with_side
+        return self is other or (self.meeple_type == other.meeple_type
+                                 and self.coordinate_with_side == other.coordinate_with_side)
 
     def __hash__(self):
-        return hash((self.meeple_type, self.coordinate_with_side))
+        return self._hash
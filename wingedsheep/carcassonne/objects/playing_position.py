@@ -4,15 +4,36 @@ from wingedsheep.carcassonne.objects.coordinate import Coordinate
 
 
 class PlayingPosition:
+    __slots__ = ("coordinate", "turns", "_hash")
+
     def __init__(self, coordinate: Coordinate, turns: int):
-        self.coordinate = coordinate
-        self.turns = turns
+        object.__setattr__(self, "coordinate", coordinate)
+        object.__setattr__(self, "turns", turns)
+        object.__setattr__(self, "_hash", hash((coordinate, turns)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"PlayingPosition is immutable, can not set {key}")
+
+    def __reduce__(self):
+        return PlayingPosition, (self.coordinate, self.turns)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def to_json(self):
         return {
-            "coordinate": self.coordinate,
+            "coordinate": {"row": self.coordinate.row, "column": self.coordinate.column},
             "turns": self.turns
         }
 
     def __str__(self):
         return json.dumps(self.to_json(), indent=2)
+
+    def __eq__(self, other):
+        return self is other or (self.coordinate == other.coordinate and self.turns == other.turns)
+
+    def __hash__(self):
+        return self._hash
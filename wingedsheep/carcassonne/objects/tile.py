@@ -1,12 +1,13 @@
 import json
 import sys
-from typing import Set
+from typing import Set, Optional
 import numpy as np
 
 from wingedsheep.carcassonne.objects.connection import Connection
 from wingedsheep.carcassonne.objects.farmer_connection import FarmerConnection
 from wingedsheep.carcassonne.objects.side import Side
 from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+from wingedsheep.carcassonne.utils.edge_signature_util import EdgeSignatureUtil
 from wingedsheep.carcassonne.utils.side_modification_util import SideModificationUtil
 
 np.set_printoptions(suppress=True, linewidth=np.nan, threshold=sys.maxsize)
@@ -30,39 +31,55 @@ class Tile:
                  image: str = "Empty.png"):
         self.description = description
         self.turns = turns
-        self.road = road
-        self.river = river
-        self.city = city
-        self.grass = grass
-        self.farms: [FarmerConnection] = farms
+        self.road: (Connection,) = tuple(road)
+        self.river: (Connection,) = tuple(river)
+        self.city: ((Side,),) = tuple(map(lambda x: tuple(x), city))
+        self.grass: (Side,) = tuple(grass)
+        self.farms: (FarmerConnection,) = tuple(farms)
         self.shield = shield
         self.chapel = chapel
         self.flowers = flowers
-        self.inn = inn
+        self.inn: (Side,) = tuple(inn)
         self.cathedral = cathedral
-        self.unplayable_sides = unplayable_sides
+        self.unplayable_sides: (Side,) = tuple(unplayable_sides)
         self.image = image
 
+        # Assigned by the tile catalogue, see tile_sets/tile_catalogue.py
+        self.type_id: Optional[int] = None
+        self.tile_id: Optional[int] = None
+
+        self.__road_ends: Set[Side] = frozenset(side for connection in self.road for side in (connection.a, connection.b))
+        self.__river_ends: Set[Side] = frozenset(side for connection in self.river for side in (connection.a, connection.b))
+        self.__city_sides: Set[Side] = frozenset(side for side_list in self.city for side in side_list)
+        self.__grass_sides: Set[Side] = frozenset(self.grass)
+        self.edge_signature: int = EdgeSignatureUtil.signature(grass=self.__grass_sides, city=self.__city_sides,
+                                                               road=self.__road_ends, river=self.__river_ends)
+        self.__rotations: Optional[(Tile,)] = None
+        self.__rotation_period: Optional[int] = None
+        self.__frozen = True
+
+    def __setattr__(self, key, value):
+        if self.__dict__.get("_Tile__frozen", False):
+            raise AttributeError(f"Tile is immutable, can not set {key}")
+        super().__setattr__(key, value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
     def get_road_ends(self) -> Set[Side]:
-        sides: Set[Side] = set([])
-        for road in self.road:
-            sides.add(road.a)
-            sides.add(road.b)
-        return set(sides)
+        return self.__road_ends
 
     def get_river_ends(self) -> Set[Side]:
-        sides: Set[Side] = set([])
-        for road in self.river:
-            sides.add(road.a)
-            sides.add(road.b)
-        return set(sides)
+        return self.__river_ends
 
     def get_city_sides(self) -> Set[Side]:
-        sides: Set[Side] = set([])
-        for side_list in self.city:
-            for side in side_list:
-                sides.add(side)
-        return set(sides)
+        return self.__city_sides
+
+    def get_grass_sides(self) -> Set[Side]:
+        return self.__grass_sides
 
     def has_river(self) -> bool:
         return len(self.river) > 0
@@ -86,7 +103,7 @@ class Tile:
         if self.get_city_sides().__contains__(side):
             return TerrainType.CITY
 
-        if self.grass.__contains__(side):
+        if self.__grass_sides.__contains__(side):
             return TerrainType.GRASS
 
     def to_json(self):
@@ -108,9 +125,61 @@ class Tile:
         return json.dumps(self.to_json(), indent=2)
 
     def turn(self, times: int):
+        """
+        Get this tile turned clockwise the given number of times. Every rotation of a tile is created once and shared.
+        """
+        return self.get_rotations()[(self.turns + times) % 4]
+
+    def get_rotations(self) -> ('Tile',):
+        """
+        All four rotations of this tile, indexed by their number of turns.
+        """
+        if self.__rotations is None:
+            rotations: (Tile,) = tuple(self.__rotated(times - self.turns) for times in range(4))
+            for tile in rotations:
+                tile.__dict__["_Tile__rotations"] = rotations
+        return self.__rotations
+
+    def get_rotation_period(self) -> int:
+        """
+        The number of turns after which this tile is the same again: 1 (for example a chapel), 2 (a straight road) or 4.
+        Placing turn(k) and turn(k + period) on the same cell leads to the same game.
+        """
+        if self.__rotation_period is None:
+            structure = self.__structure()
+            period: int = next(period for period in (1, 2, 4) if self.turn(period).__structure() == structure)
+            for tile in self.get_rotations():
+                tile.__dict__["_Tile__rotation_period"] = period
+        return self.__rotation_period
+
+    def set_type_id(self, type_id: int):
+        for tile in self.get_rotations():
+            tile.__dict__["type_id"] = type_id
+            tile.__dict__["tile_id"] = type_id * 4 + tile.turns
+
+    def __structure(self) -> tuple:
+        return (
+            frozenset(frozenset(city) for city in self.city),
+            frozenset(frozenset((connection.a, connection.b)) for connection in self.road),
+            frozenset(frozenset((connection.a, connection.b)) for connection in self.river),
+            self.__grass_sides,
+            frozenset((frozenset(farm.farmer_positions), frozenset(farm.tile_connections), frozenset(farm.city_sides))
+                      for farm in self.farms),
+            frozenset(self.inn),
+            frozenset(self.unplayable_sides),
+            self.shield,
+            self.chapel,
+            self.flowers,
+            self.cathedral
+        )
+
+    def __rotated(self, times: int) -> 'Tile':
+        times = times % 4
+        if times == 0:
+            return self
         return Tile(
             description=self.description,
-            turns=times,
+            turns=(self.turns + times) % 4,
             road=list(map(lambda x: SideModificationUtil.turn_connection(x, times), self.road)),
             river=list(map(lambda x: SideModificationUtil.turn_connection(x, times), self.river)),
             city=list(map(lambda x: SideModificationUtil.turn_sides(x, times), self.city)),
@@ -120,6 +189,7 @@ class Tile:
             chapel=self.chapel,
             flowers=self.flowers,
             inn=list(map(lambda x: SideModificationUtil.turn_side(x, times), self.inn)),
+            cathedral=self.cathedral,
             unplayable_sides=list(map(lambda x: SideModificationUtil.turn_side(x, times), self.unplayable_sides)),
             image=self.image
         )
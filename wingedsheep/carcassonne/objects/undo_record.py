@@ -0,0 +1,54 @@
+from typing import Optional
+
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.objects.completed_feature import CompletedFeature
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.game_phase import GamePhase
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.rotation import Rotation
+from wingedsheep.carcassonne.objects.tile import Tile
+
+
+class UndoRecord:
+    """
+    Everything StateUpdater.undo_action needs to restore a game state after StateUpdater.apply_action_inplace.
+    """
+
+    def __init__(self,
+                 action: Action,
+                 phase: GamePhase,
+                 current_player: int,
+                 next_tile: Optional[Tile],
+                 deck_size: int,
+                 last_tile_action: Optional[TileAction],
+                 last_river_rotation: Rotation,
+                 scores: (int,),
+                 meeples: (int,),
+                 abbots: (int,),
+                 big_meeples: (int,),
+                 placed_meeples: ((MeeplePosition,),),
+                 feature_graph_checkpoint: int,
+                 zobrist_hash: int,
+                 completed_features: [CompletedFeature],
+                 projected_points: (int,),
+                 coordinate: Optional[Coordinate] = None):
+        self.action = action
+        self.phase = phase
+        self.current_player = current_player
+        self.next_tile = next_tile
+        self.deck_size = deck_size
+        self.last_tile_action = last_tile_action
+        self.last_river_rotation = last_river_rotation
+        self.scores = scores
+        self.meeples = meeples
+        self.abbots = abbots
+        self.big_meeples = big_meeples
+        self.placed_meeples = placed_meeples
+        self.feature_graph_checkpoint = feature_graph_checkpoint
+        self.zobrist_hash = zobrist_hash
+        self.completed_features = completed_features
+        self.projected_points = projected_points
+        # The provisional points changed by the action with their old values, see ScoreProjectionUtil
+        self.provisional_points_changes: [(object, Optional[tuple])] = []
+        self.coordinate = coordinate
@@ -0,0 +1,136 @@
+"""
+Plays games with random moves without a user interface, spread over a pool of worker processes, and writes one line of
+JSON per game:
+
+    python -m wingedsheep.carcassonne.selfplay --games 1000 --players 3 --output games.jsonl
+
+Game i is played with seed --seed + i, or with the i-th of --seeds. The seed shuffles the deck and picks the moves. Set
+PYTHONHASHSEED as well to get the same games in another run, the order of some sets depends on it.
+
+Only the game state, ActionUtil and StateUpdater are used, so no Tk or pygame window is opened.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from typing import Optional, TextIO
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.game_phase import GamePhase
+from wingedsheep.carcassonne.tile_sets.supplementary_rules import SupplementaryRule
+from wingedsheep.carcassonne.tile_sets.tile_sets import TileSet
+from wingedsheep.carcassonne.utils.action_util import ActionUtil
+from wingedsheep.carcassonne.utils.state_updater import StateUpdater
+
+
+def play_game(game: int, seed: int, players: int, tile_sets: [TileSet],
+              supplementary_rules: [SupplementaryRule]) -> dict:
+    """
+    Play one game with random moves and return its result as a JSON object
+    """
+    start = time.perf_counter()
+    # The deck is shuffled with the global random generator
+    random.seed(seed)
+    rng = random.Random(seed)
+    game_state = CarcassonneGameState(tile_sets=tile_sets, supplementary_rules=supplementary_rules, players=players)
+
+    turns = 0
+    actions = 0
+    while not game_state.is_terminated():
+        if game_state.phase == GamePhase.MEEPLES:
+            turns += 1
+        action: Action = ActionUtil.sample_random_action(game_state, rng=rng)
+        StateUpdater.apply_action_inplace(game_state=game_state, action=action)
+        actions += 1
+
+    return {
+        "game": game,
+        "seed": seed,
+        "players": players,
+        "tile_sets": [tile_set.to_json() for tile_set in tile_sets],
+        "supplementary_rules": [rule.to_json() for rule in supplementary_rules],
+        "scores": list(game_state.scores),
+        "turns": turns,
+        "actions": actions,
+        "tiles": game_state.placed_tiles,
+        "seconds": round(time.perf_counter() - start, 6)
+    }
+
+
+def play_game_arguments(arguments: tuple) -> dict:
+    return play_game(*arguments)
+
+
+def play_games(seeds: [int], players: int, tile_sets: [TileSet], supplementary_rules: [SupplementaryRule],
+               output: TextIO, workers: int = 1, chunksize: int = 1) -> int:
+    """
+    Play a game for every seed and write the results to the output as they come in, in the order of the seeds.
+
+    :return: The number of games played
+    """
+    arguments = ((game, seed, players, tile_sets, supplementary_rules) for game, seed in enumerate(seeds))
+    games = 0
+
+    if workers <= 1:
+        for result in map(play_game_arguments, arguments):
+            write_result(output, result)
+            games += 1
+        return games
+
+    with multiprocessing.Pool(processes=workers) as pool:
+        for result in pool.imap(play_game_arguments, arguments, chunksize=chunksize):
+            write_result(output, result)
+            games += 1
+    return games
+
+
+def write_result(output: TextIO, result: dict):
+    output.write(json.dumps(result))
+    output.write("\n")
+    output.flush()
+
+
+def parse_arguments(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m wingedsheep.carcassonne.selfplay",
+                                     description="Play Carcassonne games with random moves and write the results as "
+                                                 "JSON lines.")
+    parser.add_argument("--games", type=int, default=1, help="number of games, ignored when --seeds is given")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, game i uses seed + i")
+    parser.add_argument("--seeds", type=int, nargs="+", help="the seed of every game")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--tile-sets", nargs="+", type=TileSet, choices=list(TileSet),
+                        default=[TileSet.BASE, TileSet.THE_RIVER, TileSet.INNS_AND_CATHEDRALS])
+    parser.add_argument("--rules", nargs="*", type=SupplementaryRule, choices=list(SupplementaryRule),
+                        default=[SupplementaryRule.FARMERS, SupplementaryRule.ABBOTS], help="supplementary rules")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("--chunksize", type=int, default=1, help="games sent to a worker at once")
+    parser.add_argument("--output", default="-", help="JSON lines file, - for standard output")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[list] = None):
+    arguments = parse_arguments(argv)
+    seeds: [int] = arguments.seeds if arguments.seeds is not None \
+        else list(range(arguments.seed, arguments.seed + arguments.games))
+
+    start = time.perf_counter()
+    output: TextIO = sys.stdout if arguments.output == "-" else open(arguments.output, "w")
+    try:
+        games = play_games(seeds=seeds, players=arguments.players, tile_sets=arguments.tile_sets,
+                           supplementary_rules=arguments.rules, output=output, workers=arguments.workers,
+                           chunksize=arguments.chunksize)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"{games} games in {elapsed:.1f} s, {games / elapsed:.1f} games per second", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
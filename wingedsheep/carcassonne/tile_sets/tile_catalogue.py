@@ -0,0 +1,27 @@
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets.base_deck import base_tiles
+from wingedsheep.carcassonne.tile_sets.inns_and_cathedrals_deck import inns_and_cathedrals_tiles
+from wingedsheep.carcassonne.tile_sets.the_river_deck import the_river_tiles
+
+# Every tile type of every tile set, indexed by its type id
+tile_types: [Tile] = []
+
+# The deck name of every tile type, indexed by its type id
+tile_type_names: [str] = []
+
+# Every rotation of every tile type, indexed by its tile id (type_id * 4 + turns)
+catalogue_tiles: [Tile] = []
+
+
+def _register_tiles(tiles: {str: Tile}):
+    for name, tile in tiles.items():
+        tile.set_type_id(len(tile_types))
+        tile_types.append(tile)
+        tile_type_names.append(name)
+        catalogue_tiles.extend(tile.get_rotations())
+
+
+_register_tiles(base_tiles)
+_register_tiles(the_river_tiles)
+_register_tiles(inns_and_cathedrals_tiles)
+
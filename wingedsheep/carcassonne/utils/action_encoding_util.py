@@ -0,0 +1,66 @@
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.actions.action import Action
+from wingedsheep.carcassonne.objects.actions.encoded_action import EncodedAction
+from wingedsheep.carcassonne.objects.actions.meeple_action import MeepleAction
+from wingedsheep.carcassonne.objects.actions.pass_action import PassAction
+from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.objects.side import Side
+
+
+class ActionEncodingUtil:
+    """
+    Converts actions to encoded actions and back. An encoded tile action does not hold the tile, decoding it turns the
+    next tile of the game state.
+    """
+
+    sides: [Side] = list(Side)
+    side_indexes = {side: index for index, side in enumerate(sides)}
+    meeple_types: [MeepleType] = list(MeepleType)
+    meeple_type_indexes = {meeple_type: index for index, meeple_type in enumerate(meeple_types)}
+
+    @classmethod
+    def encode(cls, action: Action) -> EncodedAction:
+        if isinstance(action, TileAction):
+            return EncodedAction(
+                kind=EncodedAction.TILE,
+                row=action.coordinate.row,
+                column=action.coordinate.column,
+                rotation=action.tile_rotations
+            )
+        elif isinstance(action, MeepleAction):
+            coordinate: Coordinate = action.coordinate_with_side.coordinate
+            return EncodedAction(
+                kind=EncodedAction.MEEPLE,
+                row=coordinate.row,
+                column=coordinate.column,
+                side=cls.side_indexes[action.coordinate_with_side.side],
+                meeple_type=cls.meeple_type_indexes[action.meeple_type],
+                remove=action.remove
+            )
+        elif isinstance(action, PassAction):
+            return EncodedAction(kind=EncodedAction.PASS)
+        raise ValueError(f"Can not encode action {action}")
+
+    @classmethod
+    def decode(cls, encoded_action: EncodedAction, game_state: CarcassonneGameState) -> Action:
+        if encoded_action.kind == EncodedAction.TILE:
+            return TileAction(
+                tile=game_state.next_tile.turn(encoded_action.rotation),
+                coordinate=Coordinate(encoded_action.row, encoded_action.column),
+                tile_rotations=encoded_action.rotation
+            )
+        elif encoded_action.kind == EncodedAction.MEEPLE:
+            return MeepleAction(
+                meeple_type=cls.meeple_types[encoded_action.meeple_type],
+                coordinate_with_side=CoordinateWithSide(
+                    coordinate=Coordinate(encoded_action.row, encoded_action.column),
+                    side=cls.sides[encoded_action.side]
+                ),
+                remove=encoded_action.remove
+            )
+        elif encoded_action.kind == EncodedAction.PASS:
+            return PassAction()
+        raise ValueError(f"Can not decode action {encoded_action}")
@@ -1,36 +1,96 @@
+import random
+from typing import Iterator, Optional
+
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState, GamePhase
 from wingedsheep.carcassonne.objects.actions.action import Action
 from wingedsheep.carcassonne.objects.actions.pass_action import PassAction
 from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.playing_position import PlayingPosition
+from wingedsheep.carcassonne.objects.tile import Tile
 from wingedsheep.carcassonne.utils.possible_move_finder import PossibleMoveFinder
 from wingedsheep.carcassonne.utils.tile_position_finder import TilePositionFinder
 
 
 class ActionUtil:
 
+    # Number of random (frontier cell, rotation) pairs tried by sample_random_action before it falls back to listing
+    # all actions
+    MAX_SAMPLE_ATTEMPTS = 32
+
+    @classmethod
+    def get_possible_actions(cls, state: CarcassonneGameState, unique_rotations: bool = True) -> [Action]:
+        """
+        All actions for the current player. Tile actions that only differ in a rotation that leads to the same game are
+        left out, unless unique_rotations is False.
+        """
+        return list(cls.iter_possible_actions(state, unique_rotations=unique_rotations))
+
+    @staticmethod
+    def iter_possible_actions(state: CarcassonneGameState, unique_rotations: bool = True) -> Iterator[Action]:
+        """
+        Same as get_possible_actions, but yields the actions one by one
+        """
+        if state.phase == GamePhase.TILES:
+            can_play: bool = False
+            playing_position: PlayingPosition
+            for playing_position in TilePositionFinder.iter_playing_positions(
+                    game_state=state,
+                    tile_to_play=state.next_tile,
+                    unique_rotations=unique_rotations
+            ):
+                can_play = True
+                yield TileAction(
+                    tile=state.next_tile.turn(playing_position.turns),
+                    coordinate=playing_position.coordinate,
+                    tile_rotations=playing_position.turns
+                )
+            if not can_play:
+                yield PassAction()
+        elif state.phase == GamePhase.MEEPLES:
+            yield from PossibleMoveFinder.possible_meeple_actions(game_state=state)
+            yield PassAction()
+
     @staticmethod
-    def get_possible_actions(state: CarcassonneGameState):
-        actions: [Action] = []
+    def count_possible_actions(state: CarcassonneGameState, unique_rotations: bool = True) -> int:
+        """
+        The number of actions get_possible_actions would return, without creating them
+        """
         if state.phase == GamePhase.TILES:
-            possible_playing_positions: [PlayingPosition] = TilePositionFinder.possible_playing_positions(
+            positions: int = sum(1 for _ in TilePositionFinder.iter_playing_positions(
                 game_state=state,
-                tile_to_play=state.next_tile
-            )
-            if len(possible_playing_positions) == 0:
-                actions.append(PassAction())
-            else:
-                playing_position: PlayingPosition
-                for playing_position in possible_playing_positions:
-                    action = TileAction(
-                        tile=state.next_tile.turn(playing_position.turns),
-                        coordinate=playing_position.coordinate,
-                        tile_rotations=playing_position.turns
-                    )
-                    actions.append(action)
+                tile_to_play=state.next_tile,
+                unique_rotations=unique_rotations
+            ))
+            return max(positions, 1)
         elif state.phase == GamePhase.MEEPLES:
-            possible_meeple_actions = PossibleMoveFinder.possible_meeple_actions(game_state=state)
-            actions.extend(possible_meeple_actions)
-            actions.append(PassAction())
-        return actions
+            return PossibleMoveFinder.count_meeple_actions(game_state=state) + 1
+        return 0
+
+    @classmethod
+    def sample_random_action(cls, state: CarcassonneGameState, rng: Optional[random.Random] = None,
+                             unique_rotations: bool = True) -> Action:
+        """
+        A uniformly random action out of get_possible_actions.
+
+        In the tiles phase random (frontier cell, rotation) pairs are drawn and only the drawn pair is checked, so the
+        list of actions is not built. Every legal pair is equally likely to be accepted, which keeps the draw uniform.
+        When no pair fits after MAX_SAMPLE_ATTEMPTS tries, all actions are listed and one of them is chosen.
+        """
+        if rng is None:
+            rng = random
+
+        if state.phase == GamePhase.TILES and not state.empty_board():
+            tile: Tile = state.next_tile
+            rotations: int = tile.get_rotation_period() if unique_rotations else 4
+            cells: [Coordinate] = list(state.frontier)
+            candidates: int = len(cells) * rotations
+            for _ in range(min(cls.MAX_SAMPLE_ATTEMPTS, candidates)):
+                candidate: int = rng.randrange(candidates)
+                coordinate: Coordinate = cells[candidate // rotations]
+                turns: int = candidate % rotations
+                rotated_tile: Tile = tile.turn(turns)
+                if TilePositionFinder.fits(state, coordinate, rotated_tile):
+                    return TileAction(tile=rotated_tile, coordinate=coordinate, tile_rotations=turns)
 
+        return rng.choice(cls.get_possible_actions(state, unique_rotations=unique_rotations))
@@ -0,0 +1,66 @@
+from wingedsheep.carcassonne.objects.side import Side
+
+
+class EdgeSignatureUtil:
+    """
+    A tile edge signature packs the terrain of the four edges of a tile in one integer, four bits per edge.
+    Two tiles can be placed next to each other when the terrain on their touching edges is the same.
+    """
+
+    GRASS = 1
+    CITY = 2
+    ROAD = 3
+    RIVER = 4
+
+    EDGE_BITS = 4
+    EDGE_MASK = 0b1111
+
+    shifts = {
+        Side.TOP: 0,
+        Side.RIGHT: EDGE_BITS,
+        Side.BOTTOM: EDGE_BITS * 2,
+        Side.LEFT: EDGE_BITS * 3
+    }
+
+    @classmethod
+    def signature(cls, grass: {Side}, city: {Side}, road: {Side}, river: {Side}) -> int:
+        signature = 0
+        for side, shift in cls.shifts.items():
+            if side in river:
+                signature |= cls.RIVER << shift
+            elif side in road:
+                signature |= cls.ROAD << shift
+            elif side in city:
+                signature |= cls.CITY << shift
+            elif side in grass:
+                signature |= cls.GRASS << shift
+        return signature
+
+    @classmethod
+    def mask(cls, side: Side) -> int:
+        return cls.EDGE_MASK << cls.shifts[side]
+
+    @classmethod
+    def requirement(cls, neighbour_signature: int, side: Side) -> (int, int):
+        """
+        The required signature and mask for a cell, given the neighbour on the given side of that cell.
+        """
+        shift = cls.shifts[side]
+        opposite_shift = (shift + cls.EDGE_BITS * 2) % (cls.EDGE_BITS * 4)
+        required = ((neighbour_signature >> opposite_shift) & cls.EDGE_MASK) << shift
+        return required, cls.mask(side)
+
+    @classmethod
+    def requirements(cls, top=None, right=None, bottom=None, left=None) -> (int, int):
+        """
+        The required signature and mask for a cell with the given neighbouring tiles.
+        """
+        required = 0
+        mask = 0
+        for side, neighbour in ((Side.TOP, top), (Side.RIGHT, right), (Side.BOTTOM, bottom), (Side.LEFT, left)):
+            if neighbour is not None:
+                side_required, side_mask = cls.requirement(neighbour.edge_signature, side)
+                required |= side_required
+                mask |= side_mask
+        return required, mask
+
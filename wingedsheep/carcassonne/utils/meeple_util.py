@@ -2,18 +2,18 @@ from typing import Optional
 
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.events.meeple_returned_event import MeepleReturnedEvent
 from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
 from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.utils.scoring_event_util import ScoringEventUtil
 
 
 class MeepleUtil:
 
     @staticmethod
     def position_contains_meeple(game_state: CarcassonneGameState, coordinate_with_side: CoordinateWithSide) -> Optional[int]:
-        for player in range(game_state.players):
-            if coordinate_with_side in list(map(lambda x: x.coordinate_with_side, game_state.placed_meeples[player])):
-                return player
-        return None
+        occupant: Optional[(int, MeepleType)] = game_state.occupied_positions.get(coordinate_with_side)
+        return None if occupant is None else occupant[0]
 
     @staticmethod
     def remove_meeples(game_state: CarcassonneGameState, meeples: [[MeeplePosition]]):
@@ -24,10 +24,12 @@ class MeepleUtil:
 
     @staticmethod
     def remove_meeple(game_state: CarcassonneGameState, meeple_position: MeeplePosition, player: int):
-        game_state.placed_meeples[player].remove(meeple_position)
+        game_state.remove_meeple(player=player, meeple_position=meeple_position)
         if meeple_position.meeple_type == MeepleType.NORMAL or meeple_position.meeple_type == MeepleType.FARMER:
             game_state.meeples[player] += 1
         elif meeple_position.meeple_type == MeepleType.ABBOT:
             game_state.abbots[player] += 1
         elif meeple_position.meeple_type == MeepleType.BIG or meeple_position.meeple_type == MeepleType.BIG_FARMER:
             game_state.big_meeples[player] += 1
+        if ScoringEventUtil.sinks:
+            ScoringEventUtil.emit(MeepleReturnedEvent(player, meeple_position))
@@ -1,272 +1,281 @@
-import json
-from typing import Set
+from typing import Dict, Set, Optional
 
 import numpy as np
 
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.objects.city import City
+from wingedsheep.carcassonne.objects.completed_feature import CompletedFeature
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
+from wingedsheep.carcassonne.objects.events.feature_completed_event import FeatureCompletedEvent
+from wingedsheep.carcassonne.objects.events.points_awarded_event import PointsAwardedEvent
 from wingedsheep.carcassonne.objects.farm import Farm
-from wingedsheep.carcassonne.objects.farmer_connection_with_coordinate import FarmerConnectionWithCoordinate
+from wingedsheep.carcassonne.objects.feature import Feature
 from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
 from wingedsheep.carcassonne.objects.meeple_type import MeepleType
 from wingedsheep.carcassonne.objects.road import Road
 from wingedsheep.carcassonne.objects.side import Side
 from wingedsheep.carcassonne.objects.terrain_type import TerrainType
-from wingedsheep.carcassonne.objects.tile import Tile
 from wingedsheep.carcassonne.utils.city_util import CityUtil
 from wingedsheep.carcassonne.utils.farm_util import FarmUtil
 from wingedsheep.carcassonne.utils.meeple_util import MeepleUtil
 from wingedsheep.carcassonne.utils.road_util import RoadUtil
+from wingedsheep.carcassonne.utils.scoring_event_util import ScoringEventUtil
 
 
 class PointsCollector:
 
+    # Meeples that count twice for the majority on a feature
+    big_meeple_types = frozenset([MeepleType.BIG, MeepleType.BIG_FARMER])
+
     @classmethod
     def remove_meeples_and_collect_points(cls, game_state: CarcassonneGameState, coordinate: Coordinate):
 
-        # Points for finished cities
-        cities: [City] = CityUtil.find_cities(game_state=game_state, coordinate=coordinate)
-        for city in cities:
-            if city.finished:
-                meeples: [[MeeplePosition]] = CityUtil.find_meeples(game_state=game_state, city=city)
-                meeple_counts_per_player = cls.get_meeple_counts_per_player(meeples)
-                print("City finished. Meeples:", json.dumps(meeple_counts_per_player))
-                if sum(meeple_counts_per_player) == 0:
-                    continue
-                winning_player = cls.get_winning_player(meeple_counts_per_player)
-                if winning_player is not None:
-                    points = cls.count_city_points(game_state=game_state, city=city)
-                    print(points, "points for player", winning_player)
-                    game_state.scores[winning_player] += points
-                MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples)
-
-        # Points for finished roads
-        roads: [Road] = RoadUtil.find_roads(game_state=game_state, coordinate=coordinate)
-        for road in roads:
-            if road.finished:
-                meeples: [[MeeplePosition]] = RoadUtil.find_meeples(game_state=game_state, road=road)
-                meeple_counts_per_player = cls.get_meeple_counts_per_player(meeples)
-                print("Road finished. Meeples:", json.dumps(meeple_counts_per_player))
-                if sum(meeple_counts_per_player) == 0:
-                    continue
-                winning_player = cls.get_winning_player(meeple_counts_per_player)
-                if winning_player is not None:
-                    points = cls.count_road_points(game_state=game_state, road=road)
-                    print(points, "points for player", winning_player)
-                    game_state.scores[winning_player] += points
-                MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples)
-
-        # Points for finished chapels
-        for row in range(coordinate.row - 1, coordinate.row + 2):
-            for column in range(coordinate.column - 1, coordinate.column + 2):
-                tile: Tile = game_state.get_tile(row, column)
-
-                if tile is None:
-                    continue
-
-                coordinate = Coordinate(row=row, column=column)
-                coordinate_with_side = CoordinateWithSide(coordinate=coordinate, side=Side.CENTER)
-                meeple_of_player = MeepleUtil.position_contains_meeple(game_state=game_state,
-                                                                             coordinate_with_side=coordinate_with_side)
-                if (tile.chapel or tile.flowers) and meeple_of_player is not None:
-                    points = cls.chapel_or_flowers_points(game_state=game_state, coordinate=coordinate)
-                    if points == 9:
-                        print("Chapel or flowers finished for player", str(meeple_of_player))
-                        print(points, "points for player", meeple_of_player)
-                        game_state.scores[meeple_of_player] += points
+        # Points for the cities and roads completed by the tile
+        completed_feature: CompletedFeature
+        for completed_feature in game_state.completed_features:
+            # The feature as it is now, with the meeples placed after the tile
+            feature: Feature = game_state.feature_graph.features[completed_feature.root]
+            meeple_counts_per_player: (int,) = cls.get_meeple_counts_per_player(feature.meeples)
+            if ScoringEventUtil.sinks:
+                ScoringEventUtil.emit(cls.feature_completed_event(feature, completed_feature.coordinate,
+                                                                  meeple_counts_per_player))
+            winning_players: (int,) = cls.get_winning_players(meeple_counts_per_player)
+            if len(winning_players) == 0:
+                continue
+            if feature.terrain_type == TerrainType.CITY:
+                points = cls.city_feature_points(feature)
+            else:
+                points = cls.road_feature_points(feature)
+            for winning_player in winning_players:
+                if ScoringEventUtil.sinks:
+                    ScoringEventUtil.emit(PointsAwardedEvent(winning_player, points, feature.terrain_type))
+                game_state.scores[winning_player] += points
+            MeepleUtil.remove_meeples(game_state=game_state, meeples=feature.meeples)
+
+        # Points for finished chapels and flowers with a meeple on them next to the tile
+        for chapel_coordinate, (meeple_of_player, meeple_type) in list(game_state.chapel_meeples.items()):
+            if abs(chapel_coordinate.row - coordinate.row) > 1 or abs(chapel_coordinate.column - coordinate.column) > 1:
+                continue
+
+            points = cls.chapel_or_flowers_points(game_state=game_state, coordinate=chapel_coordinate)
+            if points == 9:
+                if ScoringEventUtil.sinks:
+                    cls.emit_chapel_or_flowers_events(game_state, chapel_coordinate, meeple_of_player, points,
+                                                      final=False)
+                game_state.scores[meeple_of_player] += points
+
+                coordinate_with_side = CoordinateWithSide(coordinate=chapel_coordinate, side=Side.CENTER)
+                MeepleUtil.remove_meeple(game_state=game_state,
+                                         meeple_position=MeeplePosition(meeple_type, coordinate_with_side),
+                                         player=meeple_of_player)
 
-                        meeples_per_player = []
-                        for _ in range(game_state.players):
-                            meeples_per_player.append([])
+    @staticmethod
+    def get_winning_players(meeple_counts_per_player: (int,)) -> (int,):
+        """
+        The players with the most meeples on a feature. Tied players all get the points, nobody gets them for a feature
+        without meeples.
+        """
+        most_meeples = max(meeple_counts_per_player, default=0)
+        if most_meeples == 0:
+            return ()
+        return tuple(player for player, count in enumerate(meeple_counts_per_player) if count == most_meeples)
 
-                        for meeple_position in game_state.placed_meeples[meeple_of_player]:
-                            if coordinate_with_side == meeple_position.coordinate_with_side:
-                                meeples_per_player[meeple_of_player].append(meeple_position)
+    @staticmethod
+    def get_winning_players_batch(meeple_counts: np.ndarray) -> np.ndarray:
+        """
+        get_winning_players for many features at once. meeple_counts holds the meeple counts per player on its last
+        axis, for example [feature, player] or [game, feature, player]. The result has the same shape and is True for the
+        players that get the points of a feature.
+        """
+        most_meeples: np.ndarray = meeple_counts.max(axis=-1, keepdims=True)
+        return (meeple_counts == most_meeples) & (most_meeples > 0)
 
-                        MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples_per_player)
+    @classmethod
+    def get_winning_player(cls, meeple_counts_per_player: (int,)) -> Optional[int]:
+        """
+        The only player with the most meeples on a feature, None when players are tied or there are no meeples
+        """
+        winning_players: (int,) = cls.get_winning_players(meeple_counts_per_player)
+        return winning_players[0] if len(winning_players) == 1 else None
 
-    @staticmethod
-    def get_winning_player(meeple_counts_per_player: [int]):
-        winners = np.argwhere(meeple_counts_per_player == np.amax(meeple_counts_per_player))
-        if len(winners) == 1:
-            return int(winners[0])
-        else:
-            return None
+    @classmethod
+    def count_city_points(cls, game_state: CarcassonneGameState, city: City):
+        feature: Optional[Feature] = CityUtil.find_feature(game_state=game_state, city=city)
+        if feature is None:
+            return 0
+        return cls.city_feature_points(feature)
 
     @staticmethod
-    def count_city_points(game_state: CarcassonneGameState, city: City):
-        points = 0
-        has_cathedral = False
-
-        coordinates: Set[Coordinate] = set()
-        position: CoordinateWithSide
-        for position in city.city_positions:
-            coordinate: Coordinate = position.coordinate
-            tile: Tile = game_state.board[coordinate.row][coordinate.column]
-            if tile.inn:
-                has_cathedral = True
-            coordinates.add(coordinate)
-
-        tiles: [Tile] = list(map(lambda x: game_state.board[x.row][x.column], coordinates))
-
-        if not city.finished and has_cathedral:
+    def city_feature_points(feature: Feature):
+        if not feature.finished and feature.cathedral:
             return 0
 
-        tile: Tile
-        for tile in tiles:
-            if tile.shield:
-                if has_cathedral:
-                    points += 6
-                else:
-                    points += 4 if city.finished else 2
-            else:
-                if has_cathedral:
-                    points += 3
-                else:
-                    points += 2 if city.finished else 1
+        if feature.cathedral:
+            points_per_tile = 3
+        else:
+            points_per_tile = 2 if feature.finished else 1
 
-        return points
+        return (len(feature.tiles) + len(feature.shield_tiles)) * points_per_tile
 
-    @staticmethod
-    def count_road_points(game_state: CarcassonneGameState, road: Road):
-        points = 0
-        has_inn = False
-
-        coordinates: Set[Coordinate] = set()
-        position: CoordinateWithSide
-        for position in road.road_positions:
-            coordinate: Coordinate = position.coordinate
-            tile: Tile = game_state.board[coordinate.row][coordinate.column]
-            if tile.inn:
-                has_inn = True
-            coordinates.add(coordinate)
-
-        tiles: [Tile] = list(map(lambda x: game_state.board[x.row][x.column], coordinates))
-
-        if not road.finished and has_inn:
+    @classmethod
+    def count_road_points(cls, game_state: CarcassonneGameState, road: Road):
+        feature: Optional[Feature] = RoadUtil.find_feature(game_state=game_state, road=road)
+        if feature is None:
             return 0
+        return cls.road_feature_points(feature)
 
-        tile: Tile
-        for _ in tiles:
-            if has_inn:
-                points += 2
-            else:
-                points += 1
+    @staticmethod
+    def road_feature_points(feature: Feature):
+        if not feature.finished and feature.inn:
+            return 0
 
-        return points
+        return len(feature.tiles) * (2 if feature.inn else 1)
 
     @staticmethod
     def chapel_or_flowers_points(game_state: CarcassonneGameState, coordinate: Coordinate):
-        points = 0
-        for row in range(coordinate.row - 1, coordinate.row + 2):
-            for column in range(coordinate.column - 1, coordinate.column + 2):
-                tile: Tile = game_state.board[row][column]
-                if tile is not None:
-                    points += 1
-        return points
+        return game_state.board.encoding.count_tiles_around(coordinate)
 
     @classmethod
     def count_final_scores(cls, game_state: CarcassonneGameState):
-        for player, placed_meeples in enumerate(game_state.placed_meeples):
-
-            # TODO also remove meeples from meeples_to_remove, when there are multiple
-
-            meeples_to_remove: Set[MeeplePosition] = set(placed_meeples)
-            while len(meeples_to_remove) > 0:
-                meeple_position: MeeplePosition = meeples_to_remove.pop()
-
-                tile: Tile = game_state.board[meeple_position.coordinate_with_side.coordinate.row][
-                    meeple_position.coordinate_with_side.coordinate.column]
-
-                terrrain_type: TerrainType = tile.get_type(meeple_position.coordinate_with_side.side)
-
-                if terrrain_type == TerrainType.CITY:
-                    city: City = CityUtil.find_city(game_state=game_state,
-                                                          city_position=meeple_position.coordinate_with_side)
-                    meeples: [CoordinateWithSide] = CityUtil.find_meeples(game_state=game_state, city=city)
-                    meeple_counts_per_player = cls.get_meeple_counts_per_player(meeples)
-                    print("Collecting points for unfinished city. Meeples:", json.dumps(meeple_counts_per_player))
-                    winning_player = cls.get_winning_player(meeple_counts_per_player)
-                    if winning_player is not None:
-                        points = cls.count_city_points(game_state=game_state, city=city)
-                        print(points, "points for player", player)
-                        game_state.scores[winning_player] += points
-
-                    MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples)
+        """
+        Score the unfinished features with meeples on them at the end of the game and take the meeples off the board.
+
+        Every city, road and farm is scored once, however many meeples are on it. The chapels and flowers are counted in
+        one lookup and the farms share one index of the finished cities.
+        """
+
+        # The distinct cities, roads and farms with meeples, with the position of the first meeple found on them
+        features: Dict[TerrainType, Dict[int, Coordinate]] = {
+            TerrainType.CITY: {},
+            TerrainType.ROAD: {},
+            TerrainType.GRASS: {}
+        }
+        for placed_meeples in game_state.placed_meeples:
+            meeple_position: MeeplePosition
+            for meeple_position in placed_meeples:
+                if meeple_position.coordinate_with_side.side == Side.CENTER:
                     continue
+                root: Optional[int] = game_state.feature_graph.get_meeple_root(meeple_position)
+                if root is not None:
+                    terrain_type: TerrainType = game_state.feature_graph.features[root].terrain_type
+                    features[terrain_type].setdefault(root, meeple_position.coordinate_with_side.coordinate)
 
-                if terrrain_type == TerrainType.ROAD:
-                    road: [Road] = RoadUtil.find_road(game_state=game_state,
-                                                            road_position=meeple_position.coordinate_with_side)
-                    meeples: [CoordinateWithSide] = RoadUtil.find_meeples(game_state=game_state, road=road)
-                    meeple_counts_per_player = cls.get_meeple_counts_per_player(meeples)
-                    print("Collecting points for unfinished road. Meeples:", json.dumps(meeple_counts_per_player))
-                    winning_player = cls.get_winning_player(meeple_counts_per_player)
-                    if winning_player is not None:
-                        points = cls.count_road_points(game_state=game_state, road=road)
-                        print(points, "points for player", player)
-                        game_state.scores[winning_player] += points
-                    MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples)
-                    continue
+        cls.__count_final_chapel_or_flowers_points(game_state)
 
-                if terrrain_type == TerrainType.CHAPEL or terrrain_type == TerrainType.FLOWERS:
-                    points = cls.chapel_or_flowers_points(game_state=game_state,
-                                                           coordinate=meeple_position.coordinate_with_side.coordinate)
-                    print("Collecting points for unfinished chapel or flowers for player", str(player))
-                    print(points, "points for player", player)
-                    game_state.scores[player] += points
+        for terrain_type, points_of_feature in ((TerrainType.CITY, cls.city_feature_points),
+                                                (TerrainType.ROAD, cls.road_feature_points)):
+            roots: [int] = list(features[terrain_type])
+            cls.__score_final_features(game_state, features[terrain_type],
+                                       [points_of_feature(game_state.feature_graph.features[root]) for root in roots])
 
-                    meeples_per_player = []
-                    for _ in range(game_state.players):
-                        meeples_per_player.append([])
-                    meeples_per_player[player].append(meeple_position)
+        finished_cities: Dict[CoordinateWithSide, Optional[int]] = {}
+        cls.__score_final_features(game_state, features[TerrainType.GRASS], [
+            cls.farm_feature_points(game_state, game_state.feature_graph.features[root], finished_cities)
+            for root in features[TerrainType.GRASS]
+        ])
 
-                    MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples_per_player)
-                    continue
+    @classmethod
+    def __score_final_features(cls, game_state: CarcassonneGameState, features: Dict[int, Coordinate],
+                               points: [int]):
+        """
+        Give the points of the features, in the order of their roots, to the majority holders at once and take the
+        meeples off the features
+        """
+        if len(features) == 0:
+            return
+
+        scored_features: [Feature] = [game_state.feature_graph.features[root] for root in features]
+        meeple_counts: [(int,)] = [cls.get_meeple_counts_per_player(feature.meeples) for feature in scored_features]
+        winners: np.ndarray = cls.get_winning_players_batch(np.array(meeple_counts, dtype=np.int64))
+        points_per_player: [int] = (winners * np.array(points, dtype=np.int64)[:, np.newaxis]).sum(axis=0).tolist()
+        for player, player_points in enumerate(points_per_player):
+            game_state.scores[player] += player_points
+
+        for index, (feature, coordinate) in enumerate(zip(scored_features, features.values())):
+            if ScoringEventUtil.sinks:
+                ScoringEventUtil.emit(cls.feature_completed_event(feature, coordinate, meeple_counts[index]))
+                for winning_player in np.flatnonzero(winners[index]).tolist():
+                    ScoringEventUtil.emit(PointsAwardedEvent(winning_player, points[index], feature.terrain_type,
+                                                             final=True))
+            MeepleUtil.remove_meeples(game_state=game_state, meeples=feature.meeples)
 
-                if meeple_position.meeple_type == MeepleType.FARMER or meeple_position.meeple_type == MeepleType.BIG_FARMER:
-                    farm: Farm = FarmUtil.find_farm_by_coordinate(game_state=game_state, position=meeple_position.coordinate_with_side)
-                    meeples: [[MeeplePosition]] = FarmUtil.find_meeples(game_state=game_state, farm=farm)
-                    meeple_counts_per_player = cls.get_meeple_counts_per_player(meeples)
-                    print("Collecting points for farm. Meeples:", json.dumps(meeple_counts_per_player))
-                    winning_player = cls.get_winning_player(meeple_counts_per_player)
-                    if winning_player is not None:
-                        points = cls.count_farm_points(game_state=game_state, farm=farm)
-                        print(points, "points for player", winning_player)
-                        game_state.scores[winning_player] += points
-                    MeepleUtil.remove_meeples(game_state=game_state, meeples=meeples)
-                    continue
+    @classmethod
+    def __count_final_chapel_or_flowers_points(cls, game_state: CarcassonneGameState):
+        if len(game_state.chapel_meeples) == 0:
+            return
+
+        coordinates: [Coordinate] = list(game_state.chapel_meeples)
+        all_points = game_state.board.encoding.count_tiles_around_all(coordinates)
+        for coordinate, points in zip(coordinates, all_points.tolist()):
+            player, meeple_type = game_state.chapel_meeples[coordinate]
+            if ScoringEventUtil.sinks:
+                cls.emit_chapel_or_flowers_events(game_state, coordinate, player, points, final=True)
+            game_state.scores[player] += points
+            MeepleUtil.remove_meeple(game_state=game_state,
+                                     meeple_position=MeeplePosition(meeple_type, CoordinateWithSide(coordinate,
+                                                                                                    Side.CENTER)),
+                                     player=player)
 
-                print("Collecting points for unknown type", terrrain_type)
+    @staticmethod
+    def farm_feature_points(game_state: CarcassonneGameState, feature: Feature,
+                            finished_cities: Dict[CoordinateWithSide, Optional[int]]):
+        """
+        3 points for every finished city bordering the farm. finished_cities holds the root of the finished city of every
+        city position looked up before (None when the city is not finished), it can be shared by all farms.
+        """
+        roots: Set[int] = set()
+        city_position: CoordinateWithSide
+        for city_position in feature.city_positions:
+            if city_position in finished_cities:
+                root: Optional[int] = finished_cities[city_position]
+            else:
+                root: Optional[int] = game_state.feature_graph.get_root(TerrainType.CITY, city_position)
+                if root is not None and not game_state.feature_graph.features[root].finished:
+                    root = None
+                finished_cities[city_position] = root
+            if root is not None:
+                roots.add(root)
+        return len(roots) * 3
 
     @staticmethod
-    def get_meeple_counts_per_player(meeples: [[MeeplePosition]]):
-        meeple_counts_per_player = list(
-            map(
-                lambda x:
-                sum(list(map(
-                    lambda y: 2 if y.meeple_type == MeepleType.BIG or y.meeple_type == MeepleType.BIG_FARMER else 1, x
-                ))),
-                meeples
-            )
+    def feature_completed_event(feature: Feature, coordinate: Coordinate,
+                                meeple_counts_per_player: [int]) -> FeatureCompletedEvent:
+        return FeatureCompletedEvent(
+            terrain_type=feature.terrain_type,
+            coordinate=coordinate,
+            tiles=len(feature.tiles),
+            meeples=meeple_counts_per_player,
+            shields=len(feature.shield_tiles),
+            inn=feature.inn,
+            cathedral=feature.cathedral,
+            # Farms are only scored at the end of the game, they are never finished
+            finished=feature.finished and feature.terrain_type != TerrainType.GRASS
         )
-        return meeple_counts_per_player
 
-    @classmethod
-    def count_farm_points(cls, game_state: CarcassonneGameState, farm: Farm):
-        cities: Set[City] = set()
-
-        points = 0
-
-        farmer_connection_with_coordinate: FarmerConnectionWithCoordinate
-        for farmer_connection_with_coordinate in farm.farmer_connections_with_coordinate:
-            cities = cities.union(CityUtil.find_cities(game_state=game_state, coordinate=farmer_connection_with_coordinate.coordinate, sides=farmer_connection_with_coordinate.farmer_connection.city_sides))
+    @staticmethod
+    def emit_chapel_or_flowers_events(game_state: CarcassonneGameState, coordinate: Coordinate, player: int,
+                                      points: int, final: bool):
+        terrain_type: TerrainType = game_state.board.get(coordinate).get_type(Side.CENTER)
+        meeples: [int] = [0] * game_state.players
+        meeples[player] = 1
+        ScoringEventUtil.emit(FeatureCompletedEvent(terrain_type=terrain_type, coordinate=coordinate, tiles=points,
+                                                    meeples=meeples, finished=points == 9))
+        ScoringEventUtil.emit(PointsAwardedEvent(player, points, terrain_type, final=final))
 
-        city: City
-        for city in cities:
-            if city.finished:
-                points += 3
+    @classmethod
+    def get_meeple_counts_per_player(cls, meeples: [[MeeplePosition]]) -> (int,):
+        """
+        The strength of the meeples of every player, big meeples count twice
+        """
+        return tuple(
+            sum(2 if meeple_position.meeple_type in cls.big_meeple_types else 1 for meeple_position in meeple_positions)
+            for meeple_positions in meeples
+        )
 
-        return points
+    @classmethod
+    def count_farm_points(cls, game_state: CarcassonneGameState, farm: Farm):
+        feature: Optional[Feature] = FarmUtil.find_feature(game_state=game_state, farm=farm)
+        if feature is None:
+            return 0
+        return cls.farm_feature_points(game_state, feature, {})
@@ -1,20 +1,17 @@
+from typing import Dict, Optional
+
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.actions.meeple_action import MeepleAction
 from wingedsheep.carcassonne.objects.coordinate_with_side import CoordinateWithSide
-from wingedsheep.carcassonne.objects.farm import Farm
-from wingedsheep.carcassonne.objects.farmer_connection import FarmerConnection
-from wingedsheep.carcassonne.objects.farmer_connection_with_coordinate import FarmerConnectionWithCoordinate
+from wingedsheep.carcassonne.objects.feature_graph import FeatureGraph
 from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
 from wingedsheep.carcassonne.objects.meeple_type import MeepleType
 from wingedsheep.carcassonne.objects.side import Side
 from wingedsheep.carcassonne.objects.terrain_type import TerrainType
 from wingedsheep.carcassonne.objects.tile import Tile
 from wingedsheep.carcassonne.tile_sets.supplementary_rules import SupplementaryRule
-from wingedsheep.carcassonne.utils.city_util import CityUtil
-from wingedsheep.carcassonne.utils.farm_util import FarmUtil
-from wingedsheep.carcassonne.utils.road_util import RoadUtil
 
 
 class PossibleMoveFinder:
@@ -28,11 +25,9 @@ class PossibleMoveFinder:
 
         possible_actions: [MeepleAction] = []
 
-        meeple_positions = cls.__possible_meeple_positions(game_state=game_state)
+        meeple_positions, farmer_positions = cls.__possible_meeple_positions(game_state=game_state)
 
-        if SupplementaryRule.FARMERS in game_state.supplementary_rules:
-            farmer_positions = cls.__possible_farmer_position(game_state=game_state)
-        else:
+        if SupplementaryRule.FARMERS not in game_state.supplementary_rules:
             farmer_positions = ()
 
         if game_state.meeples[current_player] > 0:
@@ -50,10 +45,9 @@ class PossibleMoveFinder:
                 map(lambda x: MeepleAction(meeple_type=MeepleType.BIG_FARMER, coordinate_with_side=x), farmer_positions)))
 
         if game_state.abbots[current_player] > 0:
-            if last_played_tile.chapel or last_played_tile.flowers:
-                possible_actions.append(MeepleAction(meeple_type=MeepleType.ABBOT,
-                                                     coordinate_with_side=CoordinateWithSide(
-                                                         coordinate=last_played_position, side=Side.CENTER)))
+            center: CoordinateWithSide = CoordinateWithSide(coordinate=last_played_position, side=Side.CENTER)
+            if (last_played_tile.chapel or last_played_tile.flowers) and center not in game_state.occupied_positions:
+                possible_actions.append(MeepleAction(meeple_type=MeepleType.ABBOT, coordinate_with_side=center))
 
         placed_meeple: MeeplePosition
         for placed_meeple in game_state.placed_meeples[current_player]:
@@ -64,60 +58,77 @@ class PossibleMoveFinder:
 
         return possible_actions
 
-    @staticmethod
-    def __possible_meeple_positions(game_state: CarcassonneGameState) -> [CoordinateWithSide]:
-        playing_positions: [CoordinateWithSide] = []
+    @classmethod
+    def count_meeple_actions(cls, game_state: CarcassonneGameState) -> int:
+        """
+        The number of actions possible_meeple_actions would return, counted from the meeple positions without creating
+        the actions
+        """
+        current_player = game_state.current_player
         last_tile_action: TileAction = game_state.last_tile_action
-        last_played_tile: Tile = last_tile_action.tile
-        last_played_position: Coordinate = last_tile_action.coordinate
 
-        if last_played_tile.chapel:
-            playing_positions.append(CoordinateWithSide(coordinate=last_played_position, side=Side.CENTER))
+        meeple_positions, farmer_positions = cls.__possible_meeple_positions(game_state=game_state)
 
-        if last_played_tile.flowers \
-                and SupplementaryRule.NORMAL_MEEPLES_CAN_USE_FLOWERS in game_state.supplementary_rules:
-            playing_positions.append(CoordinateWithSide(coordinate=last_played_position, side=Side.CENTER))
+        if SupplementaryRule.FARMERS not in game_state.supplementary_rules:
+            farmer_positions = ()
 
-        for side in [Side.TOP, Side.RIGHT, Side.BOTTOM, Side.LEFT]:
-            if last_played_tile.get_type(side) == TerrainType.CITY:
-                connected_cities = CityUtil.find_city(
-                    game_state,
-                    CoordinateWithSide(coordinate=last_played_position, side=side)
-                )
-                if CityUtil.city_contains_meeples(game_state, connected_cities):
-                    continue
-                else:
-                    playing_positions.append(CoordinateWithSide(coordinate=last_played_position, side=side))
-
-            if last_played_tile.get_type(side) == TerrainType.ROAD:
-                connected_roads = RoadUtil.find_road(
-                    game_state,
-                    CoordinateWithSide(coordinate=last_played_position, side=side)
-                )
-                if RoadUtil.road_contains_meeples(game_state, connected_roads):
-                    continue
-                else:
-                    playing_positions.append(CoordinateWithSide(coordinate=last_played_position, side=side))
-
-        return playing_positions
+        positions: int = len(meeple_positions) + len(farmer_positions)
+        count: int = 0
+        if game_state.meeples[current_player] > 0:
+            count += positions
+        if game_state.big_meeples[current_player] > 0:
+            count += positions
 
-    @classmethod
-    def __possible_farmer_position(cls, game_state: CarcassonneGameState) -> [CoordinateWithSide]:
-        playing_positions: [CoordinateWithSide] = []
+        if game_state.abbots[current_player] > 0:
+            center: CoordinateWithSide = CoordinateWithSide(coordinate=last_tile_action.coordinate, side=Side.CENTER)
+            if (last_tile_action.tile.chapel or last_tile_action.tile.flowers) \
+                    and center not in game_state.occupied_positions:
+                count += 1
+
+        count += sum(1 for placed_meeple in game_state.placed_meeples[current_player]
+                     if placed_meeple.meeple_type == MeepleType.ABBOT)
+        return count
+
+    @staticmethod
+    def __possible_meeple_positions(game_state: CarcassonneGameState) -> ([CoordinateWithSide], [CoordinateWithSide]):
+        """
+        The free positions on the last played tile for normal meeples and for farmers. Every segment of the tile is
+        resolved to its feature once, sides of the same feature share the result.
+        """
+        meeple_positions: [CoordinateWithSide] = []
+        farmer_positions: [CoordinateWithSide] = []
         last_tile_action: TileAction = game_state.last_tile_action
         last_played_tile: Tile = last_tile_action.tile
         last_played_position: Coordinate = last_tile_action.coordinate
-
-        farmer_connection: FarmerConnection
-        for farmer_connection in last_played_tile.farms:
-            farm: Farm = FarmUtil.find_farm(
-                game_state=game_state,
-                farmer_connection_with_coordinate=FarmerConnectionWithCoordinate(farmer_connection, last_played_position)
-            )
-            if FarmUtil.has_meeples(game_state, farm):
-                continue
+        feature_graph: FeatureGraph = game_state.feature_graph
+
+        # After a passed tile the last played tile is the one of the previous turn, its center can be taken already
+        center: CoordinateWithSide = CoordinateWithSide(coordinate=last_played_position, side=Side.CENTER)
+        if center not in game_state.occupied_positions:
+            if last_played_tile.chapel:
+                meeple_positions.append(center)
+
+            if last_played_tile.flowers \
+                    and SupplementaryRule.NORMAL_MEEPLES_CAN_USE_FLOWERS in game_state.supplementary_rules:
+                meeple_positions.append(center)
+
+        occupied: Dict[int, bool] = {}
+        side_roots: Dict[(TerrainType, Side), int] = {}
+        for terrain_type, root, sides in feature_graph.get_tile_segments(last_played_position):
+            if root not in occupied:
+                occupied[root] = feature_graph.features[root].has_meeples()
+            if terrain_type == TerrainType.GRASS:
+                if not occupied[root]:
+                    farmer_positions.append(CoordinateWithSide(last_played_position, sides[0]))
             else:
-                farmer_position: Side = farmer_connection.farmer_positions[0]
-                playing_positions.append(CoordinateWithSide(last_played_position, farmer_position))
+                for side in sides:
+                    side_roots[(terrain_type, side)] = root
+
+        for side in [Side.TOP, Side.RIGHT, Side.BOTTOM, Side.LEFT]:
+            terrain_type: TerrainType = last_played_tile.get_type(side)
+            if terrain_type == TerrainType.CITY or terrain_type == TerrainType.ROAD:
+                root: Optional[int] = side_roots.get((terrain_type, side))
+                if root is None or not occupied[root]:
+                    meeple_positions.append(CoordinateWithSide(coordinate=last_played_position, side=side))
 
-        return playing_positions
+        return meeple_positions, farmer_positions
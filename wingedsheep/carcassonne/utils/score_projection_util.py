@@ -0,0 +1,121 @@
+from typing import Optional, Set
+
+from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
+from wingedsheep.carcassonne.objects.completed_feature import CompletedFeature
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.feature import Feature
+from wingedsheep.carcassonne.objects.feature_graph import FeatureGraph
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.terrain_type import TerrainType
+from wingedsheep.carcassonne.utils.points_collector import PointsCollector
+
+
+class ScoreProjectionUtil:
+    """
+    Keeps the points the players would get for their meeples if the game ended now up to date, so
+    CarcassonneGameState.projected_scores does not have to score the board.
+
+    game_state.provisional_points holds the (players, points) of every feature root or chapel coordinate that would
+    give points, game_state.projected_points the sum of them per player. After an action only the features that changed
+    in the feature graph, the farms next to a city finished by the placed tile and the chapels with meeples on them are
+    looked at again.
+    """
+
+    @classmethod
+    def update(cls, game_state: CarcassonneGameState, feature_graph_checkpoint: int,
+               tile_placed: bool) -> [(object, Optional[tuple])]:
+        """
+        Update the provisional points after an action.
+
+        :return: The changed keys with their old values, to be passed to undo
+        """
+        feature_graph: FeatureGraph = game_state.feature_graph
+        changes: [(object, Optional[tuple])] = []
+
+        nodes: Set[int] = feature_graph.changed_nodes(feature_graph_checkpoint)
+        if tile_placed:
+            # Farms get points for the cities that were finished by the tile
+            completed_feature: CompletedFeature
+            for completed_feature in game_state.completed_features:
+                if completed_feature.feature.terrain_type != TerrainType.CITY:
+                    continue
+                for coordinate in completed_feature.feature.tiles:
+                    for terrain_type, root, _ in feature_graph.get_tile_segments(coordinate):
+                        if terrain_type == TerrainType.GRASS:
+                            nodes.add(root)
+
+        for node in nodes:
+            if feature_graph.find(node) == node:
+                cls.__set(game_state, node, cls.feature_points(game_state, feature_graph.features[node]), changes)
+            else:
+                cls.__set(game_state, node, None, changes)
+
+        for coordinate in set(game_state.chapel_meeples) | {key for key in game_state.provisional_points
+                                                            if isinstance(key, Coordinate)}:
+            cls.__set(game_state, coordinate, cls.chapel_or_flowers_points(game_state, coordinate), changes)
+
+        return changes
+
+    @staticmethod
+    def undo(game_state: CarcassonneGameState, changes: [(object, Optional[tuple])]):
+        """
+        Restore the provisional points from before update. The projected points per player are restored separately.
+        """
+        for key, value in reversed(changes):
+            if value is None:
+                del game_state.provisional_points[key]
+            else:
+                game_state.provisional_points[key] = value
+
+    @staticmethod
+    def feature_points(game_state: CarcassonneGameState, feature: Feature) -> Optional[tuple]:
+        if not feature.has_meeples():
+            return None
+
+        # A meeple in the center of a tile is scored as chapel or flowers, also when it is a farmer
+        meeples: [[MeeplePosition]] = [
+            [meeple_position for meeple_position in meeple_positions
+             if meeple_position.coordinate_with_side.side != Side.CENTER]
+            for meeple_positions in feature.meeples
+        ]
+        winning_players: (int,) = PointsCollector.get_winning_players(
+            PointsCollector.get_meeple_counts_per_player(meeples)
+        )
+        if len(winning_players) == 0:
+            return None
+
+        if feature.terrain_type == TerrainType.CITY:
+            points = PointsCollector.city_feature_points(feature)
+        elif feature.terrain_type == TerrainType.ROAD:
+            points = PointsCollector.road_feature_points(feature)
+        else:
+            points = PointsCollector.farm_feature_points(game_state, feature, {})
+        return (winning_players, points) if points > 0 else None
+
+    @staticmethod
+    def chapel_or_flowers_points(game_state: CarcassonneGameState, coordinate: Coordinate) -> Optional[tuple]:
+        occupant = game_state.chapel_meeples.get(coordinate)
+        if occupant is None:
+            return None
+        return (occupant[0],), PointsCollector.chapel_or_flowers_points(game_state=game_state, coordinate=coordinate)
+
+    @staticmethod
+    def __set(game_state: CarcassonneGameState, key: object, value: Optional[tuple],
+              changes: [(object, Optional[tuple])]):
+        old_value: Optional[tuple] = game_state.provisional_points.get(key)
+        if old_value == value:
+            return
+
+        changes.append((key, old_value))
+        if old_value is not None:
+            players, points = old_value
+            for player in players:
+                game_state.projected_points[player] -= points
+        if value is None:
+            del game_state.provisional_points[key]
+        else:
+            players, points = value
+            for player in players:
+                game_state.projected_points[player] += points
+            game_state.provisional_points[key] = value
@@ -0,0 +1,24 @@
+from wingedsheep.carcassonne.objects.events.scoring_event import ScoringEvent
+from wingedsheep.carcassonne.objects.events.scoring_event_sink import ScoringEventSink
+
+
+class ScoringEventUtil:
+    """
+    Passes the scoring events of every game to the subscribed sinks. Code that creates events first checks that sinks is
+    not empty, so scoring does not build events when nobody listens.
+    """
+
+    sinks: [ScoringEventSink] = []
+
+    @classmethod
+    def subscribe(cls, sink: ScoringEventSink):
+        cls.sinks.append(sink)
+
+    @classmethod
+    def unsubscribe(cls, sink: ScoringEventSink):
+        cls.sinks.remove(sink)
+
+    @classmethod
+    def emit(cls, event: ScoringEvent):
+        for sink in cls.sinks:
+            sink.emit(event)
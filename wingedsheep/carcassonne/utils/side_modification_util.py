@@ -84,7 +84,7 @@ class SideModificationUtil:
         elif farmer_side == FarmerSide.TLT:
             return FarmerSide.BLB
         elif farmer_side == FarmerSide.TRT:
-            return FarmerSide.BRR
+            return FarmerSide.BRB
         elif farmer_side == FarmerSide.TRR:
             return FarmerSide.TLL
         elif farmer_side == FarmerSide.BRR:
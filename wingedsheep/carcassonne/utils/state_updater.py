@@ -5,11 +5,18 @@ from wingedsheep.carcassonne.objects.actions.action import Action
 from wingedsheep.carcassonne.objects.actions.meeple_action import MeepleAction
 from wingedsheep.carcassonne.objects.actions.pass_action import PassAction
 from wingedsheep.carcassonne.objects.actions.tile_action import TileAction
+from wingedsheep.carcassonne.objects.events.meeple_returned_event import MeepleReturnedEvent
+from wingedsheep.carcassonne.objects.events.points_awarded_event import PointsAwardedEvent
 from wingedsheep.carcassonne.objects.game_phase import GamePhase
 from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
 from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.undo_record import UndoRecord
 from wingedsheep.carcassonne.utils.points_collector import PointsCollector
 from wingedsheep.carcassonne.utils.river_rotation_util import RiverRotationUtil
+from wingedsheep.carcassonne.utils.score_projection_util import ScoreProjectionUtil
+from wingedsheep.carcassonne.utils.scoring_event_util import ScoringEventUtil
+from wingedsheep.carcassonne.utils.zobrist_hash_util import ZobristHashUtil
 
 
 class StateUpdater:
@@ -24,7 +31,7 @@ class StateUpdater:
 
     @staticmethod
     def play_tile(game_state: CarcassonneGameState, tile_action: TileAction) -> CarcassonneGameState:
-        game_state.board[tile_action.coordinate.row][tile_action.coordinate.column] = tile_action.tile
+        game_state.place_tile(coordinate=tile_action.coordinate, tile=tile_action.tile)
         game_state.phase = GamePhase.MEEPLES
         game_state.last_river_rotation = RiverRotationUtil.get_river_rotation(game_state=game_state,
                                                                               tile=tile_action.tile)
@@ -33,14 +40,12 @@ class StateUpdater:
 
     @staticmethod
     def play_meeple(game_state: CarcassonneGameState, meeple_action: MeepleAction) -> CarcassonneGameState:
+        meeple_position: MeeplePosition = MeeplePosition(meeple_type=meeple_action.meeple_type,
+                                                         coordinate_with_side=meeple_action.coordinate_with_side)
         if not meeple_action.remove:
-            game_state.placed_meeples[game_state.current_player].append(
-                MeeplePosition(meeple_type=meeple_action.meeple_type,
-                               coordinate_with_side=meeple_action.coordinate_with_side))
+            game_state.add_meeple(player=game_state.current_player, meeple_position=meeple_position)
         else:
-            game_state.placed_meeples[game_state.current_player].remove(
-                MeeplePosition(meeple_type=meeple_action.meeple_type,
-                               coordinate_with_side=meeple_action.coordinate_with_side))
+            game_state.remove_meeple(player=game_state.current_player, meeple_position=meeple_position)
 
         if meeple_action.meeple_type == MeepleType.NORMAL or meeple_action.meeple_type == MeepleType.FARMER:
             game_state.meeples[game_state.current_player] += 1 if meeple_action.remove else -1
@@ -49,6 +54,11 @@ class StateUpdater:
                 points = PointsCollector.chapel_or_flowers_points(game_state=game_state,
                                                                   coordinate=meeple_action.coordinate_with_side.coordinate)
                 game_state.scores[game_state.current_player] += points
+                if ScoringEventUtil.sinks:
+                    coordinate = meeple_action.coordinate_with_side.coordinate
+                    terrain_type = game_state.board.get(coordinate).get_type(Side.CENTER)
+                    ScoringEventUtil.emit(PointsAwardedEvent(game_state.current_player, points, terrain_type))
+                    ScoringEventUtil.emit(MeepleReturnedEvent(game_state.current_player, meeple_position))
             game_state.abbots[game_state.current_player] += 1 if meeple_action.remove else -1
         elif meeple_action.meeple_type == MeepleType.BIG or meeple_action.meeple_type == MeepleType.BIG_FARMER:
             game_state.big_meeples[game_state.current_player] += 1 if meeple_action.remove else -1
@@ -57,10 +67,7 @@ class StateUpdater:
 
     @staticmethod
     def draw_tile(game_state: CarcassonneGameState) -> CarcassonneGameState:
-        if len(game_state.deck) == 0:
-            game_state.next_tile = None
-        else:
-            game_state.next_tile = game_state.deck.pop(0)
+        game_state.next_tile = game_state.deck.draw()
         return game_state
 
     @staticmethod
@@ -73,25 +80,101 @@ class StateUpdater:
     @classmethod
     def apply_action(cls, game_state: CarcassonneGameState, action: Action) -> CarcassonneGameState:
         new_game_state: CarcassonneGameState = copy.deepcopy(game_state)
+        cls.apply_action_inplace(game_state=new_game_state, action=action)
+        return new_game_state
+
+    @classmethod
+    def apply_action_inplace(cls, game_state: CarcassonneGameState, action: Action) -> UndoRecord:
+        """
+        Apply an action to the given game state without copying it.
+
+        :return: An UndoRecord that can be passed to undo_action to restore the game state
+        """
+        undo_record: UndoRecord = UndoRecord(
+            action=action,
+            phase=game_state.phase,
+            current_player=game_state.current_player,
+            next_tile=game_state.next_tile,
+            deck_size=len(game_state.deck),
+            last_tile_action=game_state.last_tile_action,
+            last_river_rotation=game_state.last_river_rotation,
+            scores=tuple(game_state.scores),
+            meeples=tuple(game_state.meeples),
+            abbots=tuple(game_state.abbots),
+            big_meeples=tuple(game_state.big_meeples),
+            placed_meeples=tuple(map(lambda x: tuple(x), game_state.placed_meeples)),
+            feature_graph_checkpoint=game_state.feature_graph.checkpoint(),
+            zobrist_hash=game_state.zobrist_hash,
+            completed_features=game_state.completed_features,
+            projected_points=tuple(game_state.projected_points)
+        )
+        phase: GamePhase = game_state.phase
+        game_state.zobrist_hash ^= cls.turn_key(game_state)
 
         if isinstance(action, TileAction):
-            cls.play_tile(game_state=new_game_state, tile_action=action)
-            new_game_state.phase = GamePhase.MEEPLES
+            cls.play_tile(game_state=game_state, tile_action=action)
+            game_state.phase = GamePhase.MEEPLES
+            undo_record.coordinate = action.coordinate
         elif isinstance(action, MeepleAction):
-            cls.play_meeple(game_state=new_game_state, meeple_action=action)
+            cls.play_meeple(game_state=game_state, meeple_action=action)
         elif isinstance(action, PassAction):
-            if game_state.phase == GamePhase.TILES:
-                cls.draw_tile(game_state=new_game_state)
-                new_game_state.phase = GamePhase.MEEPLES
-            elif game_state.phase == GamePhase.MEEPLES:
+            if phase == GamePhase.TILES:
+                # No tile is placed, so no features are completed this turn
+                game_state.completed_features = []
+                cls.draw_tile(game_state=game_state)
+                game_state.phase = GamePhase.MEEPLES
+            elif phase == GamePhase.MEEPLES:
                 pass
 
-        if game_state.phase == GamePhase.MEEPLES:
-            cls.remove_meeples_and_update_score(game_state=new_game_state)
-            cls.draw_tile(game_state=new_game_state)
-            cls.next_player(game_state=new_game_state)
+        if phase == GamePhase.MEEPLES:
+            cls.remove_meeples_and_update_score(game_state=game_state)
+            cls.draw_tile(game_state=game_state)
+            cls.next_player(game_state=game_state)
 
-        if new_game_state.is_terminated():
-            PointsCollector.count_final_scores(game_state=new_game_state)
+        if game_state.is_terminated():
+            PointsCollector.count_final_scores(game_state=game_state)
 
-        return new_game_state
+        undo_record.provisional_points_changes = ScoreProjectionUtil.update(
+            game_state=game_state,
+            feature_graph_checkpoint=undo_record.feature_graph_checkpoint,
+            tile_placed=isinstance(action, TileAction)
+        )
+
+        game_state.zobrist_hash ^= cls.turn_key(game_state)
+        game_state.version += 1
+        return undo_record
+
+    @staticmethod
+    def undo_action(game_state: CarcassonneGameState, undo_record: UndoRecord) -> CarcassonneGameState:
+        """
+        Revert the action that produced the given UndoRecord. Actions must be undone in reverse order.
+        """
+        game_state.feature_graph.rollback(undo_record.feature_graph_checkpoint)
+        if undo_record.coordinate is not None:
+            game_state.remove_tile(coordinate=undo_record.coordinate)
+
+        if len(game_state.deck) < undo_record.deck_size:
+            game_state.deck.undo_draw()
+
+        game_state.next_tile = undo_record.next_tile
+        game_state.phase = undo_record.phase
+        game_state.current_player = undo_record.current_player
+        game_state.last_tile_action = undo_record.last_tile_action
+        game_state.last_river_rotation = undo_record.last_river_rotation
+        game_state.scores = list(undo_record.scores)
+        game_state.meeples = list(undo_record.meeples)
+        game_state.abbots = list(undo_record.abbots)
+        game_state.big_meeples = list(undo_record.big_meeples)
+        game_state.set_placed_meeples(list(map(lambda x: list(x), undo_record.placed_meeples)))
+        game_state.zobrist_hash = undo_record.zobrist_hash
+        game_state.completed_features = undo_record.completed_features
+        game_state.projected_points = list(undo_record.projected_points)
+        ScoreProjectionUtil.undo(game_state=game_state, changes=undo_record.provisional_points_changes)
+        game_state.version += 1
+        return game_state
+
+    @staticmethod
+    def turn_key(game_state: CarcassonneGameState) -> int:
+        return ZobristHashUtil.turn_key(current_player=game_state.current_player, phase=game_state.phase,
+                                        next_tile=game_state.next_tile,
+                                        last_river_rotation=game_state.last_river_rotation)
@@ -0,0 +1,52 @@
+import numpy as np
+
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets import tile_catalogue
+from wingedsheep.carcassonne.utils.edge_signature_util import EdgeSignatureUtil
+
+
+class TileCompatibilityUtil:
+    """
+    Tables, built once at import from the edge signatures of the tile catalogue, that say which tiles can lie next to
+    each other. They are indexed by [tile id, neighbour tile id, direction], where direction is the side of the first
+    tile that touches the neighbour (see directions).
+
+    compatible tells whether the terrain on the touching edges is the same. river_connected tells whether a river runs
+    from the tile into the neighbour. The numpy arrays can be used for vectorised queries, for example for all tiles
+    at once, the methods answer single queries.
+    """
+
+    directions = {Side.TOP: 0, Side.RIGHT: 1, Side.BOTTOM: 2, Side.LEFT: 3}
+
+    # The terrain of every edge of every catalogue tile, indexed by [tile id, direction]
+    edges: np.ndarray = (
+        np.array([tile.edge_signature for tile in tile_catalogue.catalogue_tiles])[:, np.newaxis]
+        >> np.array([EdgeSignatureUtil.shifts[side] for side in directions])[np.newaxis, :]
+        & EdgeSignatureUtil.EDGE_MASK
+    ).astype(np.uint8)
+    # The terrain of the edge of the neighbour that touches the tile, indexed by [neighbour tile id, direction]
+    opposite_edges: np.ndarray = np.roll(edges, 2, axis=1)
+
+    compatible: np.ndarray = edges[:, np.newaxis, :] == opposite_edges[np.newaxis, :, :]
+    river_connected: np.ndarray = compatible & (edges[:, np.newaxis, :] == EdgeSignatureUtil.RIVER)
+    compatible.flags.writeable = False
+    river_connected.flags.writeable = False
+
+    # Nested lists of the same tables, indexing them is faster than indexing numpy arrays one element at a time
+    __compatible: [[[bool]]] = compatible.tolist()
+    __river_connected: [[[bool]]] = river_connected.tolist()
+
+    @classmethod
+    def fits_next_to(cls, tile: Tile, neighbour: Tile, side: Side) -> bool:
+        """
+        Whether the neighbour can lie on the given side of the tile
+        """
+        return cls.__compatible[tile.tile_id][neighbour.tile_id][cls.directions[side]]
+
+    @classmethod
+    def river_connects(cls, tile: Tile, neighbour: Tile, side: Side) -> bool:
+        """
+        Whether a river runs from the given side of the tile into the neighbour on that side
+        """
+        return cls.__river_connected[tile.tile_id][neighbour.tile_id][cls.directions[side]]
@@ -1,14 +1,21 @@
-from typing import Set
+from typing import Set, Dict
 
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.objects.rotation import Rotation
 from wingedsheep.carcassonne.objects.side import Side
 from wingedsheep.carcassonne.objects.tile import Tile
+from wingedsheep.carcassonne.tile_sets import tile_catalogue
+from wingedsheep.carcassonne.utils.edge_signature_util import EdgeSignatureUtil
 from wingedsheep.carcassonne.utils.river_rotation_util import RiverRotationUtil
+from wingedsheep.carcassonne.utils.tile_compatibility_util import TileCompatibilityUtil
 
 
 class TileFitter:
 
+    # For every (required, mask) pair of a frontier cell: the tile id of every catalogue tile that fits when turned, with
+    # the number of turns that make it fit. Shared by all games and filled in when a pair is first seen.
+    __fitting_turns: Dict[tuple, Dict[int, tuple]] = {}
+
     @classmethod
     def grass_fits(cls, center: Tile, top: Tile = None, right: Tile = None, bottom: Tile = None,
                    left: Tile = None) -> bool:
@@ -58,32 +65,16 @@ class TileFitter:
         connected_side = None
         unconnected_side = None
 
+        neighbours = {Side.TOP: top, Side.RIGHT: right, Side.BOTTOM: bottom, Side.LEFT: left}
         for side in center.get_river_ends():
-            if side == Side.LEFT and left is not None and left.get_river_ends().__contains__(Side.RIGHT):
-                connected_side = Side.LEFT
-            if side == Side.RIGHT and right is not None and right.get_river_ends().__contains__(Side.LEFT):
-                connected_side = Side.RIGHT
-            if side == Side.TOP and top is not None and top.get_river_ends().__contains__(Side.BOTTOM):
-                connected_side = Side.TOP
-            if side == Side.BOTTOM and bottom is not None and bottom.get_river_ends().__contains__(Side.TOP):
-                connected_side = Side.BOTTOM
-
-            if side == Side.LEFT and left is None:
-                unconnected_side = Side.LEFT
-            if side == Side.RIGHT and right is None:
-                unconnected_side = Side.RIGHT
-            if side == Side.TOP and top is None:
-                unconnected_side = Side.TOP
-            if side == Side.BOTTOM and bottom is None:
-                unconnected_side = Side.BOTTOM
-
-            if side == Side.LEFT and left is not None and not left.get_river_ends().__contains__(Side.RIGHT):
-                return False
-            if side == Side.RIGHT and right is not None and not right.get_river_ends().__contains__(Side.LEFT):
-                return False
-            if side == Side.TOP and top is not None and not top.get_river_ends().__contains__(Side.BOTTOM):
-                return False
-            if side == Side.BOTTOM and bottom is not None and not bottom.get_river_ends().__contains__(Side.TOP):
+            if side not in neighbours:
+                continue
+            neighbour: Tile = neighbours[side]
+            if neighbour is None:
+                unconnected_side = side
+            elif TileCompatibilityUtil.river_connects(center, neighbour, side):
+                connected_side = side
+            else:
                 return False
 
         if connected_side is None:
@@ -104,10 +95,30 @@ class TileFitter:
     @classmethod
     def fits(cls, center: Tile, top: Tile = None, right: Tile = None, bottom: Tile = None, left: Tile = None,
              game_state: CarcassonneGameState = None) -> bool:
-        if top is None and right is None and bottom is None and left is None:
-            return False
+        required, mask = EdgeSignatureUtil.requirements(top=top, right=right, bottom=bottom, left=left)
+        return cls.fits_requirements(center, required, mask) \
+               and (not center.has_river() or cls.rivers_fit(center, top, right, bottom, left, game_state))
+
+    @staticmethod
+    def fits_requirements(center: Tile, required: int, mask: int) -> bool:
+        """
+        Check if the edges of a tile match the required edge signature of a cell, ignoring the river rotation rules.
+        """
+        return mask != 0 and center.edge_signature & mask == required
 
-        return cls.grass_fits(center, top, right, bottom, left) \
-               and cls.cities_fit(center, top, right, bottom, left) \
-               and cls.roads_fit(center, top, right, bottom, left) \
-               and cls.rivers_fit(center, top, right, bottom, left, game_state)
+    @classmethod
+    def fitting_turns(cls, tile: Tile, required: int, mask: int) -> (int, ...):
+        """
+        The numbers of turns (relative to the given tile, in increasing order) for which the edges of the tile match the
+        required edge signature of a cell, ignoring the river rotation rules.
+        """
+        fitting_turns: Dict[int, tuple] = cls.__fitting_turns.get((required, mask))
+        if fitting_turns is None:
+            fitting_turns = {}
+            for catalogue_tile in tile_catalogue.catalogue_tiles:
+                turns = tuple(tile_turns for tile_turns in range(4)
+                              if cls.fits_requirements(catalogue_tile.turn(tile_turns), required, mask))
+                if len(turns) > 0:
+                    fitting_turns[catalogue_tile.tile_id] = turns
+            cls.__fitting_turns[(required, mask)] = fitting_turns
+        return fitting_turns.get(tile.tile_id, ())
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from wingedsheep.carcassonne.carcassonne_game_state import CarcassonneGameState
 from wingedsheep.carcassonne.objects.coordinate import Coordinate
 from wingedsheep.carcassonne.objects.playing_position import PlayingPosition
@@ -7,25 +9,53 @@ from wingedsheep.carcassonne.utils.tile_fitter import TileFitter
 
 class TilePositionFinder:
 
-    @staticmethod
-    def possible_playing_positions(game_state: CarcassonneGameState, tile_to_play: Tile) -> [PlayingPosition]:
+    @classmethod
+    def possible_playing_positions(cls, game_state: CarcassonneGameState, tile_to_play: Tile,
+                                   unique_rotations: bool = True) -> [PlayingPosition]:
+        """
+        The cells and rotations where the tile can be placed. With unique_rotations, rotations of a symmetric tile that
+        lead to the same game (see Tile.get_rotation_period) are only returned once.
+        """
+        return list(cls.iter_playing_positions(game_state, tile_to_play, unique_rotations=unique_rotations))
+
+    @classmethod
+    def iter_playing_positions(cls, game_state: CarcassonneGameState, tile_to_play: Tile,
+                               unique_rotations: bool = True) -> Iterator[PlayingPosition]:
+        """
+        Same as possible_playing_positions, but yields the positions one by one
+        """
         if game_state.empty_board():
-            return [PlayingPosition(coordinate=game_state.starting_position, turns=0)]
-
-        playing_positions = []
-
-        for row_index, board_row in enumerate(game_state.board):
-            for column_index, column_tile in enumerate(board_row):
-                if column_tile is not None:
+            yield PlayingPosition(coordinate=game_state.starting_position, turns=0)
+            return
+
+        rotations: int = tile_to_play.get_rotation_period() if unique_rotations else 4
+        has_river: bool = tile_to_play.has_river()
+
+        coordinate: Coordinate
+        for coordinate in sorted(game_state.frontier, key=lambda x: (x.row, x.column)):
+            required, mask = game_state.frontier[coordinate]
+            for tile_turns in TileFitter.fitting_turns(tile_to_play, required, mask):
+                if tile_turns >= rotations:
+                    break
+                if has_river and not cls.rivers_fit(game_state, coordinate, tile_to_play.turn(tile_turns)):
                     continue
+                yield PlayingPosition(coordinate=coordinate, turns=tile_turns)
 
-                for tile_turns in range(0, 4):
-                    top = game_state.get_tile(row_index - 1, column_index)
-                    bottom = game_state.get_tile(row_index + 1, column_index)
-                    left = game_state.get_tile(row_index, column_index - 1)
-                    right = game_state.get_tile(row_index, column_index + 1)
+    @staticmethod
+    def fits(game_state: CarcassonneGameState, coordinate: Coordinate, tile: Tile) -> bool:
+        """
+        Whether the (already rotated) tile can be placed on the frontier cell
+        """
+        required, mask = game_state.frontier[coordinate]
+        if tile.edge_signature & mask != required:
+            return False
 
-                    if TileFitter.fits(tile_to_play.turn(tile_turns), top=top, bottom=bottom, left=left, right=right, game_state=game_state):
-                        playing_positions.append(PlayingPosition(coordinate=Coordinate(row=row_index, column=column_index), turns=tile_turns))
+        return not tile.has_river() or TilePositionFinder.rivers_fit(game_state, coordinate, tile)
 
-        return playing_positions
+    @staticmethod
+    def rivers_fit(game_state: CarcassonneGameState, coordinate: Coordinate, tile: Tile) -> bool:
+        top = game_state.get_tile(coordinate.row - 1, coordinate.column)
+        bottom = game_state.get_tile(coordinate.row + 1, coordinate.column)
+        left = game_state.get_tile(coordinate.row, coordinate.column - 1)
+        right = game_state.get_tile(coordinate.row, coordinate.column + 1)
+        return TileFitter.rivers_fit(tile, top=top, right=right, bottom=bottom, left=left, game_state=game_state)
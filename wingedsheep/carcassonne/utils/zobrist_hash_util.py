@@ -0,0 +1,66 @@
+from typing import Optional
+
+from wingedsheep.carcassonne.objects.coordinate import Coordinate
+from wingedsheep.carcassonne.objects.game_phase import GamePhase
+from wingedsheep.carcassonne.objects.meeple_position import MeeplePosition
+from wingedsheep.carcassonne.objects.meeple_type import MeepleType
+from wingedsheep.carcassonne.objects.rotation import Rotation
+from wingedsheep.carcassonne.objects.side import Side
+from wingedsheep.carcassonne.objects.tile import Tile
+
+
+class ZobristHashUtil:
+    """
+    64-bit Zobrist keys for the parts of a game state. The hash of a state is the XOR of the keys of its tiles, its
+    meeples and its turn (current player, phase, next tile and river rotation), so it can be updated by XOR-ing keys in
+    and out.
+
+    The board has no edges, so instead of a table of random keys every key is a splitmix64 mix of the values it stands
+    for. Keys are the same in every process.
+    """
+
+    MASK = (1 << 64) - 1
+
+    TILE = 1
+    MEEPLE = 2
+    PLAYER = 3
+    PHASE = 4
+    NEXT_TILE = 5
+    RIVER_ROTATION = 6
+
+    sides = {side: index for index, side in enumerate(Side)}
+    meeple_types = {meeple_type: index for index, meeple_type in enumerate(MeepleType)}
+    phases = {phase: index for index, phase in enumerate(GamePhase)}
+    rotations = {rotation: index for index, rotation in enumerate(Rotation)}
+
+    @classmethod
+    def tile_key(cls, coordinate: Coordinate, tile: Tile) -> int:
+        return cls.__mix(cls.TILE, coordinate.row, coordinate.column, tile.tile_id)
+
+    @classmethod
+    def meeple_key(cls, player: int, meeple_position: MeeplePosition) -> int:
+        coordinate: Coordinate = meeple_position.coordinate_with_side.coordinate
+        return cls.__mix(cls.MEEPLE, player, cls.meeple_types[meeple_position.meeple_type], coordinate.row,
+                         coordinate.column, cls.sides[meeple_position.coordinate_with_side.side])
+
+    @classmethod
+    def turn_key(cls, current_player: int, phase: GamePhase, next_tile: Optional[Tile],
+                 last_river_rotation: Optional[Rotation]) -> int:
+        return cls.__mix(cls.PLAYER, current_player) \
+               ^ cls.__mix(cls.PHASE, cls.phases[phase]) \
+               ^ cls.__mix(cls.NEXT_TILE, -1 if next_tile is None else next_tile.tile_id) \
+               ^ cls.__mix(cls.RIVER_ROTATION, cls.rotations.get(last_river_rotation, -1))
+
+    @classmethod
+    def __mix(cls, *values: int) -> int:
+        key = 0
+        for value in values:
+            key = cls.__splitmix64((key ^ value) & cls.MASK)
+        return key
+
+    @classmethod
+    def __splitmix64(cls, value: int) -> int:
+        value = (value + 0x9E3779B97F4A7C15) & cls.MASK
+        value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & cls.MASK
+        value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & cls.MASK
+        return value ^ (value >> 31)